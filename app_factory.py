@@ -223,6 +223,14 @@ async def lifespan(app: AduibAIApp) -> AsyncIterator[None]:
         except Exception as e:
             log.exception("Failed to ensure admin account")
 
+        # Preload the crawl service api key so web memo requests skip the lookup
+        try:
+            from service.web_memo import WebMemoService
+
+            WebMemoService.get_mcp_api_key_hash()
+        except Exception:
+            log.warning("Crawl service api key not preloaded", exc_info=True)
+
         # Register builtin agents and initialize OrchestrationManager
         try:
 
@@ -14,6 +14,7 @@ class DBConfig(BaseSettings):
     DB_CHARSET: str = Field(default="utf8", description="Database charset")
     DB_EXTRAS: str = Field(default="", description="Database extras")
     POOL_SIZE: int = Field(default=50, description="Database connection pool size")
+    QUERY_CACHE_SIZE: int = Field(default=1200, description="SQLAlchemy compiled statement cache size")
 
     @computed_field
     @property
@@ -6,6 +6,9 @@ class ToolConfig(BaseSettings):
     SKILL_VALIDATE: bool = True
     TOOL_CACHE_ENABLED: bool = True
     TOOL_CACHE_TTL: int = 3600
+    TOOL_MAX_CONCURRENCY: int = 8
+    TOOL_MANAGER_TTL: int = 300
+    TOOL_MANAGER_VERSION_CHECK_INTERVAL: int = 5
     TOOL_CHOICE_LLM_MODEL: str = ""
     TOOL_CHOICE_LLM_PROVIDER: str = ""
     TOOL_CHOICE_SLICE_SIZE: int = 10
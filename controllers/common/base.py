@@ -4,6 +4,7 @@ import traceback
 from functools import wraps
 from typing import Any
 
+import orjson
 from fastapi import HTTPException
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
@@ -82,6 +83,18 @@ def api_ok(data: Any | None = None, status_code: int = 200) -> ApiResponse:
     return api_payload(success=True, data=data, error=None).with_status(status_code)
 
 
+def api_ok_model(data: BaseModel, status_code: int = 200) -> Response:
+    """Build a success response whose data is serialized directly by pydantic-core.
+
+    Skips jsonable_encoder and the envelope's re-validation of ``data``; use for large
+    read-only payloads such as model listings.
+    """
+
+    content = api_ok(status_code=status_code).model_dump(mode="json")
+    content["data"] = orjson.Fragment(data.__pydantic_serializer__.to_json(data, exclude_none=True))
+    return Response(content=orjson.dumps(content), status_code=status_code, media_type="application/json")
+
+
 def api_error(
     *,
     status_code: int,
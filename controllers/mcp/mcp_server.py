@@ -97,6 +97,7 @@ async def init_tools(server_code: str):
 
                 from models import ToolInfo
                 from runtime.tool.mcp.tool_provider import ToolProviderType
+                from runtime.tool.tool_manager import ToolManager
 
                 tools_infos: list[ToolInfo] = []
                 for tool in tools_response.tools:
@@ -122,6 +123,8 @@ async def init_tools(server_code: str):
                     tools_infos.append(tool_info)
                 db.bulk_save_objects(tools_infos)
                 db.commit()
+                # The shared ToolManager caches the MCP tool list; drop it so the next use sees these tools.
+                ToolManager.invalidate()
             return mcp_server
         except Exception as e:
             raise ApiHttpException(
@@ -156,6 +159,7 @@ async def init_servers(server: MCPServerCreate):
 
                 from models import ToolInfo
                 from runtime.tool.mcp.tool_provider import ToolProviderType
+                from runtime.tool.tool_manager import ToolManager
 
                 tools_infos: list[ToolInfo] = []
                 for tool in tools_response.tools:
@@ -181,6 +185,8 @@ async def init_servers(server: MCPServerCreate):
                     tools_infos.append(tool_info)
                 db.bulk_save_objects(tools_infos)
                 db.commit()
+                # The shared ToolManager caches the MCP tool list; drop it so the next use sees these tools.
+                ToolManager.invalidate()
             return db_server
         except Exception as e:
             db.delete(db_server)
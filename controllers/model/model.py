@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from controllers.common.base import ApiHttpException, api_endpoint
+from controllers.common.base import ApiHttpException, api_endpoint, api_ok_model
 from controllers.params import CreateModelRequest, CreateProviderRequest
 from service.model_service import ModelService
 from service.provider_service import ProviderService
@@ -20,6 +20,16 @@ def create_model(req: CreateModelRequest):
     return {"message": "模型创建成功", "model": model}
 
 
+@router.post("/models/batch_add")
+@api_endpoint()
+def create_models(reqs: list[CreateModelRequest]):
+    """
+    批量创建模型，已存在的模型跳过
+    """
+    models = ModelService.create_models(reqs)
+    return {"message": "模型创建成功", "models": models}
+
+
 @router.post("/providers/add")
 @api_endpoint()
 def create_provider(req: CreateProviderRequest):
@@ -43,4 +53,4 @@ def get_models():
     models = ModelService.get_models()
     if not models:
         raise ApiHttpException(status_code=404, code="models_not_found", message="模型未找到")
-    return models
+    return api_ok_model(models)
@@ -3,3 +3,7 @@ from .in_memory_cache import InMemoryCache
 from .llm_client_cache import LLMClientCache
 
 in_memory_llm_clients_cache: LLMClientCache = LLMClientCache()
+# Model/provider config is read on every completion and rarely written; the services flush it on changes
+in_memory_model_cache: InMemoryCache = InMemoryCache(max_size_in_memory=512, default_ttl=60)
+# Api key hashes of internal services (e.g. aduib_mcp_server); the TTL covers keys rotated directly in the database
+in_memory_api_key_cache: InMemoryCache = InMemoryCache(max_size_in_memory=16, default_ttl=300)
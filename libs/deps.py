@@ -1,3 +1,4 @@
+from collections.abc import Generator
 from typing import Annotated
 
 from fastapi import Depends
@@ -7,7 +8,14 @@ from models import get_db
 
 from .context import verify_api_key_in_db, verify_jwt_in_request
 
-SessionDep = Annotated[Session, Depends(get_db)]
+
+def _get_session() -> Generator[Session, None, None]:
+    # get_db is a context manager; handing it to Depends directly would inject the manager, not a session
+    with get_db() as session:
+        yield session
+
+
+SessionDep = Annotated[Session, Depends(_get_session)]
 
 CurrentApiKeyDep = Annotated[None, Depends(verify_api_key_in_db)]
 CurrentUserDep = Annotated[dict, Depends(verify_jwt_in_request)]
@@ -15,7 +15,7 @@ from .base import Base
 from .browser import BrowserHistory
 from .cron_job import CronJob
 from .document import KnowledgeBase, KnowledgeDocument, KnowledgeEmbeddings
-from .engine import engine, get_db
+from .engine import engine, get_db, reuse_db
 from .failure_pattern import FailurePattern
 from .learning_signal import LearningSignal
 from .mcp import McpServer
@@ -88,4 +88,5 @@ __all__ = [
     "UserCustomTag",
     "engine",
     "get_db",
+    "reuse_db",
 ]
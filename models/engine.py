@@ -1,5 +1,6 @@
 from collections.abc import Generator
 from contextlib import contextmanager
+from typing import Optional
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
@@ -14,11 +15,14 @@ engine = create_engine(
     pool_pre_ping=True,  # 每次从池中获取连接前先测试连接是否有效
     pool_timeout=30,  # 从池中获取连接的超时时间（秒）
     echo_pool=False,  # 生产环境关闭连接池日志
+    query_cache_size=config.QUERY_CACHE_SIZE,  # 编译语句缓存，固定结构的查询只编译一次
     connect_args={
         "connect_timeout": 10,  # 数据库连接超时（秒）
     },
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 服务方法提交后常直接返回 ORM 对象：提交后不过期属性，
+# 避免会话关闭后访问时重新 SELECT 或抛 DetachedInstanceError
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
 # Dependency
@@ -42,3 +46,15 @@ def get_db() -> Generator[Session, None, None]:
         raise
     finally:
         session.close()  # 确保会话被关闭
+
+
+@contextmanager
+def reuse_db(session: Optional[Session] = None) -> Generator[Session, None, None]:
+    """
+    复用调用方已持有的会话，由调用方负责其生命周期；未传入时等同于 get_db()。
+    """
+    if session is not None:
+        yield session
+        return
+    with get_db() as new_session:
+        yield new_session
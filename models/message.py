@@ -11,6 +11,8 @@ class ConversationMessage(Base):
     """
 
     __tablename__ = "conversation_message"
+    # INSERT ... RETURNING fills in the server_default columns, so no refresh is needed after commit
+    __mapper_args__ = {"eager_defaults": True}
     # uuid primary key
     id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("uuid_generate_v4()"))
     agent_id = Column(Integer, nullable=True, comment="agent id", index=True)
@@ -11,6 +11,7 @@ from sqlalchemy import (
     UniqueConstraint,
     text,
 )
+from sqlalchemy.orm import relationship
 
 from . import Base
 
@@ -41,6 +42,8 @@ class Model(Base):
     created_at = Column(DateTime, default=datetime.datetime.now(), comment="create time")
     updated_at = Column(DateTime, default=datetime.datetime.now(), comment="update time")
     deleted = Column(Integer, default=0, comment="delete flag")
+    # Only loaded through joinedload; an accidental per-row lazy load (N+1) in a list query raises
+    provider = relationship("Provider", lazy="raise_on_sql")
     __table_args__ = (
         UniqueConstraint("name", "provider_name", name="uq_model_name_provider"),
         ForeignKeyConstraint(["provider_id"], ["provider.id"], name="fk_model_provider_id"),
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from runtime.entities import (
     AnthropicMessageResponse,
     AnthropicStreamEvent,
+    AnthropicToolUseBlock,
     ChatCompletionResponse,
     ChatCompletionResponseChunk,
     LLMResponse,
@@ -70,8 +71,6 @@ class ToolCallAdapter:
                 )
         elif isinstance(response, AnthropicMessageResponse):
             for content in response.content:
-                from runtime.entities import AnthropicToolUseBlock
-
                 if isinstance(content, AnthropicToolUseBlock) and content.type == "tool_use":
                     parsed_calls.append(
                         ParsedToolCall(
@@ -93,6 +92,8 @@ class ToolCallAdapter:
                         )
                     )
 
+        if not parsed_calls:
+            return []
         tool_calls: list[ToolInvokeParams] = []
         for parsed_call in parsed_calls:
             invoke_params = self._build_invoke_params(parsed_call)
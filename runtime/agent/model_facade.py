@@ -15,7 +15,7 @@ class AgentModelFacade:
         session_id: int,
         user_id: str | None,
     ):
-        manager = ModelManager()
+        manager = ModelManager.get_instance()
         model_instance = manager.get_model_instance(model_name=request.model)
         cls._apply_agent_parameters(agent, request, model_instance)
         return await model_instance.invoke_llm(
@@ -13,8 +13,8 @@ class ServerToolExecutor:
         session_id: int,
         user_id: str | None,
     ) -> list[dict[str, object]]:
-        manager = ToolManager()
-        results: list[dict[str, object]] = []
+        manager = ToolManager.get_instance()
+        invocations: list[dict[str, object]] = []
         for call in tool_calls:
             tool_input = dict(call.get("tool_input") or {})
             tool_input.update(
@@ -24,18 +24,21 @@ class ServerToolExecutor:
                     "user_id": user_id,
                 }
             )
-            result = await manager.invoke_tool(
-                tool_name=str(call["tool_name"]),
-                tool_arguments=tool_input,
-                tool_provider=str(call["provider"]),
-                tool_call_id=str(call["tool_use_id"]),
-            )
-            results.append(
+            invocations.append(
                 {
-                    "tool_use_id": str(call["tool_use_id"]),
                     "tool_name": str(call["tool_name"]),
-                    "output": result.to_normal() if result is not None else "",
-                    "is_error": not (result is not None and result.success),
+                    "tool_arguments": tool_input,
+                    "tool_provider": str(call["provider"]),
+                    "tool_call_id": str(call["tool_use_id"]),
                 }
             )
-        return results
+        tool_results = await manager.invoke_tools(invocations)
+        return [
+            {
+                "tool_use_id": str(call["tool_use_id"]),
+                "tool_name": str(call["tool_name"]),
+                "output": result.to_normal() if result is not None else "",
+                "is_error": not (result is not None and result.success),
+            }
+            for call, result in zip(tool_calls, tool_results)
+        ]
@@ -8,7 +8,7 @@ from service.agent.contracts import ToolPermissionView, ToolSchemaView
 class ToolingSchemaService:
     @classmethod
     def get_tools_for_execution(cls, *, agent) -> list[Tool]:
-        manager = ToolManager()
+        manager = ToolManager.get_instance()
         tools: list[Tool] = []
         for item in agent.tools or []:
             tool_name = str(item.get("tool_name") or "").strip()
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 import os
 import platform
@@ -7,6 +6,8 @@ from collections.abc import AsyncGenerator, Sequence
 from datetime import date
 from typing import Any, Optional, Union
 
+import orjson
+
 from component.storage.base_storage import storage_manager
 from models import Agent, get_db
 from runtime.agent.adapters import RequestAdapter, ResponseTextExtractor, ToolCallAdapter
@@ -77,10 +78,10 @@ class AgentManager:
         else:
             raise ValueError("Either agent_id or agent must be provided")
         self.storage = storage_manager
-        self.model_manager = ModelManager()
+        self.model_manager = ModelManager.get_instance()
         self.session_manager = SessionManager()
         self.memory_manager = MemoryManager(self.agent)
-        self.tool_manager = ToolManager()
+        self.tool_manager = ToolManager.get_instance()
         self.tools = self.get_agent_tools(self.agent)
         self.response_generator = ResponseGenerator(self.model_manager, self._build_response_callbacks)
         self.prompt_session_state_store = PromptSessionStateStore()
@@ -299,78 +300,74 @@ class AgentManager:
     async def arun_agent_loop(self, request: LLMRequest, *, ctx: AgentExecutionContext) -> Any:
         max_rounds = ctx.agent.agent_parameters.get("max_tool_rounds", 20)
 
+        # One request copy is carried across rounds; each round appends to its messages.
         current_request = request.model_copy()
 
-        last_response = await self.response_generator.generate_response(
-            self.agent,
-            ctx,
-            current_request,
-        )
-
-        tool_calls: list[ToolInvokeParams] = []
-        buffered_response: Optional[BufferedStreamResponse] = None
-        if current_request.stream:
-            buffered_response = await self.buffer_stream_response(
+        while True:
+            last_response = await self.response_generator.generate_response(
+                self.agent,
                 ctx,
                 current_request,
-                last_response,
             )
-            last_response = self.replay_stream_response(buffered_response.events)
-            tool_calls = buffered_response.tool_calls
-        else:
-            tool_calls = self.convert_response_to_tools(last_response)
-        logger.info(
-            "[OODA] round=%d/%d tool_calls=%d",
-            ctx.ooda_round,
-            max_rounds,
-            len(tool_calls) if tool_calls else 0,
-        )
 
-        if not tool_calls or len(tool_calls) == 0:
-            return last_response
+            tool_calls: list[ToolInvokeParams] = []
+            buffered_response: Optional[BufferedStreamResponse] = None
+            if current_request.stream:
+                buffered_response = await self.buffer_stream_response(
+                    ctx,
+                    current_request,
+                    last_response,
+                )
+                last_response = self.replay_stream_response(buffered_response.events)
+                tool_calls = buffered_response.tool_calls
+            else:
+                tool_calls = self.convert_response_to_tools(last_response)
+            logger.info(
+                "[OODA] round=%d/%d tool_calls=%d",
+                ctx.ooda_round,
+                max_rounds,
+                len(tool_calls) if tool_calls else 0,
+            )
 
-        tool_results: list[ToolInvokeResult] = await self._execute_tool_calls(
-            tool_calls, ctx=ctx, request=current_request, last_response=last_response
-        )
-        self.add_tool_results_to_request(tool_results, current_request)
+            if not tool_calls:
+                return last_response
 
-        next_response = await self.response_generator.generate_response(
-            self.agent,
-            ctx,
-            current_request,
-        )
-        next_buffered_response: Optional[BufferedStreamResponse] = None
-        if current_request.stream:
-            next_buffered_response = await self.buffer_stream_response(
+            tool_results: list[ToolInvokeResult] = await self._execute_tool_calls(
+                tool_calls, ctx=ctx, request=current_request, last_response=last_response
+            )
+            self.add_tool_results_to_request(tool_results, current_request)
+
+            next_response = await self.response_generator.generate_response(
+                self.agent,
                 ctx,
                 current_request,
-                next_response,
-                include_tool_calls=False,
             )
-            last_response = self.replay_stream_response(next_buffered_response.events)
-        else:
-            last_response = next_response
-
-        # Increment round counter before recursive call
-        ctx.ooda_round += 1
+            next_buffered_response: Optional[BufferedStreamResponse] = None
+            if current_request.stream:
+                next_buffered_response = await self.buffer_stream_response(
+                    ctx,
+                    current_request,
+                    next_response,
+                    include_tool_calls=False,
+                )
+                last_response = self.replay_stream_response(next_buffered_response.events)
+            else:
+                last_response = next_response
 
-        # Check if max rounds already reached (for recursive calls)
-        if ctx.ooda_round > max_rounds:
-            logger.warning("[OODA] max rounds %d reached, returning last response", max_rounds)
-            return last_response
+            # Increment round counter before the next round
+            ctx.ooda_round += 1
 
-        if current_request.stream:
-            if next_buffered_response and next_buffered_response.text:
-                self.add_assistant_content_to_request(current_request, next_buffered_response.text)
-        else:
-            self.add_assistant_message_to_request(current_request, last_response)
+            if ctx.ooda_round > max_rounds:
+                logger.warning("[OODA] max rounds %d reached, returning last response", max_rounds)
+                return last_response
 
-        self.add_tools_to_request(current_request)
-
-        # Recursive call with updated counter
-        last_response = await self.arun_agent_loop(current_request, ctx=ctx)
+            if current_request.stream:
+                if next_buffered_response and next_buffered_response.text:
+                    self.add_assistant_content_to_request(current_request, next_buffered_response.text)
+            else:
+                self.add_assistant_message_to_request(current_request, last_response)
 
-        return last_response
+            self.add_tools_to_request(current_request)
 
     async def _execute_tool_calls(
         self,
@@ -382,25 +379,23 @@ class AgentManager:
     ) -> list:
         """Execute native tool_calls from LLM response, return ToolPromptMessage list."""
 
-        results: list[ToolInvokeResult] = []
+        invocations: list[dict[str, Any]] = []
         for call in tool_calls:
-            name: str = call.name
-            args = json.loads(call.arguments)
+            args = orjson.loads(call.arguments)
             args["session_id"] = ctx.session_id
             args["agent_id"] = ctx.agent_id
             args["user_id"] = ctx.user_id
             args["agent_manager"] = self
-            provider_type = call.tool_provider
-
-            result = await self.tool_manager.invoke_tool(
-                tool_name=name,
-                tool_arguments=args,
-                tool_provider=provider_type,
-                tool_call_id=call.tool_call_id,
-                message_id=call.message_id,
+            invocations.append(
+                {
+                    "tool_name": call.name,
+                    "tool_arguments": args,
+                    "tool_provider": call.tool_provider,
+                    "tool_call_id": call.tool_call_id,
+                    "message_id": call.message_id,
+                }
             )
-            results.append(result)
-        return results
+        return await self.tool_manager.invoke_tools(invocations)
 
     def cleanup_memory(self) -> None:
         """Clean up memory for a session"""
@@ -620,30 +615,25 @@ class AgentManager:
             if isinstance(request, ChatCompletionRequest):
                 from runtime.entities import TextPromptMessageContent, ToolPromptMessage
 
+                status_text = f"Tool {tool_result.name} called status: {tool_result.success}"
+                result_text = tool_result.to_normal() if tool_result.success else f"Error: {tool_result.error}"
                 content_list: list[TextPromptMessageContent] = [
-                    TextPromptMessageContent(
-                        text=f"Tool {tool_result.name} called status: {tool_result.success}",
-                    )
+                    TextPromptMessageContent(text=status_text),
+                    TextPromptMessageContent(text=result_text),
                 ]
-                if tool_result.success:
-                    content_list.append(TextPromptMessageContent(text=tool_result.to_normal()))
-                else:
-                    content_list.append(TextPromptMessageContent(text=f"Error: {tool_result.error}"))
                 request.messages.append(ToolPromptMessage(tool_call_id=tool_result.tool_call_id, content=content_list))
 
-                self._schedule_tool_result_memory_write(self.content_to_text(content_list))
+                # Same text content_to_text(content_list) would produce, without re-walking the blocks.
+                self._schedule_tool_result_memory_write(status_text + (result_text or ""))
             elif isinstance(request, AnthropicMessageRequest):
                 from runtime.entities import AnthropicTextBlock, AnthropicToolResultBlock
 
+                status_text = f"Tool {tool_result.name} called status: {tool_result.success}"
+                result_text = tool_result.to_normal() if tool_result.success else f"Error: {tool_result.error}"
                 content_list: list[AnthropicTextBlock] = [
-                    AnthropicTextBlock(
-                        text=f"Tool {tool_result.name} called status: {tool_result.success}",
-                    )
+                    AnthropicTextBlock(text=status_text),
+                    AnthropicTextBlock(text=result_text),
                 ]
-                if tool_result.success:
-                    content_list.append(AnthropicTextBlock(text=tool_result.to_normal()))
-                else:
-                    content_list.append(AnthropicTextBlock(text=f"Error: {tool_result.error}"))
                 request.messages.append(
                     AnthropicMessage(
                         role="assistant",
@@ -657,7 +647,7 @@ class AgentManager:
                     )
                 )
 
-                self._schedule_tool_result_memory_write(self.content_to_text(content_list))
+                self._schedule_tool_result_memory_write(status_text + (result_text or ""))
             elif isinstance(request, ResponseRequest):
                 from runtime.entities import ResponseInputItem, ResponseOutputFunctionCallOutput
 
@@ -33,6 +33,10 @@ MAX_AUDIO_SIZE_BYTES = 100 * 1024 * 1024
 
 DEFAULT_TTS_MODEL = "tts-1"
 
+# All handlers share one cached client so keep-alive connections to a provider host are reused
+# across endpoints (chat, embeddings, rerank, ...) instead of each API path opening its own pool.
+_SHARED_CLIENT_KEY = "llm_http_handler"
+
 
 class LLMHttpHandler:
     """
@@ -41,7 +45,7 @@ class LLMHttpHandler:
 
     def __init__(self, api_path: str, credentials: dict, stream: bool) -> None:
         self.credentials = credentials
-        self.httpx_client = get_async_httpx_client(llm_provider=api_path)
+        self.httpx_client = get_async_httpx_client(llm_provider=_SHARED_CLIENT_KEY)
         api_base = credentials["api_base"]
         api_base = api_base.removesuffix("/")
         api_base = api_base.removesuffix("/v1")
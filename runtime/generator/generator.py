@@ -44,6 +44,14 @@ from runtime.tool.base.tool import Tool
 
 logger = logging.getLogger(__name__)
 
+# The tool-choice prompts are filled for every tool slice, so they are split once around their
+# fields and concatenated rather than re-parsed by str.format. TOOL_CHiOCE_PROMPT also contains
+# literal "{tool_name}" examples that str.format would reject.
+_TOOL_SELECTION_HEAD, _TOOL_SELECTION_MIDDLE, _TOOL_SELECTION_TAIL = re.split(
+    r"\{user_request\}|\{tools\}", TOOL_SELECTION_PROMPT
+)
+_TOOL_CHOICE_HEAD, _TOOL_CHOICE_TAIL = TOOL_CHiOCE_PROMPT.split("{_tools}")
+
 
 class LLMGenerator:
     @classmethod
@@ -73,7 +81,7 @@ class LLMGenerator:
             query = query[:300] + "...[TRUNCATED]..." + query[-300:]
         query = query.replace("\n", " ")
         prompt += query + "\n"
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -96,7 +104,7 @@ class LLMGenerator:
             query = query[:300] + "...[TRUNCATED]..." + query[-300:]
         query = query.replace("\n", " ")
         # prompt += query + "\n"
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -120,7 +128,7 @@ class LLMGenerator:
         full_message: str,
         model_name: Optional[str] = None,
     ) -> str:
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         if model_name:
             model_instance = model_manager.get_model_instance(model_name=model_name)
         else:
@@ -153,7 +161,7 @@ class LLMGenerator:
     def generate_qa_document(cls, query: str, document_language: str):
         prompt = GENERATOR_QA_PROMPT.format(language=document_language)
 
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -194,7 +202,7 @@ class LLMGenerator:
 
     @classmethod
     def generate_structured_output(cls, instruction: str):
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -243,7 +251,7 @@ class LLMGenerator:
 
     @classmethod
     def generate_triples(cls, query: str):
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -283,7 +291,7 @@ class LLMGenerator:
                 )
             context = json.dumps(contexts, ensure_ascii=False, indent=2)
         prompt = ANSWER_INSTRUCTION_FROM_KNOWLEDGE.format(context=context, question=question)
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -300,7 +308,7 @@ class LLMGenerator:
 
     @classmethod
     def choice_tool_invoke(cls, tools: list[Tool], query: str) -> dict:
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -314,7 +322,7 @@ class LLMGenerator:
             + "</arguments>\n</tool>\n"
             for tool in tools
         )
-        formatted_prompt = TOOL_CHiOCE_PROMPT.format(_tools=_tools)
+        formatted_prompt = _TOOL_CHOICE_HEAD + _tools + _TOOL_CHOICE_TAIL
         prompt_messages = [
             SystemPromptMessage(role=PromptMessageRole.SYSTEM, content=formatted_prompt),
             UserPromptMessage(role=PromptMessageRole.USER, content=query),
@@ -349,7 +357,7 @@ class LLMGenerator:
 
     @classmethod
     def generate_content(cls, prompt: str, temperature: float = 0.7) -> str:
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -369,7 +377,7 @@ class LLMGenerator:
     @classmethod
     def generate_doc_research(cls, raw_content: str) -> str:
         prompt = BLOG_RESEARCH_PROMPT.format(raw_content=raw_content)
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -387,7 +395,7 @@ class LLMGenerator:
     @classmethod
     def generate_blog_transform(cls, raw_content: str) -> str:
         prompt = BLOG_TRANSFORM_PROMPT.format(raw_content=raw_content)
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -408,7 +416,7 @@ class LLMGenerator:
 
         model_list = config.grade_model_list
         system_prompt = TASK_GRADE_PROMPT.replace("{model_list}", json.dumps(model_list, ensure_ascii=False, indent=2))
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -430,7 +438,7 @@ class LLMGenerator:
     @classmethod
     def generate_tags(cls, prompt: str) -> list[str]:
         system_prompt = TAG_STRUCTURED_OUTPUT_PROMPT
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -480,7 +488,7 @@ class LLMGenerator:
             existing_content=existing_content.strip() or "N/A",
             segments=segments_text or "- (none)",
         )
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -513,7 +521,7 @@ class LLMGenerator:
         Returns:
             {"type": str, "domain": str}，解析失败时返回默认值。
         """
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -534,7 +542,7 @@ class LLMGenerator:
 
     @classmethod
     def generate_memory_type(cls, content: str) -> str:
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -554,7 +562,7 @@ class LLMGenerator:
 
     @classmethod
     def generate_memory_domain(cls, content: str) -> str:
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -574,7 +582,7 @@ class LLMGenerator:
 
     @classmethod
     def generate_memory_topic(cls, content: str, json_schema: str) -> str:
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -596,7 +604,7 @@ class LLMGenerator:
     @classmethod
     def plan_memory_react_action(cls, context: str, state: dict[str, Any]) -> dict[str, Any]:
         """为记忆检索 ReAct loop 规划下一步动作。"""
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(model_type=ModelType.LLM.to_model_type())
         prompt_messages = [
             SystemPromptMessage(role=PromptMessageRole.SYSTEM, content=MEMORY_REACT_PLANNER_PROMPT),
@@ -675,7 +683,7 @@ class LLMGenerator:
             return []
         candidates_text = json.dumps(candidates, ensure_ascii=False, indent=2)
         user_content = f"Context:\n{context}\n\nCandidates:\n{candidates_text}"
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(model_type=ModelType.LLM.to_model_type())
         prompt_messages = [
             SystemPromptMessage(role=PromptMessageRole.SYSTEM, content=MEMORY_RELEVANCE_JUDGE_PROMPT),
@@ -700,7 +708,7 @@ class LLMGenerator:
 
     @classmethod
     def generate_memory_tags(cls, content: str) -> str:
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(
             model_type=ModelType.LLM.to_model_type(),
         )
@@ -736,7 +744,7 @@ class LLMGenerator:
             topic_b=topic_b,
             samples_b=samples_b_text,
         )
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(model_type=ModelType.LLM.to_model_type())
         prompt_messages = [
             UserPromptMessage(role=PromptMessageRole.USER, content=prompt),
@@ -767,7 +775,7 @@ class LLMGenerator:
             解析成功时返回参数 dict（含 reasoning），失败时返回空 dict。
         """
         user_content = json.dumps(stats, ensure_ascii=False, indent=2)
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(model_type=ModelType.LLM.to_model_type())
         prompt_messages = [
             SystemPromptMessage(role=PromptMessageRole.SYSTEM, content=LEARNING_PARAM_OPTIMIZE_PROMPT),
@@ -800,7 +808,7 @@ class LLMGenerator:
             topic=topic,
             episodic_memories=memories_text,
         )
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_default_model_instance(model_type=ModelType.LLM.to_model_type())
         prompt_messages = [
             UserPromptMessage(role=PromptMessageRole.USER, content=prompt),
@@ -830,10 +838,10 @@ class LLMGenerator:
         """
         if not tool_schemas:
             return []
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_tool_choice_model()
         tools_json = json.dumps(tool_schemas, ensure_ascii=False, indent=2)
-        prompt = TOOL_SELECTION_PROMPT.format(user_request=query, tools=tools_json)
+        prompt = _TOOL_SELECTION_HEAD + query + _TOOL_SELECTION_MIDDLE + tools_json + _TOOL_SELECTION_TAIL
         prompt_messages = [
             UserPromptMessage(role=PromptMessageRole.USER, content=prompt),
         ]
@@ -136,6 +136,7 @@ class McpClient:
             )
             async with stdio_client(server_params) as (read, write, _):
                 async with ClientSession(read, write) as session:
+                    await session.initialize()
                     yield session
 
         else:
@@ -21,8 +21,9 @@ PLANNER_TOOL_TO_BUILTIN = {
 
 
 class PlannerToolExecutor:
-    def __init__(self) -> None:
-        self.tool_manager = ToolManager.__new__(ToolManager)
+    @property
+    def tool_manager(self) -> ToolManager:
+        return ToolManager.get_instance()
 
     async def execute(self, request: PlannerToolRequest, *, message_id: str | None = None) -> PlannerToolUseResult:
         builtin_tool_name = PLANNER_TOOL_TO_BUILTIN.get(request.tool)
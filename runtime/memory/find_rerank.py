@@ -33,7 +33,7 @@ class MemoryFindReranker:
     def _to_rerank_request(cls, query: str, candidates: list[FindCandidate], top_k: int) -> RerankRequest:
         model_name = None
         if config.rerank_method != RerankMode.WEIGHTED_SCORE:
-            model_instance = ModelManager().get_default_model_instance(ModelType.RERANKER.to_model_type())
+            model_instance = ModelManager.get_instance().get_default_model_instance(ModelType.RERANKER.to_model_type())
             model_name = model_instance.model if model_instance else None
         return RerankRequest(
             model=model_name,
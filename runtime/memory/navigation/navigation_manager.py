@@ -158,7 +158,7 @@ class NavigationManager:
     @staticmethod
     def _invoke_navigation_model(*, messages: list, user: str | None) -> str:
         try:
-            model_manager = ModelManager()
+            model_manager = ModelManager.get_instance()
             model_instance = model_manager.get_planner_model_instance() or model_manager.get_default_model_instance(
                 "llm"
             )
@@ -99,7 +99,7 @@ class CandidateDiscoveryLoop:
         roots: list[str],
     ) -> str:
         try:
-            model_manager = ModelManager()
+            model_manager = ModelManager.get_instance()
             model_instance = model_manager.get_planner_model_instance() or model_manager.get_default_model_instance(
                 "llm"
             )
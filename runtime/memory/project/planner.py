@@ -25,7 +25,7 @@ class ProjectPlanner:
     @staticmethod
     def _invoke_project_model(*, messages: list) -> str:
         try:
-            model_manager = ModelManager()
+            model_manager = ModelManager.get_instance()
             model_instance = model_manager.get_planner_model_instance() or model_manager.get_default_model_instance(
                 "llm"
             )
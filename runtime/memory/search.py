@@ -147,7 +147,7 @@ class MemorySearchRuntime:
         include_types: list[str],
         top_k: int,
     ) -> SearchPlan:
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_planner_model_instance() or model_manager.get_default_model_instance("llm")
         if model_instance is None:
             raise RuntimeError("memory search planner model unavailable")
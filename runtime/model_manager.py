@@ -1,9 +1,11 @@
 import json
 import logging
 from collections.abc import Callable, Iterable
+from functools import lru_cache
 from typing import IO, Any, Optional, cast
 
-from models import Model, Provider
+from libs.cache import in_memory_model_cache
+from models import Model, Provider, get_db
 
 from .callbacks.base_callback import Callback
 from .entities.embedding_type import EmbeddingInputType
@@ -248,20 +250,19 @@ class ModelManager:
     def __init__(self):
         self.provider = ProviderManager()
 
+    @classmethod
+    @lru_cache(maxsize=1)
+    def get_instance(cls) -> "ModelManager":
+        """
+        Get the process-wide ModelManager; it holds no per-request state
+        """
+        return cls()
+
     def get_model_instance(
         self,
         model_name: str,
     ) -> Optional[ModelInstance]:
-        from service import ModelService, ProviderService
-
-        provider_name = model_name.split("/")[1]
-        if provider_name:
-            model: Model = ModelService.get_model_by_provider(model_name, provider_name)
-        else:
-            logger.warning("Provider name not found in model name '%s', falling back to get_model", model_name)
-            model: Model = ModelService.get_model(model_name)
-        provider: Provider = ProviderService.get_provider(model.provider_name)
-        model_list: list[AIModelEntity] = ModelService.get_ai_models(provider.name)
+        model, provider, model_list = self._get_model_records(model_name)
         provider_entity = self.provider.get_provider_entity(provider, model_list)
         model_params = json.loads(model.model_params)
         if "max_tokens" not in model_params:
@@ -275,19 +276,60 @@ class ModelManager:
         return instance
 
     def get_default_model_instance(self, model_type: str):
-        from service import ModelService, ProviderService
-
-        model: Model = ModelService.get_default_model(model_type)
-        if not model:
-            return None
-        provider: Provider = ProviderService.get_provider(model.provider_name)
-        model_list: list[AIModelEntity] = ModelService.get_ai_models(provider.name)
+        model, provider, model_list = self._get_default_model_records(model_type)
         provider_entity = self.provider.get_provider_entity(provider, model_list)
         model_instance = self.provider.provider_factory.get_model_type_instance(
             provider_entity, json.loads(model.model_params), ModelType.value_of(model.type)
         )
         return ModelInstance(provider_entity, model_instance, model.name)
 
+    @staticmethod
+    def _get_model_records(model_name: str) -> tuple[Model, Provider, list[AIModelEntity]]:
+        """
+        Get the model row, its provider row and the provider's models, cached by model name
+        """
+        from service import ModelService, ProviderService
+
+        cache_key = f"model:{model_name}"
+        records = in_memory_model_cache.get_cache(cache_key)
+        if records:
+            return records
+
+        provider_name = model_name.split("/")[1]
+        # Model, provider and its model list are read in one session, holding a single pooled connection
+        with get_db() as session:
+            if provider_name:
+                model: Model = ModelService.get_model_by_provider(model_name, provider_name, session=session)
+            else:
+                logger.warning("Provider name not found in model name '%s', falling back to get_model", model_name)
+                model: Model = ModelService.get_model(model_name, session=session)
+            # The provider comes with the model; older rows without provider_id fall back to a lookup by name
+            provider: Provider = model.provider or ProviderService.get_provider(model.provider_name, session=session)
+            model_list: list[AIModelEntity] = ModelService.get_ai_models(provider.name, session=session)
+        records = (model, provider, model_list)
+        in_memory_model_cache.set_cache(cache_key, records)
+        return records
+
+    @staticmethod
+    def _get_default_model_records(model_type: str) -> tuple[Model, Provider, list[AIModelEntity]]:
+        """
+        Get the default model row of a type, its provider row and the provider's models, cached by model type
+        """
+        from service import ModelService, ProviderService
+
+        cache_key = f"default_model:{model_type}"
+        records = in_memory_model_cache.get_cache(cache_key)
+        if records:
+            return records
+
+        with get_db() as session:
+            model: Model = ModelService.get_default_model(model_type, session=session)
+            provider: Provider = model.provider or ProviderService.get_provider(model.provider_name, session=session)
+            model_list: list[AIModelEntity] = ModelService.get_ai_models(provider.name, session=session)
+        records = (model, provider, model_list)
+        in_memory_model_cache.set_cache(cache_key, records)
+        return records
+
     def get_planner_model_instance(self) -> Optional[ModelInstance]:
         from configs import config
 
@@ -1,6 +1,9 @@
 import base64
 import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import Any
 
 import numpy as np
@@ -16,6 +19,36 @@ from runtime.rag.embeddings.embeddings import Embeddings
 
 logger = logging.getLogger(__name__)
 
+# Process-local LRU in front of Redis: retrieval embeds the same query for the vector search and again
+# for cosine reranking, and popular queries repeat across requests. Vectors are kept as ndarrays
+# (8 bytes/dim) rather than lists of Python floats to keep the footprint bounded. Entries expire
+# with the same TTL as the Redis copy, so a changed or redeployed model stops serving old vectors.
+_QUERY_EMBEDDING_CACHE_SIZE = 1024
+_QUERY_EMBEDDING_TTL = 600
+_query_embedding_cache: OrderedDict[str, tuple[float, np.ndarray]] = OrderedDict()
+_query_embedding_cache_lock = threading.Lock()
+
+
+def _get_cached_query_embedding(key: str) -> list[float] | None:
+    with _query_embedding_cache_lock:
+        entry = _query_embedding_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, vector = entry
+        if expires_at <= time.monotonic():
+            del _query_embedding_cache[key]
+            return None
+        _query_embedding_cache.move_to_end(key)
+    return vector.tolist()
+
+
+def _cache_query_embedding(key: str, vector: np.ndarray) -> None:
+    with _query_embedding_cache_lock:
+        _query_embedding_cache[key] = (time.monotonic() + _QUERY_EMBEDDING_TTL, vector)
+        _query_embedding_cache.move_to_end(key)
+        if len(_query_embedding_cache) > _QUERY_EMBEDDING_CACHE_SIZE:
+            _query_embedding_cache.popitem(last=False)
+
 
 class CacheEmbeddings(Embeddings):
     def __init__(self, model_instance: ModelInstance):
@@ -66,11 +99,15 @@ class CacheEmbeddings(Embeddings):
         # use doc embedding cache or store if not exists
         hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
         embedding_cache_key = f"{self._model_instance.provider}_{self._model_instance.model}_{hash}"
+        cached_embedding = _get_cached_query_embedding(embedding_cache_key)
+        if cached_embedding is not None:
+            return cached_embedding
         embedding = redis_client.get(embedding_cache_key)
         if embedding:
-            redis_client.expire(embedding_cache_key, 600)
+            redis_client.expire(embedding_cache_key, _QUERY_EMBEDDING_TTL)
             decoded_embedding = np.frombuffer(base64.b64decode(embedding), dtype="float")
-            return [float(x) for x in decoded_embedding]
+            _cache_query_embedding(embedding_cache_key, decoded_embedding)
+            return decoded_embedding.tolist()
         try:
             embedding_result = self._model_instance.invoke_text_embedding(
                 texts=EmbeddingRequest(input=[text], model=self._model_instance.model),
@@ -90,12 +127,13 @@ class CacheEmbeddings(Embeddings):
         try:
             # encode embedding to base64
             embedding_vector = np.array(embedding_results)
+            _cache_query_embedding(embedding_cache_key, embedding_vector)
             vector_bytes = embedding_vector.tobytes()
             # Transform to Base64
             encoded_vector = base64.b64encode(vector_bytes)
             # Transform to string
             encoded_str = encoded_vector.decode("utf-8")
-            redis_client.setex(embedding_cache_key, 600, encoded_str)
+            redis_client.setex(embedding_cache_key, _QUERY_EMBEDDING_TTL, encoded_str)
         except Exception as ex:
             if config.DEBUG:
                 logger.exception(
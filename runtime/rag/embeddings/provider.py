@@ -16,7 +16,7 @@ class DefaultEmbeddingProvider(EmbeddingProvider):
     cache_embeddings_cls: Any = None
 
     def __init__(self, model_name: str | None = None):
-        model_manager = self._get_model_manager_cls()()
+        model_manager = self._get_model_manager_cls().get_instance()
         if model_name:
             embedding_model = model_manager.get_model_instance(model_name=model_name)
         else:
@@ -152,7 +152,7 @@ class CosineWeightRerankRunner(BaseRerankRunner):
         """
         query_vector_scores = []
 
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
 
         embedding_model = model_manager.get_model_instance(
             model_name=self.weights.embedding_model_name, provider_name=self.weights.embedding_provider_name
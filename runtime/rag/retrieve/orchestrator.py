@@ -3,7 +3,7 @@ from __future__ import annotations
 import concurrent.futures
 import logging
 from concurrent.futures import ThreadPoolExecutor
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from runtime.entities.document_entities import Document
 from runtime.rag.retrieve.methods import RetrievalMethod
@@ -17,7 +17,9 @@ logger = logging.getLogger(__name__)
 
 
 class RetrievalService:
-    # Cache precompiled regular expressions to avoid repeated compilation
+    # Knowledge-base lookup statement, built on first use (models are imported lazily)
+    _knowledge_base_stmt: Any = None
+
     @classmethod
     def retrieve(
         cls,
@@ -40,6 +42,7 @@ class RetrievalService:
 
         all_documents: list[Document] = []
         exceptions: list[str] = []
+        escaped_query = cls.escape_query_for_search(query)
 
         # Optimize multithreading with thread pools
         with ThreadPoolExecutor(thread_name_prefix="Retrieval") as executor:  # type: ignore
@@ -48,7 +51,7 @@ class RetrievalService:
                 executor.submit(
                     cls.keyword_search,
                     knowledge_base=knowledge_base,
-                    query=query,
+                    query=escaped_query,
                     top_k=top_k,
                     all_documents=all_documents,
                     exceptions=exceptions,
@@ -69,7 +72,7 @@ class RetrievalService:
                 futures.append(executor.submit(
                     cls.full_text_index_search,
                     knowledge_base=knowledge_base,
-                    query=query,
+                    query=escaped_query,
                     top_k=top_k,
                     score_threshold=score_threshold,
                     reranking_model=reranking_model,
@@ -82,6 +85,7 @@ class RetrievalService:
         if exceptions:
             raise ValueError(";\n".join(exceptions))
 
+        all_documents = cls._deduplicate_documents(all_documents)
         data_post_processor = RerankProcessor(reranking_mode, reranking_model, weights)
         all_documents = data_post_processor.invoke(
             query=query,
@@ -92,16 +96,40 @@ class RetrievalService:
 
         return all_documents
 
+    @staticmethod
+    def _deduplicate_documents(documents: list[Document]) -> list[Document]:
+        """Collapse chunks returned by several search paths, keeping the best-scored copy of each."""
+        unique: dict[str, Document] = {}
+        for document in documents:
+            metadata = document.metadata or {}
+            key = metadata.get("doc_id") or document.content
+            existing = unique.get(key)
+            if existing is None or (metadata.get("score") or 0.0) > ((existing.metadata or {}).get("score") or 0.0):
+                unique[key] = document
+        return list(unique.values())
+
     @classmethod
     def _get_knowledge_base(cls, knowledge_base_id: str) -> Optional[KnowledgeBase]:
-        from models import KnowledgeBase, get_db
+        from models import get_db
 
         with get_db() as session:
-            return session.query(KnowledgeBase).where(KnowledgeBase.id == knowledge_base_id).first()
+            return session.execute(
+                cls._get_knowledge_base_stmt(), {"knowledge_base_id": knowledge_base_id}
+            ).scalar_one_or_none()
+
+    @classmethod
+    def _get_knowledge_base_stmt(cls):
+        if cls._knowledge_base_stmt is None:
+            from sqlalchemy import bindparam, select
+
+            from models import KnowledgeBase
+
+            cls._knowledge_base_stmt = select(KnowledgeBase).where(KnowledgeBase.id == bindparam("knowledge_base_id"))
+        return cls._knowledge_base_stmt
 
     @staticmethod
     def _build_vector_retriever(knowledge_base: KnowledgeBase) -> KnowledgeVectorRetriever:
-        return KnowledgeVectorRetriever(knowledge_base)
+        return KnowledgeVectorRetriever.for_knowledge(knowledge_base)
 
     @classmethod
     def keyword_search(
@@ -112,6 +140,7 @@ class RetrievalService:
         all_documents: list,
         exceptions: list,
     ):
+        """``query`` is expected to be pre-escaped with :meth:`escape_query_for_search`."""
         try:
             if not knowledge_base:
                 raise ValueError("knowledge not found")
@@ -120,7 +149,7 @@ class RetrievalService:
 
             keyword = Keyword(knowledge=knowledge_base)
 
-            documents = keyword.search(cls.escape_query_for_search(query), max_keywords_per_chunk=top_k)
+            documents = keyword.search(query, max_keywords_per_chunk=top_k)
             all_documents.extend(documents)
             logger.debug("%Keyword search found {len(documents)} documents.")
         except Exception as e:
@@ -167,13 +196,14 @@ class RetrievalService:
         exceptions: list,
         **kwargs
     ):
+        """``query`` is expected to be pre-escaped with :meth:`escape_query_for_search`."""
         try:
             if not knowledge_base:
                 raise ValueError("knowledge not found")
 
             retriever = cls._build_vector_retriever(knowledge_base)
             documents = retriever.search_by_full_text(
-                cls.escape_query_for_search(query),
+                query,
                 top_k=top_k,
                 score_threshold=score_threshold,
                 **kwargs,
@@ -186,4 +216,6 @@ class RetrievalService:
 
     @staticmethod
     def escape_query_for_search(query: str) -> str:
+        if '"' not in query:
+            return query
         return query.replace('"', '\\"')
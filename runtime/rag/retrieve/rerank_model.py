@@ -86,7 +86,7 @@ class RankerModelRunner(BaseRerankRunner):
     def _get_rerank_model_instance(self, reranking_model: Optional[dict]) -> ModelInstance | None:
         if reranking_model:
             try:
-                model_manager = ModelManager()
+                model_manager = ModelManager.get_instance()
                 reranking_provider_name = reranking_model.get("reranking_provider_name")
                 reranking_model_name = reranking_model.get("reranking_model_name")
                 if not reranking_provider_name or not reranking_model_name:
@@ -1,19 +1,31 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import threading
+from typing import Any
+
+from sqlalchemy import event
 
 from component.vdb.vector_store_factory import get_vector_store_factory
 from configs import config
+from libs.cache import in_memory_model_cache
+from models import KnowledgeBase
 from runtime.rag.embeddings import DefaultEmbeddingProvider
 from runtime.rag.vector_specs import build_vector_store_spec
 
-if TYPE_CHECKING:
-    from models import KnowledgeBase
-
 
 class KnowledgeVectorRetriever:
     """Small retrieval adapter that assembles embedding + vector store for a knowledge base."""
 
+    # Built retrievers are shared per knowledge base; building one resolves the embedding model,
+    # probes the embedding dimension and opens a vector store client.
+    # They live in in_memory_model_cache, so they expire with its TTL and go with the model/provider flushes.
+    _CACHE_KEY_PREFIX = "vector_retriever"
+    # Locks are only kept for keys with a build in flight.
+    _build_locks: dict[str, threading.Lock] = {}
+    _build_locks_guard = threading.Lock()
+    # Bumped by every invalidation; a build that overlapped one is returned but not cached.
+    _generation = 0
+
     def __init__(self, knowledge: KnowledgeBase):
         self._knowledge = knowledge
         self._embedding_provider = DefaultEmbeddingProvider.from_knowledge(knowledge)
@@ -24,6 +36,42 @@ class KnowledgeVectorRetriever:
             embedding_provider=self._embedding_provider,
         )
 
+    @classmethod
+    def for_knowledge(cls, knowledge: KnowledgeBase) -> KnowledgeVectorRetriever:
+        """Return the shared retriever for ``knowledge``, building it at most once across threads."""
+        key = cls._cache_key(str(knowledge.id))
+        retriever = in_memory_model_cache.get_cache(key)
+        if retriever is not None:
+            return retriever
+
+        with cls._build_locks_guard:
+            build_lock = cls._build_locks.setdefault(key, threading.Lock())
+        try:
+            with build_lock:
+                retriever = in_memory_model_cache.get_cache(key)
+                if retriever is None:
+                    generation = cls._generation
+                    retriever = cls(knowledge)
+                    with cls._build_locks_guard:
+                        if generation == cls._generation:
+                            in_memory_model_cache.set_cache(key, retriever)
+        finally:
+            with cls._build_locks_guard:
+                if cls._build_locks.get(key) is build_lock:
+                    del cls._build_locks[key]
+        return retriever
+
+    @classmethod
+    def invalidate(cls, knowledge_id: str) -> None:
+        """Drop the cached retriever of a knowledge base so the next lookup rebuilds it."""
+        with cls._build_locks_guard:
+            cls._generation += 1
+            in_memory_model_cache.delete_cache(cls._cache_key(knowledge_id))
+
+    @classmethod
+    def _cache_key(cls, knowledge_id: str) -> str:
+        return f"{cls._CACHE_KEY_PREFIX}:{knowledge_id}"
+
     def search_by_vector(
         self,
         query: str,
@@ -54,3 +102,10 @@ class KnowledgeVectorRetriever:
             score_threshold=score_threshold,
             **kwargs,
         )
+
+
+@event.listens_for(KnowledgeBase, "after_update")
+@event.listens_for(KnowledgeBase, "after_delete")
+def _invalidate_vector_retriever(mapper, connection, target) -> None:
+    # Only this process sees the write; other processes pick it up when the cache TTL expires.
+    KnowledgeVectorRetriever.invalidate(str(target.id))
@@ -1,6 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Sequence
+from typing import Optional
 
 from runtime.entities.document_entities import BaseDocumentTransformer, Document
 
@@ -10,10 +11,17 @@ logger = logging.getLogger(__name__)
 class BaseTextSplitter(BaseDocumentTransformer, ABC):
     """Base class for splitter."""
 
-    def __init__(self, chunk_size: int = 500, chunk_overlap: int = 50):
+    def __init__(
+        self,
+        chunk_size: int = 500,
+        chunk_overlap: int = 50,
+        length_function: Optional[Callable[[list[str]], list[int]]] = None,
+    ):
         self._chunk_size = chunk_size
         self._chunk_overlap = chunk_overlap
-        self._length_function: Callable[[list[str]], list[int]] = lambda x: [len(x) for x in x]
+        self._length_function: Callable[[list[str]], list[int]] = length_function or (
+            lambda texts: [len(text) for text in texts]
+        )
 
     @abstractmethod
     def split_text(self, text: str) -> list[str]:
@@ -28,3 +36,35 @@ class BaseTextSplitter(BaseDocumentTransformer, ABC):
     def transform_document(self, documents: Sequence[Document], **kwargs) -> Sequence[Document]:
         """Transform a document list before storing it in a vector database."""
         return self.split_documents(list(documents))
+
+    def _merge_splits(self, splits: list[str], lengths: list[int]) -> list[str]:
+        """Greedily pack pre-measured splits into chunks of at most ``chunk_size``.
+
+        ``lengths[i]`` is the length of ``splits[i]``; splits carry their own separators,
+        so chunks are joined with ``""`` and consecutive chunks share up to
+        ``chunk_overlap`` worth of trailing splits.
+        """
+        chunks: list[str] = []
+        current: list[str] = []
+        current_lengths: list[int] = []
+        total = 0
+        for split, length in zip(splits, lengths):
+            if total + length > self._chunk_size:
+                if total > self._chunk_size:
+                    logger.warning(
+                        "Created a chunk of size %d, which is longer than the specified %d", total, self._chunk_size
+                    )
+                if current:
+                    chunk = "".join(current).strip()
+                    if chunk:
+                        chunks.append(chunk)
+                    while total > self._chunk_overlap or (total + length > self._chunk_size and total > 0):
+                        total -= current_lengths.pop(0)
+                        current.pop(0)
+            current.append(split)
+            current_lengths.append(length)
+            total += length
+        chunk = "".join(current).strip()
+        if chunk:
+            chunks.append(chunk)
+        return chunks
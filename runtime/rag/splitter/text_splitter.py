@@ -1,86 +1,114 @@
+import copy
 import os
 from collections.abc import Sequence
 from typing import Any, Optional
 
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+import tiktoken
 
 from runtime.entities.document_entities import Document
 from runtime.rag.splitter.base_splitter import BaseTextSplitter
 
+DEFAULT_SEPARATORS = ["\n\n", "。", ". ", " ", ""]
+
+# encode_ordinary_batch spins up a thread pool per call; below this many texts a plain loop is cheaper.
+_MIN_THREADED_BATCH = 32
+_TOKENIZER_THREADS = max(4, os.cpu_count() or 1)
+
 
 class RecursiveTextSplitter(BaseTextSplitter):
-    """RecursiveTextSplitter."""
+    """RecursiveTextSplitter.
+
+    Splits on the first separator present in the text, recursing with the remaining separators
+    into pieces that are still too long. Token lengths for every candidate piece of a recursion
+    level are measured in one tiktoken batch call, across all documents being split.
+    """
 
-    def __init__(self, separators: Optional[list[str]] = None, **kwargs: Any):
-        super().__init__(**kwargs)
+    def __init__(self, separators: Optional[list[str]] = None, separator: Optional[str] = None, **kwargs: Any):
+        # ``separator`` is only meaningful for custom rules (see FixedRecursiveTextSplitter);
+        # automatic mode always splits on the built-in separator ladder.
+        super().__init__(length_function=self._token_lengths, **kwargs)
         if "TIKTOKEN_CACHE_DIR" not in os.environ:
             os.environ["TIKTOKEN_CACHE_DIR"] = os.path.expanduser("~/.cache/tiktoken")
 
-        self.text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
-            encoding_name="cl100k_base",
-            separators=separators or ["\n\n", "。", ". ", " ", ""],
-            **kwargs,
-        )
+        self._encoding = tiktoken.get_encoding("cl100k_base")
+        # Everything up to and including the first "" separator; later entries are unreachable.
+        separators = separators or DEFAULT_SEPARATORS
+        self._separators = tuple(separators[: separators.index("") + 1] if "" in separators else separators)
 
     def split_text(self, text: str) -> list[str]:
-        return self.text_splitter.split_text(text)
+        return self._split_texts([text])[0]
 
     def split_documents(self, documents: Sequence[Document]) -> list[Document]:
         return list(self.transform_document(documents))
 
     def transform_document(self, documents: Sequence[Document], **kwargs) -> Sequence[Document]:
-        all_docs = []
-        from langchain_core.documents import Document as LCDocument
-
-        split_documents = self.text_splitter.split_documents(
-            [LCDocument(page_content=doc.content, metadata=doc.metadata) for doc in documents]
-        )
-        if not split_documents:
-            return []
-        for _document in split_documents:
-            all_docs.append(
-                Document(
-                    content=_document.page_content,
-                    metadata=_document.metadata,
-                )
-            )
-        return all_docs
-
-
-class FixedRecursiveTextSplitter(BaseTextSplitter):
+        documents = list(documents)
+        chunks_per_document = self._split_texts([document.content for document in documents])
+        return [
+            Document(content=chunk, metadata=copy.deepcopy(document.metadata))
+            for document, chunks in zip(documents, chunks_per_document)
+            for chunk in chunks
+        ]
+
+    def _token_lengths(self, texts: list[str]) -> list[int]:
+        if len(texts) < _MIN_THREADED_BATCH:
+            return [len(self._encoding.encode_ordinary(text)) for text in texts]
+        return [len(ids) for ids in self._encoding.encode_ordinary_batch(texts, num_threads=_TOKENIZER_THREADS)]
+
+    def _split_texts(self, texts: list[str], level: int = 0) -> list[list[str]]:
+        """Split ``texts`` trying separators from ``self._separators[level]`` onwards."""
+        plans = [self._split_on_first_separator(text, level) for text in texts]
+        lengths = self._length_function([split for splits, _ in plans for split in splits])
+
+        results: list[list[str]] = []
+        offset = 0
+        for splits, next_level in plans:
+            chunks: list[str] = []
+            good_splits: list[str] = []
+            good_lengths: list[int] = []
+            for split, length in zip(splits, lengths[offset : offset + len(splits)]):
+                if length < self._chunk_size:
+                    good_splits.append(split)
+                    good_lengths.append(length)
+                    continue
+                if good_splits:
+                    chunks.extend(self._merge_splits(good_splits, good_lengths))
+                    good_splits, good_lengths = [], []
+                if next_level < len(self._separators):
+                    chunks.extend(self._split_texts([split], next_level)[0])
+                else:
+                    chunks.append(split)
+            if good_splits:
+                chunks.extend(self._merge_splits(good_splits, good_lengths))
+            offset += len(splits)
+            results.append(chunks)
+        return results
+
+    def _split_on_first_separator(self, text: str, level: int) -> tuple[list[str], int]:
+        """Split ``text`` on the first separator it contains, keeping each separator at the start of its piece.
+
+        Returns the pieces and the ladder level to recurse with for pieces that are still too long.
+        """
+        separators = self._separators
+        separator, next_level = separators[-1], len(separators)
+        for i in range(level, len(separators)):
+            # str.__contains__/str.split are single C scans; a combined regex finditer allocates
+            # a match object per separator hit and is an order of magnitude slower on large texts.
+            if not separators[i] or separators[i] in text:
+                separator = separators[i]
+                next_level = i + 1 if separator else len(separators)
+                break
+
+        if not separator:
+            return list(text), next_level
+        first, *rest = text.split(separator)
+        splits = [first, *(separator + part for part in rest)]
+        return [split for split in splits if split], next_level
+
+
+class FixedRecursiveTextSplitter(RecursiveTextSplitter):
     """FixedRecursiveTextSplitter."""
 
     def __init__(self, fixed_separator: str = "\n\n", **kwargs: Any):
-        super().__init__(**kwargs)
-        if "TIKTOKEN_CACHE_DIR" not in os.environ:
-            os.environ["TIKTOKEN_CACHE_DIR"] = os.path.expanduser("~/.cache/tiktoken")
         separators = [separator for separator in fixed_separator.split(",") if separator]
-        self.text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
-            encoding_name="cl100k_base",
-            separators=separators or ["\n\n", "。", ". ", " ", ""],
-            **kwargs,
-        )
-
-    def split_text(self, text: str) -> list[str]:
-        return self.text_splitter.split_text(text)
-
-    def split_documents(self, documents: Sequence[Document]) -> list[Document]:
-        return list(self.transform_document(documents))
-
-    def transform_document(self, documents: Sequence[Document], **kwargs) -> Sequence[Document]:
-        all_docs = []
-        from langchain_core.documents import Document as LCDocument
-
-        split_documents = self.text_splitter.split_documents(
-            [LCDocument(page_content=doc.content, metadata=doc.metadata) for doc in documents]
-        )
-        if not split_documents:
-            return []
-        for _document in split_documents:
-            all_docs.append(
-                Document(
-                    content=_document.page_content,
-                    metadata=_document.metadata,
-                )
-            )
-        return all_docs
+        super().__init__(separators=separators or None, **kwargs)
@@ -25,7 +25,7 @@ logger = logging.getLogger(__name__)
 class RagManager:
     def __init__(self):
         self.storage = storage_manager
-        self.model_manager = ModelManager()
+        self.model_manager = ModelManager.get_instance()
 
     def run(self, knowledge_docs: list[KnowledgeDocument], **kwargs):
         """Run the RAG process."""
@@ -10,6 +10,10 @@ class Tool(ABC):
     The base class of a tool
     """
 
+    # Tools that mutate shared state (files, plans, memory) set this to False so that
+    # ToolManager.invoke_tools runs them one at a time instead of concurrently.
+    parallel_safe: bool = True
+
     def __init__(self, entity: ToolEntity) -> None:
         self.entity = entity
 
@@ -18,6 +18,8 @@ class BashTool(BuiltinTool):
     A tool to execute shell commands.
     """
 
+    parallel_safe = False
+
     async def _invoke(self, tool_parameters: dict[str, Any], message_id: str | None = None) -> ToolInvokeResult:
         return await anyio.to_thread.run_sync(self._bash_sync, tool_parameters)
 
@@ -1,12 +1,26 @@
 from collections.abc import Generator
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any, Union
-
-from pytz import timezone as pytz_timezone
+from zoneinfo import ZoneInfo, available_timezones
 
 from runtime.tool.builtin_tool.tool import BuiltinTool
 from runtime.tool.entities import ToolInvokeResult
 
+# Names that resolve to plain UTC; "GMT" is left out because its %Z renders as "GMT".
+_UTC_ALIASES = frozenset({"UTC", "ETC/UTC", "ETC/UCT", "UCT", "ZULU", "ETC/ZULU", "UNIVERSAL", "ETC/UNIVERSAL"})
+
+
+@lru_cache(maxsize=1)
+def _timezone_names() -> dict[str, str]:
+    # ZoneInfo keys are case-sensitive, but pytz accepted names in any case ("asia/shanghai").
+    return {name.lower(): name for name in available_timezones()}
+
+
+@lru_cache(maxsize=512)
+def _get_timezone(name: str) -> ZoneInfo:
+    return ZoneInfo(_timezone_names().get(name.lower(), name))
+
 
 class CurrentTimeTool(BuiltinTool):
     """
@@ -20,9 +34,9 @@ class CurrentTimeTool(BuiltinTool):
         invoke tools
         """
         # get timezone
-        tz = tool_parameters.get("timezone", "UTC")
+        tz = (tool_parameters.get("timezone") or "UTC").strip()
         fm = tool_parameters.get("format") or "%Y-%m-%d %H:%M:%S %Z"
-        if tz == "UTC":
+        if tz.upper() in _UTC_ALIASES:
             return ToolInvokeResult(
                 name=self.entity.name,
                 data=datetime.now(UTC).strftime(fm),
@@ -33,7 +47,7 @@ class CurrentTimeTool(BuiltinTool):
             )
 
         try:
-            tz = pytz_timezone(tz)
+            tz = _get_timezone(tz)
         except Exception:
             return ToolInvokeResult(
                 name=self.entity.name,
@@ -48,7 +62,7 @@ class CurrentTimeTool(BuiltinTool):
             name=self.entity.name,
             data=datetime.now(tz).strftime(fm),
             meta={
-                "timezone": tz.zone,
+                "timezone": tz.key,
                 "format": fm,
             },
         )
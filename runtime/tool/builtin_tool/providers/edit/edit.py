@@ -17,6 +17,8 @@ class EditTool(BuiltinTool):
     A tool to edit files with string replacement.
     """
 
+    parallel_safe = False
+
     async def _invoke(self, tool_parameters: dict[str, Any], message_id: str | None = None) -> ToolInvokeResult:
         return await anyio.to_thread.run_sync(self._edit_sync, tool_parameters)
 
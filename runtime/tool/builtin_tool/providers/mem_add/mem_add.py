@@ -11,6 +11,8 @@ from runtime.tool.entities import ToolInvokeResult
 
 
 class MemAddTool(BuiltinTool):
+    parallel_safe = False
+
     async def _invoke(self, tool_parameters: dict[str, Any], message_id: str | None = None) -> ToolInvokeResult:
         return await anyio.to_thread.run_sync(self._add_sync, tool_parameters)
 
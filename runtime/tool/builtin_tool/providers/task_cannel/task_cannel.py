@@ -12,6 +12,8 @@ class TaskCannelTool(BuiltinTool):
     A tool to cancel background tasks.
     """
 
+    parallel_safe = False
+
     async def _invoke(self, tool_parameters: dict[str, Any], message_id: str | None = None) -> ToolInvokeResult:
         task_id = tool_parameters.get("task_id")
         if task_id is None:
@@ -12,6 +12,8 @@ class TaskCreateTool(BuiltinTool):
     A tool to create background tasks.
     """
 
+    parallel_safe = False
+
     async def _invoke(self, tool_parameters: dict[str, Any], message_id: str | None = None) -> ToolInvokeResult:
         try:
             data = await anyio.to_thread.run_sync(TaskJobService.create, tool_parameters, message_id)
@@ -17,6 +17,8 @@ class WriteTool(BuiltinTool):
     A tool to write content to files.
     """
 
+    parallel_safe = False
+
     async def _invoke(self, tool_parameters: dict[str, Any], message_id: str | None = None) -> ToolInvokeResult:
         return await anyio.to_thread.run_sync(self._write_sync, tool_parameters)
 
@@ -18,16 +18,17 @@ class BuiltinToolController(ToolController):
     def __init__(self) -> None:
         super().__init__()
         self.tools = self.load_tools()
+        # name -> tool, first registration wins as with the former linear scan
+        self._tool_index: dict[str, BuiltinTool] = {}
+        for tool in self.tools:
+            self._tool_index.setdefault(tool.entity.name, tool)
 
     def get_tool(self, tool_name: str) -> BuiltinTool:
         """
         Get a specific built-in tool by its name.
         This method should be implemented to return the tool instance.
         """
-        for tool in self.tools:
-            if tool.entity.name == tool_name:
-                return tool
-        return None
+        return self._tool_index.get(tool_name)
 
     def get_tools(self, filter_names: list[str] = None) -> list[BuiltinTool]:
         """
@@ -43,10 +44,10 @@ class BuiltinToolController(ToolController):
         Get the schema of a specific built-in tool.
         This method should be implemented to return the schema of the specified tool.
         """
-        for tool in self.tools:
-            if tool.entity.name == tool_name:
-                return tool.entity.model_json_schema()
-        raise ValueError(f"Tool {tool_name} not found.")
+        tool = self._tool_index.get(tool_name)
+        if tool is None:
+            raise ValueError(f"Tool {tool_name} not found.")
+        return tool.entity.model_json_schema()
 
     def load_tools(self) -> list[BuiltinTool]:
         """
@@ -1,3 +1,4 @@
+import json
 from collections.abc import Callable
 from enum import StrEnum
 from typing import Optional, Union
@@ -19,21 +20,15 @@ class McpTransportType(StrEnum):
 
     @classmethod
     def value_of(cls, value: str) -> "McpTransportType":
-        for mode in cls:
-            if mode.value == value:
-                return mode
-        raise ValueError(f"Invalid McpTransportType value: {value}")
+        # Enum lookup by value is a dict hit on _value2member_map_.
+        try:
+            return cls(value)
+        except ValueError:
+            raise ValueError(f"Invalid McpTransportType value: {value}") from None
 
     @classmethod
     def to_original(cls, type: str) -> "McpTransportType":
-        if type == "stdio":
-            return cls.STDIO
-        elif type == "sse":
-            return cls.SSE
-        elif type == "streamable":
-            return cls.STREAMABLE
-        else:
-            raise ValueError(f"Invalid McpTransportType value: {type}")
+        return cls.value_of(type)
 
 
 class ToolProviderType(StrEnum):
@@ -49,25 +44,14 @@ class ToolProviderType(StrEnum):
 
     @classmethod
     def value_of(cls, value: str) -> "ToolProviderType":
-        for mode in cls:
-            if mode.value == value:
-                return mode
-        raise ValueError(f"Invalid ToolProviderType value: {value}")
+        try:
+            return cls(value)
+        except ValueError:
+            raise ValueError(f"Invalid ToolProviderType value: {value}") from None
 
     @classmethod
     def to_original(cls, type: str) -> "ToolProviderType":
-        if type == "builtin":
-            return cls.BUILTIN
-        elif type == "api":
-            return cls.API
-        elif type == "mcp":
-            return cls.MCP
-        elif type == "local":
-            return cls.LOCAL
-        elif type == "skill":
-            return cls.SKILL
-        else:
-            raise ValueError(f"Invalid ToolProviderType value: {type}")
+        return cls.value_of(type)
 
 
 class CredentialType(StrEnum):
@@ -80,18 +64,16 @@ class CredentialType(StrEnum):
     OAUTH2 = "oauth2"
     API_KEY = "api_key"
 
+    @classmethod
+    def value_of(cls, value: str) -> "CredentialType":
+        try:
+            return cls(value)
+        except ValueError:
+            raise ValueError(f"Invalid CredentialType value: {value}") from None
+
     @classmethod
     def to_original(cls, credential: str) -> "CredentialType":
-        if credential == "none":
-            return cls.NONE
-        elif credential == "basic":
-            return cls.BASIC
-        elif credential == "oauth2":
-            return cls.OAUTH2
-        elif credential == "api_key":
-            return cls.API_KEY
-        else:
-            raise ValueError(f"Invalid CredentialType value: {credential}")
+        return cls.value_of(credential)
 
 
 class ToolEntity(BaseModel):
@@ -167,22 +149,22 @@ class ToolInvokeResult(BaseModel):
     tool_call_id: Optional[str] = None
 
     def to_normal(self) -> str | None:
-        if isinstance(self.data, dict) or isinstance(self.data, list):
-            import json
-
-            return json.dumps(self.data, ensure_ascii=False)
-        elif isinstance(self.data, bytes):
-            return self.data.decode("utf-8", errors="ignore")
-        elif isinstance(self.data, TextContent):
-            return self.data.text
-        elif isinstance(self.data, ImageContent):
-            return self.data.data
-        elif isinstance(self.data, EmbeddedResource):
-            if isinstance(self.data.resource, BlobResourceContents):
-                return self.data.resource.blob
-            elif isinstance(self.data.resource, TextResourceContents):
-                return self.data.resource.text
-        elif isinstance(self.data, str):
-            return self.data
+        data = self.data
+        # Most tools return plain text, so that case is checked first.
+        if isinstance(data, str):
+            return data
+        elif isinstance(data, (dict, list)):
+            return json.dumps(data, ensure_ascii=False)
+        elif isinstance(data, bytes):
+            return data.decode("utf-8", errors="ignore")
+        elif isinstance(data, TextContent):
+            return data.text
+        elif isinstance(data, ImageContent):
+            return data.data
+        elif isinstance(data, EmbeddedResource):
+            if isinstance(data.resource, BlobResourceContents):
+                return data.resource.blob
+            elif isinstance(data.resource, TextResourceContents):
+                return data.resource.text
         else:
-            return str(self.data) if self.data is not None else ""
+            return str(data) if data is not None else ""
@@ -6,9 +6,11 @@ from typing import Any, Union
 import mcp.types as mcp_types
 
 import runtime.mcp.types as runtime_mcp_types
+from runtime.mcp.client.mcp_client import McpClient
 
 from ..base.tool import Tool, ToolInvokeResult
 from ..entities import ToolEntity, ToolProviderType
+from .fast_mcp_instance import fast_mcp
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,7 @@ class McpTool(Tool):
     def __init__(self, server_url: str, entity: ToolEntity):
         super().__init__(entity=entity)
         self.server_url = server_url
+        self._client: McpClient | None = None
 
     def tool_provider_type(self) -> ToolProviderType:
         return ToolProviderType.MCP
@@ -28,8 +31,6 @@ class McpTool(Tool):
     ) -> Union[ToolInvokeResult, Generator[ToolInvokeResult, None, None]]:
         """Invoke the tool with the given parameters."""
         if self.entity.is_local():
-            from .tool_provider import fast_mcp
-
             try:
                 result = await fast_mcp.call_tool(self.entity.name, tool_parameters)
                 return ToolInvokeResult(
@@ -42,14 +43,8 @@ class McpTool(Tool):
                 )
         else:
             try:
-                from runtime.mcp.client.mcp_client import McpClient
-
-                self.entity.configs["credential_type"] = self.entity.credentials
-                client = McpClient.build_client(server_url=self.server_url, mcp_config=self.entity.configs)
-
-                tool_result = None
-                async for client_session in client.get_client_session():
-                    await client_session.initialize()
+                # get_client_session() yields an already-initialized session.
+                async with self._get_client().get_client_session() as client_session:
                     tool_result = await client_session.call_tool(
                         self.entity.name, tool_parameters, read_timeout_seconds=timedelta(seconds=60)
                     )
@@ -63,25 +58,40 @@ class McpTool(Tool):
                     name=self.entity.name, error=f"Error: {str(e)}", success=False, meta=tool_parameters
                 )
 
+    def _get_client(self) -> McpClient:
+        """Build the MCP client once per tool; the entity's server config does not change between calls."""
+        if self._client is None:
+            self.entity.configs["credential_type"] = self.entity.credentials
+            self._client = McpClient.build_client(server_url=self.server_url, mcp_config=self.entity.configs)
+        return self._client
+
     def convert_content(
         self, content: list[mcp_types.TextContent | mcp_types.ImageContent | mcp_types.EmbeddedResource]
     ) -> list[runtime_mcp_types.TextContent | runtime_mcp_types.ImageContent | runtime_mcp_types.EmbeddedResource]:
-        """Convert MCP content to runtime MCP content."""
+        """Convert MCP content to runtime MCP content.
+
+        The source items were already validated by the MCP SDK, so the runtime models are built
+        with ``model_construct`` instead of being validated a second time.
+        """
         converted_content = []
         for item in content:
             if isinstance(item, mcp_types.TextContent):
-                converted_content.append(runtime_mcp_types.TextContent(text=item.text, type=item.type))
+                converted_content.append(runtime_mcp_types.TextContent.model_construct(text=item.text, type=item.type))
             elif isinstance(item, mcp_types.ImageContent):
                 converted_content.append(
-                    runtime_mcp_types.ImageContent(data=item.data, mimeType=item.mimeType, type=item.type)
+                    runtime_mcp_types.ImageContent.model_construct(
+                        data=item.data, mimeType=item.mimeType, type=item.type
+                    )
                 )
             elif isinstance(item, mcp_types.EmbeddedResource):
                 converted_content.append(
-                    runtime_mcp_types.EmbeddedResource(
+                    runtime_mcp_types.EmbeddedResource.model_construct(
                         type=item.type,
-                        resource=runtime_mcp_types.TextResourceContents(text=item.resource.text)
+                        resource=runtime_mcp_types.TextResourceContents.model_construct(
+                            text=item.resource.text, uri=item.resource.uri, mimeType=item.resource.mimeType
+                        )
                         if isinstance(item.resource, mcp_types.TextResourceContents)
-                        else runtime_mcp_types.BlobResourceContents(
+                        else runtime_mcp_types.BlobResourceContents.model_construct(
                             blob=item.resource.blob, mimeType=item.resource.mimeType, uri=item.resource.uri
                         ),
                     )
@@ -21,13 +21,13 @@ class McpToolController(ToolController):
     def __init__(self):
         self.remote_tools = self.local_db_tools()
         self.tools = self.local_tools + self.remote_tools
+        self._tool_index: dict[str, McpTool] = {}
+        for tool in self.tools:
+            self._tool_index.setdefault(tool.entity.name, tool)
 
     def get_tool(self, tool_name: str) -> Tool | None:
         """Retrieves a tool by its name."""
-        for tool in self.tools:
-            if tool.entity.name == tool_name:
-                return tool
-        return None
+        return self._tool_index.get(tool_name)
 
     def get_tools(self, filter_names=None) -> list[Tool]:
         """Retrieves all available tools."""
@@ -1,8 +1,16 @@
+import asyncio
 import hashlib
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
 from typing import Any, Optional
 
+from sqlalchemy import bindparam, select, update
+
 from models import ToolCallResult
 from models.engine import get_db
 from runtime.generator.generator import LLMGenerator
@@ -12,17 +20,109 @@ from runtime.tool.builtin_tool.tool_provider import BuiltinToolController
 from runtime.tool.entities import ToolInvokeResult, ToolProviderType
 from runtime.tool.mcp.tool_provider import McpToolController
 from runtime.tool.skill.tool_provider import SKILLToolController
-from utils import jsonable_encoder
 
 logger = logging.getLogger(__name__)
 
+# Process-local TTL cache in front of the Redis tool-result cache: agents repeat identical calls
+# across turns, and a hit here skips the Redis round-trip as well as the tool itself.
+_TOOL_RUN_CACHE_SIZE = 512
+_tool_run_cache: OrderedDict[str, tuple[float, ToolInvokeResult]] = OrderedDict()
+_tool_run_cache_lock = threading.Lock()
+
+
+def _get_cached_tool_result(key: str) -> ToolInvokeResult | None:
+    with _tool_run_cache_lock:
+        entry = _tool_run_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del _tool_run_cache[key]
+            return None
+        _tool_run_cache.move_to_end(key)
+    # Callers stamp their own tool_call_id onto the result.
+    return result.model_copy(deep=True)
+
+
+def _cache_tool_result(key: str, result: ToolInvokeResult, ttl: int) -> None:
+    with _tool_run_cache_lock:
+        _tool_run_cache[key] = (time.monotonic() + ttl, result.model_copy(deep=True))
+        _tool_run_cache.move_to_end(key)
+        if len(_tool_run_cache) > _TOOL_RUN_CACHE_SIZE:
+            _tool_run_cache.popitem(last=False)
+
+
+# Tool call records are written back off the request path. Nothing reads them during the turn,
+# so the next LLM round does not wait on the upsert. When too many writes are pending the caller
+# saves inline, which bounds the backlog and pushes back on producers.
+_MAX_PENDING_WRITEBACKS = 64
+_writeback_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tool-writeback")
+_writeback_slots = threading.BoundedSemaphore(_MAX_PENDING_WRITEBACKS)
+
+# Fixed-shape writeback statements, built once; SQLAlchemy's compiled cache then serves every call.
+_tool_call_table = ToolCallResult.__table__
+_SELECT_EXISTING_TOOL_CALL_IDS = select(_tool_call_table.c.tool_call_id, _tool_call_table.c.id).where(
+    _tool_call_table.c.tool_call_id.in_(bindparam("tool_call_ids", expanding=True))
+)
+_UPDATE_TOOL_CALL_RESULT = (
+    update(_tool_call_table)
+    .where(_tool_call_table.c.id == bindparam("b_id"))
+    .values(state=bindparam("b_state"), result=bindparam("b_result"))
+)
+
+
+# The shared ToolManager is rebuilt when another process bumps the Redis version stamp (MCP tool
+# registration) or when it gets older than TOOL_MANAGER_TTL, which also picks up skills added on disk.
+_TOOL_MANAGER_VERSION_KEY = "tool_manager:version"
+
+
+def _get_tool_manager_version() -> str | None:
+    from redis import RedisError
+
+    from component.cache.redis_cache import redis_client
+
+    # Without Redis (down or not initialized) the instance is only rebuilt by TTL.
+    try:
+        version = redis_client.get(_TOOL_MANAGER_VERSION_KEY)
+    except (RedisError, RuntimeError) as e:
+        logger.warning("Reading the tool manager version failed: %s", e)
+        return None
+    return version.decode() if isinstance(version, bytes) else version
+
+
+def _bump_tool_manager_version() -> None:
+    from redis import RedisError
+
+    from component.cache.redis_cache import redis_client
+
+    try:
+        redis_client.incr(_TOOL_MANAGER_VERSION_KEY)
+    except (RedisError, RuntimeError) as e:
+        logger.warning("Bumping the tool manager version failed: %s", e)
+
+
+def _on_writeback_done(future: Future) -> None:
+    _writeback_slots.release()
+    if future.exception() is not None:
+        logger.warning("Saving tool call results failed: %s", future.exception())
+
 
 class ToolManager:
     """
     ToolManager is responsible for managing tool providers and their controllers.
     """
 
-    providers: dict[str, ToolController] = {}
+    providers: dict[ToolProviderType, ToolController]
+
+    _instance: Optional["ToolManager"] = None
+    _instance_version: str | None = None
+    _instance_built_at = 0.0
+    _instance_checked_at = 0.0
+    # Held only to read or swap the fields above, never while talking to Redis or building controllers.
+    _instance_lock = threading.Lock()
+    _rebuilding = False
+    # Bumped by invalidate(); a build that overlapped one is returned but not installed.
+    _generation = 0
 
     def __init__(self):
         self.providers = {ToolProviderType.BUILTIN: BuiltinToolController()}
@@ -32,6 +132,57 @@ class ToolManager:
         self.providers[ToolProviderType.LOCAL] = McpToolController()
         self.providers[ToolProviderType.MCP] = McpToolController()
 
+    @classmethod
+    def get_instance(cls) -> "ToolManager":
+        """
+        Get the process-wide ToolManager, building its tool controllers on first use
+
+        The instance is rebuilt once it is older than TOOL_MANAGER_TTL, or when the Redis version stamp
+        changed (checked at most every TOOL_MANAGER_VERSION_CHECK_INTERVAL seconds).
+        Call ``ToolManager.invalidate()`` after registering new tools.
+        """
+        from configs import config
+
+        now = time.monotonic()
+        instance = cls._instance
+        if instance is not None and now - cls._instance_checked_at < config.TOOL_MANAGER_VERSION_CHECK_INTERVAL:
+            return instance
+
+        version = _get_tool_manager_version()
+        with cls._instance_lock:
+            instance = cls._instance
+            if instance is not None:
+                if version == cls._instance_version and now - cls._instance_built_at < config.TOOL_MANAGER_TTL:
+                    cls._instance_checked_at = now
+                    return instance
+                if cls._rebuilding:
+                    # Another caller is rebuilding; keep serving the current instance until it is swapped in.
+                    return instance
+            cls._rebuilding = True
+            generation = cls._generation
+
+        try:
+            instance = cls()
+        finally:
+            with cls._instance_lock:
+                cls._rebuilding = False
+        with cls._instance_lock:
+            if generation == cls._generation:
+                cls._instance = instance
+                cls._instance_version = version
+                cls._instance_built_at = cls._instance_checked_at = time.monotonic()
+        return instance
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Drop the shared ToolManager here and bump the Redis version stamp so other processes rebuild theirs
+        """
+        _bump_tool_manager_version()
+        with cls._instance_lock:
+            cls._generation += 1
+            cls._instance = None
+
     def get_builtin_tool_controller(self):
         return self.providers[ToolProviderType.BUILTIN]
 
@@ -42,12 +193,13 @@ class ToolManager:
         return self.providers.get(ToolProviderType(tool_provider), None)
 
     @staticmethod
-    def _cache_key(tool_name: str, arguments: dict) -> str:
-        try:
-            params = json.dumps(arguments, sort_keys=True)
-        except Exception:
-            params = arguments
-        digest = hashlib.sha256(params.encode()).hexdigest()[:16]
+    def _dump_arguments(arguments: dict[str, Any]) -> str:
+        # Runtime objects injected into the arguments (e.g. agent_manager) are serialized by type only.
+        return json.dumps(arguments, sort_keys=True, default=lambda value: type(value).__name__)
+
+    @staticmethod
+    def _cache_key(tool_name: str, arguments: str) -> str:
+        digest = hashlib.blake2b(arguments.encode(), digest_size=8).hexdigest()
         return f"tool_result:{tool_name}:{digest}"
 
     @staticmethod
@@ -119,11 +271,30 @@ class ToolManager:
         tool_call_id: Optional[str] = None,
         message_id: Optional[str] = None,
     ) -> ToolInvokeResult | None:
+        result, call_result = await self._run_tool(tool_name, tool_arguments, tool_provider, tool_call_id, message_id)
+        if call_result is not None:
+            self._save_tool_call_results_in_background([call_result])
+        return result
+
+    async def _run_tool(
+        self,
+        tool_name: str,
+        tool_arguments: dict[str, Any],
+        tool_provider: str,
+        tool_call_id: Optional[str] = None,
+        message_id: Optional[str] = None,
+    ) -> tuple[ToolInvokeResult, ToolCallResult | None]:
+        """
+        Invoke a tool without persisting it
+
+        :return: the invoke result and the ToolCallResult record to save, or None when the tool
+            did not run (unknown tool or cache hit)
+        """
         tool_controller: ToolController = self.get_tool_provider(tool_provider)
         if not tool_controller:
             return ToolInvokeResult(
                 error=f"Tool provider {tool_provider} not found", success=False, tool_call_id=tool_call_id
-            )
+            ), None
 
         tool = tool_controller.get_tool(tool_name)
         if not tool:
@@ -131,59 +302,186 @@ class ToolManager:
                 error=f"Tool {tool_name} not found in provider {tool_provider}",
                 success=False,
                 tool_call_id=tool_call_id,
-            )
+            ), None
 
         from component.cache.redis_cache import redis_client
         from configs import config
 
+        arguments_json = self._dump_arguments(tool_arguments or {})
         cache_key = None
-        if config.TOOL_CACHE_ENABLED:
-            cache_key = self._cache_key(tool_name, tool_arguments or "{}")
-            cached = redis_client.get(cache_key)
+        # Tools that mutate state must run every time; replaying a cached result would skip the side effect.
+        if config.TOOL_CACHE_ENABLED and tool.parallel_safe:
+            cache_key = self._cache_key(tool_name, arguments_json)
+            cached = _get_cached_tool_result(cache_key)
+            if cached is None:
+                cached_json = redis_client.get(cache_key)
+                if cached_json is not None:
+                    cached = ToolInvokeResult.model_validate_json(cached_json)
+                    _cache_tool_result(cache_key, cached, config.TOOL_CACHE_TTL)
             if cached is not None:
-                logger.info("%Cache hit for tool {tool_name}")
-                return ToolInvokeResult.model_validate_json(cached)
+                logger.info("Cache hit for tool %s", tool_name)
+                if tool_call_id:
+                    cached.tool_call_id = tool_call_id
+                return cached, None
 
+        tool_call_id = tool_call_id or self._generate_tool_call_id(tool_name, arguments_json)
         call_result = ToolCallResult(
             message_id=message_id,
-            tool_call_id=tool_call_id or self._generate_tool_call_id(tool_name, tool_arguments or "{}"),
+            tool_call_id=tool_call_id,
             tool_call_name=tool_name,
-            tool_call_args=json.dumps(tool_arguments, sort_keys=True) if tool_arguments else None,
+            tool_call_args=arguments_json if tool_arguments else None,
             state="failed",
         )
         result: ToolInvokeResult
         try:
             tool_arguments["tool_manager"] = self
-            result = next(await tool.invoke(tool_parameters=tool_arguments, message_id=message_id))
+            # Only the first result is used; close the generator so streaming tools release their resources now.
+            with closing(await tool.invoke(tool_parameters=tool_arguments, message_id=message_id)) as results:
+                result = next(results)
             if result and result.success:
-                result.tool_call_id = tool_call_id or self._generate_tool_call_id(tool_name, tool_arguments or "{}")
+                result.tool_call_id = tool_call_id
                 call_result.state = "success"
-                call_result.result = json.dumps(jsonable_encoder(result, exclude_none=True))
+                # Serialize once; the same JSON is stored on the call record and in the result cache.
+                result_json = result.model_dump_json(exclude_none=True)
+                call_result.result = result_json
                 if cache_key is not None and result.data is not None:
-                    redis_client.setex(cache_key, config.TOOL_CACHE_TTL, result.model_dump_json(exclude_none=True))
-                logger.info("%Tool {tool_name} invoked successfully")
+                    redis_client.setex(cache_key, config.TOOL_CACHE_TTL, result_json)
+                    _cache_tool_result(cache_key, result, config.TOOL_CACHE_TTL)
+                logger.info("Tool %s invoked successfully", tool_name)
             else:
                 call_result.state = "failed"
-                logger.warning("%Tool {tool_name} invoked but returned no result.")
+                logger.warning("Tool %s invoked but returned no result.", tool_name)
         except Exception as ex:
             logger.exception(f"Error invoking tool {tool_name}: {ex}")
             call_result.state = "failed"
             result = ToolInvokeResult(error=str(ex), success=False, tool_call_id=tool_call_id)
 
+        return result, call_result
+
+    @classmethod
+    def _save_tool_call_results_in_background(cls, call_results: list[ToolCallResult]) -> None:
+        if not _writeback_slots.acquire(blocking=False):
+            cls._save_tool_call_results(call_results)
+            return
+        _writeback_executor.submit(cls._save_tool_call_results, call_results).add_done_callback(_on_writeback_done)
+
+    @staticmethod
+    def _save_tool_call_results(call_results: list[ToolCallResult]) -> None:
+        """
+        Upsert tool call records by tool_call_id: one SELECT for the existing ids, one commit
+
+        Existing rows are updated by primary key with a Core executemany rather than loaded into
+        the session, since only their state and result change.
+        """
         with get_db() as session:
-            existing_result = (
-                session.query(ToolCallResult)
-                .filter(
-                    ToolCallResult.tool_call_id == call_result.tool_call_id,
-                )
-                .first()
+            existing_ids = dict(
+                session.execute(
+                    _SELECT_EXISTING_TOOL_CALL_IDS,
+                    {"tool_call_ids": list({call_result.tool_call_id for call_result in call_results})},
+                ).all()
             )
-            if existing_result:
-                existing_result.state = call_result.state
-                existing_result.result = call_result.result
-                session.add(existing_result)
-                session.commit()
+            updates: dict[str, dict[str, Any]] = {}
+            pending: dict[str, ToolCallResult] = {}
+            for call_result in call_results:
+                if call_result.tool_call_id in existing_ids:
+                    updates[call_result.tool_call_id] = {
+                        "b_id": existing_ids[call_result.tool_call_id],
+                        "b_state": call_result.state,
+                        "b_result": call_result.result,
+                    }
+                elif call_result.tool_call_id in pending:
+                    pending[call_result.tool_call_id].state = call_result.state
+                    pending[call_result.tool_call_id].result = call_result.result
+                else:
+                    session.add(call_result)
+                    pending[call_result.tool_call_id] = call_result
+            if updates:
+                session.connection().execute(_UPDATE_TOOL_CALL_RESULT, list(updates.values()))
+            session.commit()
+
+    async def invoke_tools(self, tool_calls: list[dict[str, Any]]) -> list[ToolInvokeResult | None]:
+        """
+        Invoke several independent tools concurrently
+
+        Consecutive tools that are parallel safe run together, at most TOOL_MAX_CONCURRENCY at a time.
+        A tool flagged ``parallel_safe = False`` is a barrier: it starts after every earlier call has
+        finished and later calls wait for it. The call records are written back together, in the
+        background, once every tool has finished.
+
+        :param tool_calls: keyword arguments for invoke_tool, one dict per call
+        :return: the results, in the same order as tool_calls
+        """
+        if len(tool_calls) <= 1:
+            return [await self.invoke_tool(**call) for call in tool_calls]
+
+        from configs import config
+
+        outcomes: list[tuple[ToolInvokeResult, ToolCallResult | None]] = [None] * len(tool_calls)
+        semaphore = asyncio.Semaphore(max(1, config.TOOL_MAX_CONCURRENCY))
+        segment: list[int] = []
+        # Identical side-effect-free calls between two barriers run once; duplicates reuse the first outcome.
+        first_calls: dict[tuple[str, str, str], int] = {}
+        duplicates: dict[int, int] = {}
+
+        async def run_parallel(index: int) -> None:
+            async with semaphore:
+                outcomes[index] = await self._run_tool(**tool_calls[index])
+
+        async def run_segment() -> None:
+            if segment:
+                await asyncio.gather(*(run_parallel(index) for index in segment))
+            segment.clear()
+            first_calls.clear()
+
+        for index, call in enumerate(tool_calls):
+            if not self._is_parallel_safe(call["tool_name"], call["tool_provider"]):
+                await run_segment()
+                outcomes[index] = await self._run_tool(**call)
+                continue
+            key = (call["tool_name"], call["tool_provider"], self._dump_arguments(call.get("tool_arguments") or {}))
+            if key in first_calls:
+                duplicates[index] = first_calls[key]
             else:
-                session.add(call_result)
-                session.commit()
-        return result
+                first_calls[key] = index
+                segment.append(index)
+        await run_segment()
+
+        for index, first_index in duplicates.items():
+            outcomes[index] = self._copy_outcome(outcomes[first_index], tool_calls[index].get("tool_call_id"))
+        call_results = [call_result for _, call_result in outcomes if call_result is not None]
+        if call_results:
+            self._save_tool_call_results_in_background(call_results)
+        return [result for result, _ in outcomes]
+
+    @staticmethod
+    def _copy_outcome(
+        outcome: tuple[ToolInvokeResult, ToolCallResult | None], tool_call_id: Optional[str]
+    ) -> tuple[ToolInvokeResult, ToolCallResult | None]:
+        """
+        Give a duplicate call its own copy of another call's outcome, under its own tool_call_id
+        """
+        result, call_result = outcome
+        result = result.model_copy(deep=True)
+        if not tool_call_id or (call_result is not None and tool_call_id == call_result.tool_call_id):
+            # Same id as the original (or none to stamp): the original record already covers it.
+            return result, None
+        result.tool_call_id = tool_call_id
+        if call_result is None:
+            return result, None
+        return result, ToolCallResult(
+            message_id=call_result.message_id,
+            tool_call_id=tool_call_id,
+            tool_call_name=call_result.tool_call_name,
+            tool_call_args=call_result.tool_call_args,
+            state=call_result.state,
+            result=call_result.result,
+        )
+
+    def _is_parallel_safe(self, tool_name: str, tool_provider: str) -> bool:
+        try:
+            tool_controller = self.get_tool_provider(tool_provider)
+        except ValueError:
+            return True
+        tool = tool_controller.get_tool(tool_name) if tool_controller else None
+        # Unknown tools only produce an error result, which is safe to run concurrently.
+        return tool is None or tool.parallel_safe
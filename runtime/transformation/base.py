@@ -16,6 +16,8 @@ from runtime.entities.asr_entities import ASRRequest, ASRResponse
 
 logger = logging.getLogger(__name__)
 
+_SAMPLING_PARAMETERS = ("temperature", "top_p", "top_k", "presence_penalty", "frequency_penalty")
+
 
 class LLMTransformation:
     """Base class for all transformations."""
@@ -23,16 +25,10 @@ class LLMTransformation:
     @classmethod
     def setup_model_parameters(cls, credentials: dict, model_params: dict[str, Any], prompt_messages: LLMRequest):
         """Validate model parameters."""
-        if hasattr(prompt_messages, "temperature") and not getattr(prompt_messages, "temperature", None):
-            prompt_messages.temperature = model_params.get("temperature")
-        if hasattr(prompt_messages, "top_p") and not getattr(prompt_messages, "top_p", None):
-            prompt_messages.top_p = model_params.get("top_p")
-        if hasattr(prompt_messages, "top_k") and not getattr(prompt_messages, "top_k", None):
-            prompt_messages.top_k = model_params.get("top_k")
-        if hasattr(prompt_messages, "presence_penalty") and not getattr(prompt_messages, "presence_penalty", None):
-            prompt_messages.presence_penalty = model_params.get("presence_penalty")
-        if hasattr(prompt_messages, "frequency_penalty") and not getattr(prompt_messages, "frequency_penalty", None):
-            prompt_messages.frequency_penalty = model_params.get("frequency_penalty")
+        # Only fill parameters the request left unset; an explicit 0 (e.g. temperature=0.0) is kept.
+        for name in _SAMPLING_PARAMETERS:
+            if hasattr(prompt_messages, name) and getattr(prompt_messages, name) is None:
+                setattr(prompt_messages, name, model_params.get(name))
         # if not prompt_messages.miniP:
         #     prompt_messages.miniP = model_params.get("miniP", 0.0)
         if hasattr(prompt_messages, "max_tokens") and getattr(prompt_messages, "max_tokens", None):
@@ -29,9 +29,9 @@ class OpenaiResponseTransformation(LLMTransformation):
             return super().setup_model_parameters(credentials, model_params, prompt_messages)
 
         # ResponseRequest - apply model_params defaults if not set
-        if not prompt_messages.temperature:
+        if prompt_messages.temperature is None:
             prompt_messages.temperature = model_params.get("temperature")
-        if not prompt_messages.top_p:
+        if prompt_messages.top_p is None:
             prompt_messages.top_p = model_params.get("top_p")
 
         return prompt_messages
@@ -41,7 +41,8 @@ class TransformersTransformation(OpenAILikeTransformation):
     @classmethod
     def _ensure_model_loaded(cls, model_name: str, model_path: str, device: str = "cpu", model_type: str = "rerank"):
         """Ensure model is loaded and worker is started"""
-        if model_name in cls._initialized_models:
+        # Workers stay resident across requests; only (re)load when the worker is gone
+        if model_name in cls._initialized_models and cls._get_manager().is_worker_ready(model_name):
             return
 
         try:
@@ -99,21 +100,15 @@ class TransformersTransformation(OpenAILikeTransformation):
             # Convert to RerankResponse format
             reranked_docs = response.data["reranked_documents"]
             scores = response.data["scores"]
+            indices = response.data["indices"]
 
             # Create response objects
             from runtime.entities.rerank_entities import RerankDocument
 
-            results = []
-            for i, (doc_text, score) in enumerate(zip(reranked_docs, scores)):
-                # Find original document index
-                original_index = next(idx for idx, doc in enumerate(query.documents) if doc == doc_text)
-                results.append(
-                    RerankResult(index=original_index, document=RerankDocument(text=doc_text), relevance_score=score)
-                )
-
-            # Optionally stop worker to free resources
-            manager.stop_worker(model_name)
-            cls._initialized_models.remove(model_name)
+            results = [
+                RerankResult(index=index, document=RerankDocument(text=doc_text), relevance_score=score)
+                for index, doc_text, score in zip(indices, reranked_docs, scores)
+            ]
 
             return RerankResponse(
                 id="rerank-" + os.urandom(8).hex(),
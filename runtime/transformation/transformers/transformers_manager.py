@@ -1,4 +1,4 @@
-import json
+import base64
 import logging
 import multiprocessing
 import os
@@ -7,12 +7,18 @@ import sys
 import threading
 import time
 import traceback
+import uuid
 from abc import ABC, abstractmethod
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
 from typing import Any, Optional
 
+import numpy as np
+import orjson
 import zmq
 from pydantic import BaseModel
+from zmq.utils.monitor import recv_monitor_message
 
 try:
     import torch
@@ -22,22 +28,63 @@ except ImportError:
 logger = logging.getLogger("transformers")
 
 
+def _cpu_supports_bf16() -> bool:
+    """Whether the CPU runs BF16 GEMMs natively (AMX or AVX512-BF16)"""
+    # 没有这些指令时 BF16 矩阵乘走软件回退路径，比 FP32 更慢且精度更低
+    for probe in ("_is_amx_tile_supported", "_is_avx512_bf16_supported"):
+        check = getattr(torch.cpu, probe, None)
+        if check is not None and check():
+            return True
+    return False
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+    """Start method for broker/worker processes: forkserver where available, spawn otherwise"""
+    # forkserver 服务进程只导入一次本模块（连同 torch/transformers），之后每个worker从它fork，
+    # 不再像 spawn 那样在每个子进程中重新导入整个应用；服务进程是全新解释器，不会fork到父进程的CUDA状态
+    if sys.platform == "win32" or "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([__name__])
+    return context
+
+
+_PROCESS_CONTEXT = _process_context()
+
+
 class TransformersConfig:
     """Configuration class for transformers"""
 
     FRONTEND_TCP_ADDRESS = "tcp://127.0.0.1:5555"
+    FRONTEND_IPC_PATH = "ipc://" + os.path.expanduser("~/.aduib_ai/tmp/frontend")
+    # 客户端与broker同机运行，非Windows平台走Unix域套接字，绕过TCP协议栈
+    USE_IPC_FRONTEND = sys.platform != "win32"
     BACKEND_TCP_ADDRESS = "tcp://127.0.0.1:5556"
     BACKEND_IPC_PATH = "ipc://" + os.path.expanduser("~/.aduib_ai/tmp/workers")
     CONNECTION_TIMEOUT = 2 * 60000  # milliseconds
+    POLL_TIMEOUT = 1000  # milliseconds, bounds how long a stopped loop takes to notice
+    MAX_DYNAMIC_BATCH = 16  # queued requests a worker merges into one inference pass
+    # 同机运行的worker进程数，用于划分每个worker的计算线程，避免多个进程各开满核线程互相争抢
+    WORKER_COUNT = max(1, int(os.environ.get("TRANSFORMERS_WORKER_COUNT", "1")))
+    # 预先启动、等待分配模型的备用worker进程数，上限4个以限制空闲内存占用
+    STANDBY_WORKERS = min(4, max(0, int(os.environ.get("TRANSFORMERS_STANDBY_WORKERS", "1"))))
+    TERMINATE_TIMEOUT = 5  # seconds, shared SIGTERM grace period before SIGKILL when stopping processes
+
+
+def _dump_message(message: BaseModel) -> bytes:
+    """Serialize a ZMQ message; NumPy arrays in ``data`` (e.g. embeddings) are written directly by orjson"""
+    return orjson.dumps(message.model_dump(), option=orjson.OPT_SERIALIZE_NUMPY)
 
 
 class TaskReq(BaseModel):
     worker_id: Optional[str] = None
+    request_id: Optional[str] = None
     data: Optional[dict[str, Any]] = None
 
 
 class TaskResp(BaseModel):
     worker_id: Optional[str] = None
+    request_id: Optional[str] = None
     data: Optional[dict[str, Any]] = None
     success: bool = False
 
@@ -53,6 +100,7 @@ class TransformersLoader(ABC):
         device: str = "cpu",
         instruction: Optional[str] = None,
         system_prompt: Optional[str] = None,
+        compile_model: bool = True,
     ):
         self.model = model.strip()
         self.model_path = model_path
@@ -63,6 +111,74 @@ class TransformersLoader(ABC):
         self.model_instance = None
         self.tokenizer = None
         self.max_context_length = max_context_length
+        self.compute_dtype = None
+        self.compile_model = compile_model
+
+    def _select_compute_dtype(self) -> "torch.dtype":
+        """Pick the compute dtype for the target device: BF16 on Ampere+ GPUs and on CPUs with native BF16
+        (AMX or AVX512-BF16), FP16 on older CUDA, FP32 otherwise"""
+        device_type = torch.device(self.device).type
+        if device_type == "cuda":
+            return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        if device_type == "cpu" and _cpu_supports_bf16():
+            return torch.bfloat16
+        return torch.float32
+
+    def _attention_implementations(self) -> list[str]:
+        """Fused attention kernels to try, best first: FlashAttention-2 needs CUDA, half precision and flash_attn"""
+        from transformers.utils import is_flash_attn_2_available
+
+        if (
+            torch.device(self.device).type == "cuda"
+            and self.compute_dtype in (torch.float16, torch.bfloat16)
+            and is_flash_attn_2_available()
+        ):
+            return ["flash_attention_2", "sdpa"]
+        return ["sdpa"]
+
+    def _from_pretrained(self, model_cls):
+        """Load the model in the compute dtype with a fused attention kernel, falling back to the default attention"""
+        kwargs = {"torch_dtype": self.compute_dtype, "trust_remote_code": True}
+        for attn_implementation in self._attention_implementations():
+            try:
+                return model_cls.from_pretrained(
+                    self.model or self.model_path, attn_implementation=attn_implementation, **kwargs
+                )
+            except (ValueError, ImportError) as e:
+                # 旧架构或自定义模型可能不支持该注意力实现
+                logger.warning("%s attention unavailable for %s: %s", attn_implementation, self.model, e)
+        return model_cls.from_pretrained(self.model or self.model_path, **kwargs)
+
+    def _autocast(self):
+        """Autocast context for forward passes at ``self.compute_dtype``"""
+        device_type = torch.device(self.device).type
+        if device_type not in ("cpu", "cuda") or self.compute_dtype in (None, torch.float32):
+            return nullcontext()
+        return torch.autocast(device_type=device_type, dtype=self.compute_dtype)
+
+    def _to_device(self, tensor: "torch.Tensor") -> "torch.Tensor":
+        """Copy a CPU tensor to the model device; CUDA copies go through pinned memory without blocking the host"""
+        if torch.device(self.device).type == "cuda":
+            return tensor.pin_memory().to(self.device, non_blocking=True)
+        return tensor.to(self.device)
+
+    def _compile_model(self):
+        """Compile the forward graph with torch.compile, keeping the eager model if compilation fails"""
+        if not self.compile_model or not hasattr(torch, "compile"):
+            return
+        # dynamic=True 让批大小和序列长度作为符号维度，不同形状的批次不会触发重新编译
+        compiled = torch.compile(self.model_instance, dynamic=True)
+        try:
+            # 编译是惰性的，用一次预热前向触发编译，失败（如 trust_remote_code 模型无法追踪）时回退到 eager
+            warmup_inputs = self.tokenizer(["warmup", "warmup input"], padding=True, return_tensors="pt").to(
+                self.device
+            )
+            with torch.inference_mode(), self._autocast():
+                compiled(**warmup_inputs)
+        except Exception as e:
+            logger.warning("torch.compile failed for %s, falling back to eager: %s", self.model, e)
+            return
+        self.model_instance = compiled
 
     @abstractmethod
     def init_model(self):
@@ -74,6 +190,13 @@ class TransformersLoader(ABC):
         """Transform the input data"""
         pass
 
+    def transform_batch(self, requests: list[TaskReq]) -> list[TaskResp]:
+        """Transform several queued requests, one response per request in the same order"""
+        return [self.transform(request) for request in requests]
+
+    def _error_response(self, error: Exception) -> TaskResp:
+        return TaskResp(worker_id=str(self.worker_id), data={"error": str(error)}, success=False)
+
 
 class EmbeddingTransformersLoader(TransformersLoader):
     """Concrete implementation of TransformersLoader for Embedding models using transformers"""
@@ -87,14 +210,26 @@ class EmbeddingTransformersLoader(TransformersLoader):
             # Load model
             from transformers import AutoModel
 
-            self.model_instance = (
-                AutoModel.from_pretrained(self.model or self.model_path, trust_remote_code=True).to(self.device).eval()
-            )
+            self.compute_dtype = self._select_compute_dtype()
+            self.model_instance = self._from_pretrained(AutoModel).to(self.device).eval()
 
             # Set pad token if not exists
             if self.tokenizer.pad_token is None:
                 self.tokenizer.pad_token = self.tokenizer.eos_token
 
+            # 池化方式由模型决定，加载时解析一次
+            self._pooling_fn = {
+                "mean": self._mean_pooling,
+                "cls": self._cls_pooling,
+                "max": self._max_pooling,
+            }.get(self._get_pooling_strategy(), self._mean_pooling)
+
+            self._compile_model()
+
+            # 输出维度在加载时确定一次；池化后的维度即hidden_size，取不到时才做一次探测前向
+            model_config = getattr(self.model_instance, "config", None)
+            self._embedding_dim = getattr(model_config, "hidden_size", None) or self._get_embedding_dimension()
+
             logger.warning("%Initializing Embedding model: {self.model} from {self.model_path} on {self.device}")
 
         except Exception as e:
@@ -103,42 +238,67 @@ class EmbeddingTransformersLoader(TransformersLoader):
 
     def transform(self, data: TaskReq) -> TaskResp:
         """Transform the input data using the Embedding model"""
-        try:
-            logger.info("%Transforming data with Embedding model: {self.model}")
+        return self.transform_batch([data])[0]
 
-            # Extract data
-            request_data = data.data
-            texts = request_data.get("texts", [])
-            encoding_format = request_data.get("encoding_format", "float")
-            dimension = request_data.get("dimension", self._get_embedding_dimension())
-            normalize_embeddings = request_data.get("normalize_embeddings", True)
-            batch_size = request_data.get("batch_size", 32)
+    def transform_batch(self, requests: list[TaskReq]) -> list[TaskResp]:
+        """Embed several requests in one pass; requests with the same normalize flag share batches"""
+        logger.info("%Transforming data with Embedding model: {self.model}")
 
+        responses: list[Optional[TaskResp]] = [None] * len(requests)
+        groups: dict[bool, list[tuple[int, dict]]] = {}
+        for index, request in enumerate(requests):
+            request_data = request.data or {}
             # Validate input
-            if not texts:
-                raise ValueError("'texts' must be provided and non-empty")
+            if not request_data.get("texts"):
+                responses[index] = self._error_response(ValueError("'texts' must be provided and non-empty"))
+                continue
+            groups.setdefault(request_data.get("normalize_embeddings", True), []).append((index, request_data))
 
-            # Generate embeddings
-            embeddings = self._generate_embeddings(texts, normalize_embeddings, batch_size, dimension)
+        for normalize, members in groups.items():
+            try:
+                # 合并各请求的文本一起推理，截断到目标维度按请求分别处理
+                texts = [text for _, request_data in members for text in request_data["texts"]]
+                batch_size = max(request_data.get("batch_size", 32) for _, request_data in members)
+                embeddings = self._generate_embeddings(texts, normalize, batch_size)
+            except Exception as e:
+                logger.exception("Error in Embedding transform: {e}")
+                for index, _ in members:
+                    responses[index] = self._error_response(e)
+                continue
 
-            # Convert to requested format
-            if encoding_format == "base64":
-                embeddings = self._encode_embeddings_base64(embeddings)
+            offset = 0
+            for index, request_data in members:
+                count = len(request_data["texts"])
+                responses[index] = self._build_response(embeddings[offset : offset + count], request_data)
+                offset += count
 
-            return TaskResp(
-                worker_id=str(self.worker_id),
-                data={
-                    "embeddings": embeddings,
-                    "model": self.model,
-                    "encoding_format": encoding_format,
-                    "dimensions": dimension,
-                },
-                success=True,
-            )
+        return responses
 
-        except Exception as e:
-            logger.exception("Error in Embedding transform: {e}")
-            return TaskResp(worker_id=str(self.worker_id), data={"error": str(e)}, success=False)
+    def _build_response(self, embeddings: np.ndarray, request_data: dict) -> TaskResp:
+        """Truncate and encode one request's slice of the merged embeddings"""
+        encoding_format = request_data.get("encoding_format", "float")
+        dimension = request_data.get("dimension") or self._embedding_dim
+
+        # Truncate to target dimension if specified
+        if dimension and embeddings.shape[1] > dimension:
+            embeddings = embeddings[:, :dimension]
+
+        # Convert to requested format; float arrays are serialized directly by the worker (see _dump_message)
+        if encoding_format == "base64":
+            embeddings = self._encode_embeddings_base64(embeddings)
+        else:
+            embeddings = np.ascontiguousarray(embeddings)
+
+        return TaskResp(
+            worker_id=str(self.worker_id),
+            data={
+                "embeddings": embeddings,
+                "model": self.model,
+                "encoding_format": encoding_format,
+                "dimensions": dimension,
+            },
+            success=True,
+        )
 
     def _adaptive_batch_size(self, total_items: int, available_memory_mb: int | None = None) -> int:
         """根据可用内存动态调整批大小"""
@@ -162,16 +322,23 @@ class EmbeddingTransformersLoader(TransformersLoader):
     @torch.no_grad()
     def _generate_embeddings(
         self, texts: list, normalize: bool = True, batch_size: int = 32, target_dimension: int | None = None
-    ) -> list:
+    ) -> np.ndarray:
         """Generate embeddings using transformers model with batching"""
         batch_size = self._adaptive_batch_size(batch_size)
-        all_embeddings = []
 
-        # Process in batches
-        for i in range(0, len(texts), batch_size):
-            batch_texts = texts[i : i + batch_size]
-            batch_embeddings = self._process_batch(batch_texts, normalize, target_dimension)
-            all_embeddings.extend(batch_embeddings)
+        # 一次性分词（不填充），按长度排序后分批，每批只填充到本批最长序列，减少padding上的无效计算
+        encoded = self.tokenizer(texts, padding=False, truncation=True, max_length=self.max_context_length)
+        order = sorted(range(len(texts)), key=lambda index: len(encoded["input_ids"][index]))
+
+        all_embeddings = None
+        for i in range(0, len(order), batch_size):
+            batch_indices = order[i : i + batch_size]
+            batch_features = [{key: encoded[key][index] for key in encoded} for index in batch_indices]
+            batch_embeddings = self._process_batch(batch_features, normalize, target_dimension)
+            if all_embeddings is None:
+                all_embeddings = np.empty((len(texts), batch_embeddings.shape[1]), dtype=np.float32)
+            # 按原始顺序写回
+            all_embeddings[batch_indices] = batch_embeddings
 
         # 强制清理内存
         self._cleanup_memory()
@@ -188,30 +355,23 @@ class EmbeddingTransformersLoader(TransformersLoader):
             # torch.cuda.ipc_collect()
             # torch.cuda.synchronize()
 
-    def _process_batch(self, batch_texts: list, normalize: bool, target_dimension: int) -> list:
-        """Process a batch of texts"""
-        # Tokenize batch
-        inputs = self.tokenizer(
-            batch_texts, padding=True, truncation=True, max_length=self.max_context_length, return_tensors="pt"
-        )
+    def _process_batch(self, batch_features: list[dict], normalize: bool, target_dimension: int) -> np.ndarray:
+        """Process a batch of pre-tokenized texts"""
+        # Pad batch to its longest sequence
+        inputs = self.tokenizer.pad(batch_features, padding=True, return_tensors="pt")
 
         # Move to device
-        for key in inputs:
-            inputs[key] = inputs[key].to(self.device)
+        inputs = {key: self._to_device(value) for key, value in inputs.items()}
 
         # Get model outputs
-        outputs = self.model_instance(**inputs)
+        with self._autocast():
+            outputs = self.model_instance(**inputs)
+
+        # 池化和归一化在FP32下进行，半精度下的求和/范数会损失精度
+        last_hidden_state = outputs.last_hidden_state.float()
 
         # Apply pooling strategy
-        pooling_strategy = self._get_pooling_strategy()
-        if pooling_strategy == "mean":
-            embeddings = self._mean_pooling(outputs.last_hidden_state, inputs["attention_mask"])
-        elif pooling_strategy == "cls":
-            embeddings = self._cls_pooling(outputs.last_hidden_state)
-        elif pooling_strategy == "max":
-            embeddings = self._max_pooling(outputs.last_hidden_state, inputs["attention_mask"])
-        else:
-            embeddings = self._mean_pooling(outputs.last_hidden_state, inputs["attention_mask"])
+        embeddings = self._pooling_fn(last_hidden_state, inputs["attention_mask"])
 
         # Normalize if requested
         if normalize:
@@ -221,7 +381,7 @@ class EmbeddingTransformersLoader(TransformersLoader):
         if target_dimension and embeddings.size(1) > target_dimension:
             embeddings = embeddings[:, :target_dimension]
 
-        return embeddings.cpu().numpy().tolist()
+        return embeddings.detach().cpu().numpy()
 
     def _get_pooling_strategy(self) -> str:
         """Determine pooling strategy based on model type"""
@@ -237,45 +397,30 @@ class EmbeddingTransformersLoader(TransformersLoader):
 
     def _mean_pooling(self, model_output: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
         """Apply mean pooling to get sentence embeddings"""
-        # Expand attention mask to match model output dimensions
-        input_mask_expanded = attention_mask.unsqueeze(-1).expand(model_output.size()).float()
-
-        # Apply mask and compute mean
-        sum_embeddings = torch.sum(model_output * input_mask_expanded, 1)
-        sum_mask = torch.clamp(input_mask_expanded.sum(1), min=1e-9)
+        # Masked sum as one batched matmul, without materializing a [B, L, H] expanded mask
+        mask = attention_mask.to(model_output.dtype)
+        sum_embeddings = torch.einsum("bl,blh->bh", mask, model_output)
+        sum_mask = mask.sum(dim=1, keepdim=True).clamp(min=1e-9)
 
         return sum_embeddings / sum_mask
 
-    def _cls_pooling(self, model_output: torch.Tensor) -> torch.Tensor:
+    def _cls_pooling(self, model_output: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
         """Use [CLS] token embedding"""
         return model_output[:, 0, :]
 
     def _max_pooling(self, model_output: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
         """Apply max pooling to get sentence embeddings"""
-        # Set masked tokens to large negative value
-        input_mask_expanded = attention_mask.unsqueeze(-1).expand(model_output.size()).float()
-        model_output[input_mask_expanded == 0] = -1e9
+        # Set masked tokens to large negative value (in place, mask broadcast over the hidden dimension)
+        model_output.masked_fill_(attention_mask.unsqueeze(-1) == 0, -1e9)
 
         # Max pooling
         return torch.max(model_output, 1)[0]
 
-    def _encode_embeddings_base64(self, embeddings: list) -> list:
+    def _encode_embeddings_base64(self, embeddings: np.ndarray) -> list:
         """Encode embeddings to base64 format"""
-        import base64
-
-        import numpy as np
-
-        encoded_embeddings = []
-        for embedding in embeddings:
-            # Convert to numpy array and then to bytes
-            np_array = np.array(embedding, dtype=np.float32)
-            bytes_data = np_array.tobytes()
-
-            # Encode to base64
-            encoded = base64.b64encode(bytes_data).decode("utf-8")
-            encoded_embeddings.append(encoded)
-
-        return encoded_embeddings
+        # 整批一次转换为连续的float32数组，每行直接暴露缓冲区，无需逐行构造数组
+        array = np.ascontiguousarray(embeddings, dtype=np.float32)
+        return [base64.b64encode(row).decode("ascii") for row in array]
 
     def _get_embedding_dimension(self) -> int:
         """Get the dimension of embeddings produced by the model"""
@@ -283,19 +428,11 @@ class EmbeddingTransformersLoader(TransformersLoader):
             # Test with a simple input
             test_input = self.tokenizer("test", return_tensors="pt").to(self.device)
 
-            with torch.no_grad():
+            with torch.no_grad(), self._autocast():
                 test_output = self.model_instance(**test_input)
 
                 # Apply same pooling as in transform
-                pooling_strategy = self._get_pooling_strategy()
-                if pooling_strategy == "mean":
-                    test_embedding = self._mean_pooling(test_output.last_hidden_state, test_input["attention_mask"])
-                elif pooling_strategy == "cls":
-                    test_embedding = self._cls_pooling(test_output.last_hidden_state)
-                elif pooling_strategy == "max":
-                    test_embedding = self._max_pooling(test_output.last_hidden_state, test_input["attention_mask"])
-                else:
-                    test_embedding = self._mean_pooling(test_output.last_hidden_state, test_input["attention_mask"])
+                test_embedding = self._pooling_fn(test_output.last_hidden_state, test_input["attention_mask"])
 
                 return test_embedding.size(-1)
 
@@ -307,16 +444,30 @@ class EmbeddingTransformersLoader(TransformersLoader):
 class ReRankTransformersLoader(TransformersLoader):
     """Concrete implementation of TransformersLoader for ReRank models"""
 
+    PROMPT_PREFIX = (
+        "<|im_start|>system\n"
+        "Judge whether the Document meets the requirements based on the Query "
+        'and the Instruct provided. Note that the answer can only be "yes" or "no".'
+        "<|im_end|>\n<|im_start|>user\n"
+    )
+    PROMPT_SUFFIX = "<|im_end|>\n<|im_start|>assistant\n<think>\n\n</think>\n\n"
+
     def init_model(self):
         """Initialize the ReRank model"""
         self.tokenizer = AutoTokenizer.from_pretrained(
             self.model or self.model_path, padding_side="left", trust_remote_code=True
         )
-        self.model_instance = (
-            AutoModelForCausalLM.from_pretrained(self.model or self.model_path, trust_remote_code=True)
-            .to(self.device)
-            .eval()
-        )
+
+        # 前缀/后缀和yes/no的token id是常量，加载时计算一次
+        self._token_false_id = self.tokenizer.convert_tokens_to_ids("no")
+        self._token_true_id = self.tokenizer.convert_tokens_to_ids("yes")
+        self._prefix_tokens = self.tokenizer.encode(self.PROMPT_PREFIX, add_special_tokens=False)
+        self._suffix_tokens = self.tokenizer.encode(self.PROMPT_SUFFIX, add_special_tokens=False)
+        self._max_inner_length = self.max_context_length - len(self._prefix_tokens) - len(self._suffix_tokens)
+        self.compute_dtype = self._select_compute_dtype()
+        self.model_instance = self._from_pretrained(AutoModelForCausalLM).to(self.device).eval()
+
+        self._compile_model()
 
         # Set default instruction if not provided
         if not self.instruction:
@@ -337,206 +488,144 @@ class ReRankTransformersLoader(TransformersLoader):
 
     def transform(self, data: TaskReq) -> TaskResp:
         """Transform the input data using the ReRank model"""
-        try:
-            logger.info("%Transforming data with ReRank model: {self.model}")
+        return self.transform_batch([data])[0]
 
-            # Get task instruction
-            task = self.instruction if self.instruction else self._get_default_instruction()
+    def transform_batch(self, requests: list[TaskReq]) -> list[TaskResp]:
+        """Rerank several requests in one pass, scoring all their pairs together"""
+        logger.info("%Transforming data with ReRank model: {self.model}")
 
-            # Extract data
-            request_data = data.data
+        # Get task instruction
+        task = self.instruction or self._get_default_instruction()
+
+        responses: list[Optional[TaskResp]] = [None] * len(requests)
+        members: list[tuple[int, list, list, int]] = []
+        for index, request in enumerate(requests):
+            request_data = request.data or {}
             queries = request_data.get("query", [])
             documents = request_data.get("documents", [])
-            top_n = request_data.get("top_n", len(documents))
-
             # Validate input
             if not queries or not documents:
-                raise ValueError("Both 'query' and 'documents' must be provided")
+                responses[index] = self._error_response(ValueError("Both 'query' and 'documents' must be provided"))
+                continue
+            count = min(len(queries), len(documents))
+            members.append((index, queries[:count], documents, request_data.get("top_n", len(documents))))
 
+        if not members:
+            return responses
+
+        try:
             # Process reranking
-            scores = self._compute_rerank_scores(task, queries, documents)
+            scores = self._compute_rerank_scores(
+                task,
+                [query for _, queries, _, _ in members for query in queries],
+                [doc for _, queries, documents, _ in members for doc in documents[: len(queries)]],
+            )
+        except Exception as e:
+            logger.exception("Error in ReRank transform: {e}")
+            for index, *_ in members:
+                responses[index] = self._error_response(e)
+            return responses
 
-            # Get top results
-            sorted_results = self._get_top_results(scores, documents, top_n)
+        offset = 0
+        for index, queries, documents, top_n in members:
+            request_scores = scores[offset : offset + len(queries)]
+            offset += len(queries)
 
-            return TaskResp(
+            # Get top results
+            top_indices = self._get_top_results(request_scores, top_n)
+            responses[index] = TaskResp(
                 worker_id=str(self.worker_id),
-                data={"reranked_documents": sorted_results, "scores": scores[:top_n]},
+                data={
+                    "reranked_documents": [documents[i] for i in top_indices],
+                    "scores": [request_scores[i] for i in top_indices],
+                    "indices": top_indices,
+                },
                 success=True,
             )
 
-        except Exception as e:
-            logger.exception("Error in ReRank transform: {e}")
-            return TaskResp(worker_id=str(self.worker_id), data={"error": str(e)}, success=False)
+        return responses
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def _compute_rerank_scores(self, task: str, queries: list, documents: list, batch_size: int = 8) -> list:
         """Compute rerank scores with batching to reduce memory usage"""
-        token_false_id = self.tokenizer.convert_tokens_to_ids("no")
-        token_true_id = self.tokenizer.convert_tokens_to_ids("yes")
-
-        # 预计算前缀和后缀
-        prefix = (
-            "<|im_start|>system\n"
-            "Judge whether the Document meets the requirements based on the Query "
-            'and the Instruct provided. Note that the answer can only be "yes" or "no".'
-            "<|im_end|>\n<|im_start|>user\n"
-        )
-        suffix = "<|im_end|>\n<|im_start|>assistant\n<think>\n\n</think>\n\n"
-
-        prefix_tokens = self.tokenizer.encode(prefix, add_special_tokens=False)
-        suffix_tokens = self.tokenizer.encode(suffix, add_special_tokens=False)
-
-        all_scores = []
-
-        # 分批处理减少内存占用
-        for i in range(0, len(queries), batch_size):
-            batch_queries = queries[i : i + batch_size]
-            batch_documents = documents[i : i + batch_size]
-
-            # 处理当前批次
-            batch_scores = self._process_batch_scores(
-                task, batch_queries, batch_documents, prefix_tokens, suffix_tokens, token_true_id, token_false_id
-            )
-
-            all_scores.extend(batch_scores)
-        return all_scores
-
-    def _process_batch_scores(
-        self,
-        task: str,
-        queries: list,
-        documents: list,
-        prefix_tokens: list,
-        suffix_tokens: list,
-        token_true_id: int,
-        token_false_id: int,
-    ) -> list:
-        """Process a single batch with memory optimization"""
-
-        # 格式化文本对
-        pairs = [self._format_instruction(task, query, doc) for query, doc in zip(queries, documents)]
-
-        # 分词处理
-        max_input_length = self.max_context_length - len(prefix_tokens) - len(suffix_tokens)
-
-        # 直接一次性处理，避免中间步骤
-        encoded = self.tokenizer(
-            pairs,
-            padding=True,
+        # 指令+查询部分每个不同的查询只分词一次，文档一次性批量分词（不填充），再按token拼接；
+        # 拼接点在 "<Document>:" 之后，是预分词边界，结果与整体分词一致
+        heads = {
+            query: self.tokenizer.encode(self._format_instruction(task, query), add_special_tokens=False)
+            for query in dict.fromkeys(queries)
+        }
+        document_ids = self.tokenizer(
+            [" " + doc for doc in documents],
+            padding=False,
             truncation=True,
-            max_length=max_input_length,
-            return_tensors="pt",
+            max_length=self._max_inner_length,
             add_special_tokens=False,
-        )
-
-        # 添加前缀和后缀
-        input_ids = []
-        attention_masks = []
-
-        for i, input_id in enumerate(encoded["input_ids"]):
-            # 构建完整输入
-            full_input = prefix_tokens + input_id.tolist() + suffix_tokens
-
-            # 截断到最大长度
-            if len(full_input) > self.max_context_length:
-                full_input = full_input[: self.max_context_length]
-
-            input_ids.append(full_input)
-            attention_masks.append([1] * len(full_input))
-
-        # Padding
-        max_len = max(len(seq) for seq in input_ids)
-        for i in range(len(input_ids)):
-            pad_len = max_len - len(input_ids[i])
-            input_ids[i] = input_ids[i] + [self.tokenizer.pad_token_id] * pad_len
-            attention_masks[i] = attention_masks[i] + [0] * pad_len
-
-        # 转换为tensor并移动到设备
-        inputs = {
-            "input_ids": torch.tensor(input_ids, device=self.device),
-            "attention_mask": torch.tensor(attention_masks, device=self.device),
-        }
+        )["input_ids"]
+        encoded = [(heads[query] + ids)[: self._max_inner_length] for query, ids in zip(queries, document_ids)]
 
+        # 按长度排序分批，同一批内长度相近，左填充的pad更少；分数按原始顺序写回
+        order = sorted(range(len(encoded)), key=lambda index: len(encoded[index]))
+        all_scores: list = [None] * len(encoded)
         try:
-            # 模型推理
-            with torch.no_grad():
-                outputs = self.model_instance(**inputs)
-                logits = outputs.logits[:, -1, :].detach().cpu()
-
-                # 计算分数
-                scores_tensor = torch.stack([logits[:, token_false_id], logits[:, token_true_id]], dim=1)
-
-                scores_tensor = torch.nn.functional.log_softmax(scores_tensor, dim=1)
-                scores = scores_tensor[:, 1].exp().cpu().tolist()
-
-            return scores
-
+            for i in range(0, len(order), batch_size):
+                batch_indices = order[i : i + batch_size]
+                batch_scores = self._process_batch_scores([encoded[index] for index in batch_indices])
+                for index, score in zip(batch_indices, batch_scores):
+                    all_scores[index] = score
         finally:
-            # 确保清理所有中间变量
-            locals_to_clean = [
-                "inputs",
-                "outputs",
-                "logits",
-                "scores_tensor",
-                "input_ids",
-                "full_input",
-                "input_ids",
-                "attention_masks",
-                "encoded",
-                "pairs",
-                "queries",
-                "documents",
-            ]
-            for var_name in locals_to_clean:
-                if var_name in locals():
-                    del locals()[var_name]
+            # 整个请求结束后清理一次，而不是每个批次都清理
             import gc
 
             gc.collect()
             if torch.cuda.is_available():
                 torch.cuda.empty_cache()
+        return all_scores
 
-    def _format_instruction(self, instruction: str, query: str, doc: str) -> str:
-        """Format instruction template"""
-        return f"<Instruct>: {instruction}\n<Query>: {query}\n<Document>: {doc}"
-
-    def _process_inputs(self, pairs: list, prefix_tokens: list, suffix_tokens: list):
-        """Process input pairs for tokenization"""
-        inputs = self.tokenizer(
-            pairs,
-            padding=False,
-            truncation="longest_first",
-            return_attention_mask=False,
-            max_length=self.max_context_length - len(prefix_tokens) - len(suffix_tokens),
-        )
+    def _process_batch_scores(self, batch_input_ids: list[list[int]]) -> list:
+        """Score one batch of pre-tokenized pairs"""
+        prefix_len = len(self._prefix_tokens)
+        suffix_len = len(self._suffix_tokens)
+        max_inner = max(len(ids) for ids in batch_input_ids)
+        total_len = prefix_len + max_inner + suffix_len
+
+        # 左填充：分数取自最后一个位置的logits，右填充会让短序列读到pad位置
+        # 直接在预分配的数组中按切片写入前缀/正文/后缀，避免逐行拼接列表和嵌套列表转张量
+        input_ids = np.full((len(batch_input_ids), total_len), self.tokenizer.pad_token_id, dtype=np.int64)
+        attention_mask = np.zeros((len(batch_input_ids), total_len), dtype=np.int64)
+        if suffix_len:
+            input_ids[:, total_len - suffix_len :] = self._suffix_tokens
+        for row, ids in enumerate(batch_input_ids):
+            start = max_inner - len(ids)
+            input_ids[row, start : start + prefix_len] = self._prefix_tokens
+            input_ids[row, start + prefix_len : total_len - suffix_len] = ids
+            attention_mask[row, start:] = 1
 
-        for i, ele in enumerate(inputs["input_ids"]):
-            inputs["input_ids"][i] = prefix_tokens + ele + suffix_tokens
+        inputs = {
+            "input_ids": self._to_device(torch.from_numpy(input_ids)),
+            "attention_mask": self._to_device(torch.from_numpy(attention_mask)),
+        }
 
-        inputs = self.tokenizer.pad(inputs, padding=True, return_tensors="pt", max_length=self.max_context_length)
+        with self._autocast():
+            logits = self.model_instance(**inputs).logits[:, -1, :]
+        logits = logits.float()
 
-        for key in inputs:
-            inputs[key] = inputs[key].to(self.model_instance.device)
+        # 计算分数
+        scores_tensor = torch.stack([logits[:, self._token_false_id], logits[:, self._token_true_id]], dim=1)
+        scores_tensor = torch.nn.functional.log_softmax(scores_tensor, dim=1)
+        return scores_tensor[:, 1].exp().cpu().tolist()
 
-        return inputs
+    def _format_instruction(self, instruction: str, query: str) -> str:
+        """Format the instruction template up to the document text"""
+        return f"<Instruct>: {instruction}\n<Query>: {query}\n<Document>:"
 
-    @torch.no_grad()
-    def _compute_logits(self, inputs, token_true_id: int, token_false_id: int) -> list:
-        """Compute relevance scores from model logits"""
-        batch_scores = self.model_instance(**inputs).logits[:, -1, :]
-        true_vector = batch_scores[:, token_true_id]
-        false_vector = batch_scores[:, token_false_id]
-        batch_scores = torch.stack([false_vector, true_vector], dim=1)
-        batch_scores = torch.nn.functional.log_softmax(batch_scores, dim=1)
-        scores = batch_scores[:, 1].exp().tolist()
-        return scores
-
-    def _get_top_results(self, scores: list, documents: list, top_n: int) -> list:
-        """Get top N documents based on scores"""
-        scored_docs = list(zip(scores, documents))
-        scored_docs.sort(key=lambda x: x[0], reverse=True)
-        return [doc for score, doc in scored_docs[:top_n]]
+    def _get_top_results(self, scores: list, top_n: int) -> list[int]:
+        """Get the indices of the top N documents, best first"""
+        neg_scores = -np.asarray(scores, dtype=np.float64)
+        if 0 <= top_n < len(scores):
+            # 只对前N个候选排序：argpartition 为 O(N)，避免对全部文档做完整排序
+            candidates = np.argpartition(neg_scores, top_n)[:top_n]
+            return candidates[np.argsort(neg_scores[candidates], kind="stable")].tolist()
+        return np.argsort(neg_scores, kind="stable")[:top_n].tolist()
 
 
 class ZMQBroker:
@@ -548,8 +637,6 @@ class ZMQBroker:
         self.frontend = None
         self.backend = None
         self._running = False
-        self._worker_addresses = {}  # store worker_id to address mapping
-        self._client_worker_mapping = {}  # store client to worker mapping
 
     def start(self):
         """Start the broker"""
@@ -559,6 +646,9 @@ class ZMQBroker:
             self.backend = self.ctx.socket(zmq.ROUTER)
 
             self.frontend.bind("tcp://*:5555")
+            if TransformersConfig.USE_IPC_FRONTEND:
+                os.makedirs(os.path.dirname(TransformersConfig.FRONTEND_IPC_PATH.removeprefix("ipc://")), exist_ok=True)
+                self.frontend.bind(TransformersConfig.FRONTEND_IPC_PATH)
 
             self.backend.bind("tcp://*:5556")
 
@@ -580,7 +670,7 @@ class ZMQBroker:
         """Main broker loop"""
         while self._running:
             try:
-                socks = dict(self.poller.poll())  # 10 second timeout
+                socks = dict(self.poller.poll(TransformersConfig.POLL_TIMEOUT))
 
                 # client message
                 if self.frontend in socks:
@@ -596,35 +686,24 @@ class ZMQBroker:
     def _handle_client_message(self):
         """Handle message from client"""
         try:
-            # 接收客户端消息
-            client_id, empty, message_data = self.frontend.recv_multipart()
-
-            # 解析任务请求
-            try:
-                message_json = json.loads(message_data.decode("utf-8"))
-                task_req = TaskReq.model_validate(message_json)
-            except Exception as e:
-                traceback.print_exc()
-                logger.exception("Failed to parse client message: {e}")
-                # 发送错误响应给客户端
-                error_resp = TaskResp(worker_id="", data={"error": f"Invalid message format: {str(e)}"}, success=False)
-                self.frontend.send_multipart([client_id, b"", error_resp.model_dump_json().encode("utf-8")])
+            # 接收客户端消息：[client_id, worker_id, "", data]，目标worker放在信封帧中，broker无需解析消息体
+            frames = self.frontend.recv_multipart()
+            if len(frames) != 4:
+                client_id = frames[0]
+                error_resp = TaskResp(worker_id="", data={"error": "Invalid message format"}, success=False)
+                self.frontend.send_multipart([client_id, b"", _dump_message(error_resp)])
                 return
+            client_id, target_worker, _, message_data = frames
 
-            # 根据worker_id进行路由
-            target_worker = task_req.worker_id
             if not target_worker:
                 error_resp = TaskResp(worker_id="", data={"error": "No worker_id specified in request"}, success=False)
-                self.frontend.send_multipart([client_id, b"", error_resp.model_dump_json().encode("utf-8")])
+                self.frontend.send_multipart([client_id, b"", _dump_message(error_resp)])
                 return
 
-            # 存储客户端到worker的映射关系
-            self._client_worker_mapping[target_worker] = client_id
+            # 转发消息给指定的worker，并带上客户端标识，worker回复时原样带回
+            self.backend.send_multipart([target_worker, client_id, b"", message_data])
 
-            # 转发消息给指定的worker
-            self.backend.send_multipart([target_worker.encode("utf-8"), b"", message_data])
-
-            logger.debug("%Routed message from client {client_id.decode()} to worker {target_worker}")
+            logger.debug("Routed message from client %s to worker %s", client_id, target_worker)
 
         except Exception as e:
             logger.exception("Error handling client message: {e}")
@@ -632,19 +711,13 @@ class ZMQBroker:
     def _handle_worker_message(self):
         """Handle message from worker"""
         try:
-            # 接收worker响应
-            worker_id, empty, response_data = self.backend.recv_multipart()
+            # 接收worker响应：[worker_id, client_id, "", data]
+            worker_id, client_id, _, response_data = self.backend.recv_multipart()
 
             # 将响应转发回对应的客户端
-            worker_id_key = worker_id.decode("utf-8")
-            client_id = self._client_worker_mapping.get(worker_id_key, b"client")
             self.frontend.send_multipart([client_id, b"", response_data])
 
-            # 清理映射关系
-            if worker_id_key in self._client_worker_mapping:
-                del self._client_worker_mapping[worker_id_key]
-
-            logger.debug("%Forwarded response from worker {worker_id.decode('utf-8')} to client {client_id}")
+            logger.debug("Forwarded response from worker %s to client %s", worker_id, client_id)
 
         except Exception as e:
             traceback.print_exc()
@@ -668,6 +741,7 @@ class ZMQBroker:
 
     def cleanup(self):
         """Clean up resources"""
+        self.poller = None
         if self.frontend:
             self.frontend.close()
         if self.backend:
@@ -679,9 +753,10 @@ class ZMQBroker:
 class ZMQWorker:
     """ZMQ Worker for processing tasks"""
 
-    def __init__(self, transformer_loader: TransformersLoader):
+    def __init__(self, transformer_loader: TransformersLoader, ready_conn: Optional[Connection] = None):
         self.poller = None
         self.transformer_loader = transformer_loader
+        self.ready_conn = ready_conn  # 就绪后通知父进程
         self.ctx = None
         self.socket = None
         self._running = False
@@ -690,6 +765,7 @@ class ZMQWorker:
     def start(self):
         """Start the worker"""
         try:
+            self._configure_threads()
             self.transformer_loader.init_model()
             self.ctx = zmq.Context()
             self.socket = self.ctx.socket(zmq.DEALER)  # 改为DEALER配合ROUTER broker
@@ -698,7 +774,7 @@ class ZMQWorker:
             self.socket.setsockopt(zmq.IDENTITY, self.transformer_loader.worker_id.encode("utf-8"))
 
             backend_address = self._get_backend_address()
-            self.socket.connect(backend_address)
+            self._connect(backend_address)
 
             self._setup_signal_handlers()
             self._running = True
@@ -707,18 +783,9 @@ class ZMQWorker:
             logger.info("%Worker {self.transformer_loader.worker_id} started and ready")
             self.poller = zmq.Poller()
             self.poller.register(self.socket, zmq.POLLIN)
-            self.socket.send_multipart(
-                [
-                    b"",
-                    TaskResp(
-                        worker_id=self.transformer_loader.worker_id,
-                        data={"status": "ready", "type": "HEALTH_CHECK"},
-                        success=True,
-                    )
-                    .model_dump_json()
-                    .encode("utf-8"),
-                ]
-            )
+            if self.ready_conn is not None:
+                self.ready_conn.send(True)
+                self.ready_conn.close()
             self._run_loop()
 
         except Exception as e:
@@ -727,31 +794,43 @@ class ZMQWorker:
             self.cleanup()
             raise
 
+    def _connect(self, address: str):
+        """Connect to the broker and wait for the ZMTP handshake, after which the broker can route to this worker"""
+        monitor = self.socket.get_monitor_socket(zmq.EVENT_HANDSHAKE_SUCCEEDED)
+        try:
+            self.socket.connect(address)
+            if not monitor.poll(TransformersConfig.CONNECTION_TIMEOUT):
+                raise TimeoutError(f"Worker {self.transformer_loader.worker_id} could not reach broker at {address}")
+            recv_monitor_message(monitor)
+        finally:
+            self.socket.disable_monitor()
+            monitor.close()
+
+    def _configure_threads(self):
+        """Give this worker an equal share of the CPU cores for intra-op parallelism"""
+        threads = max(1, (os.cpu_count() or 1) // TransformersConfig.WORKER_COUNT)
+        torch.set_num_threads(threads)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # 只能在任何并行计算开始前设置一次
+            pass
+        logger.info("Worker %s using %d intra-op threads", self.transformer_loader.worker_id, threads)
+
     def _run_loop(self):
         """Main worker loop"""
         while self._running:
             try:
-                sockets = dict(self.poller.poll())
+                sockets = dict(self.poller.poll(TransformersConfig.POLL_TIMEOUT))
                 if self.socket in sockets:
-                    # 接收消息
-                    _, message_data = self.socket.recv_multipart()
-
-                    try:
-                        message_json = json.loads(message_data.decode("utf-8"))
-                        task_req = TaskReq.model_validate(message_json)
-
-                        # 处理任务
-                        response = self._process_task(task_req)
-
-                        # 发送响应
-                        self.socket.send_multipart([b"", response.model_dump_json().encode("utf-8")])
-
-                    except Exception as e:
-                        logger.exception("Error processing task: {e}")
-                        error_resp = TaskResp(
-                            worker_id=self.transformer_loader.worker_id, data={"error": str(e)}, success=False
-                        )
-                        self.socket.send_multipart([b"", error_resp.model_dump_json().encode("utf-8")])
+                    # 接收消息，并非阻塞地取出已排队的请求，合并为一次推理
+                    messages = [self.socket.recv_multipart()]
+                    while len(messages) < TransformersConfig.MAX_DYNAMIC_BATCH:
+                        try:
+                            messages.append(self.socket.recv_multipart(zmq.NOBLOCK))
+                        except zmq.Again:
+                            break
+                    self._handle_messages(messages)
 
             except zmq.Again:
                 continue
@@ -759,42 +838,78 @@ class ZMQWorker:
                 logger.exception("Error in worker loop: {e}")
                 break
 
-    def _process_task(self, task_req: TaskReq) -> TaskResp:
-        """Process incoming task"""
-        try:
-            # 检查是否为健康检查请求
-            if task_req.data and task_req.data.get("type") == "HEALTH_CHECK":
-                return TaskResp(
-                    worker_id=self.transformer_loader.worker_id,
-                    data={"status": "ready" if self._ready else "not ready"},
-                    success=self._ready,
-                )
+    def _handle_messages(self, messages: list[list[bytes]]):
+        """Parse, process and answer a batch of [client_id, "", payload] messages"""
+        client_ids = []
+        task_reqs = []
+        for client_id, _, message_data in messages:
+            try:
+                task_reqs.append(TaskReq.model_validate_json(message_data))
+                client_ids.append(client_id)
+            except Exception as e:
+                logger.exception("Error processing task: {e}")
+                self.socket.send_multipart([client_id, b"", _dump_message(self._error_response(e))])
 
-            # 检查worker ID匹配
-            if task_req.worker_id != self.transformer_loader.worker_id:
-                logger.warning(
-                    "Worker ID mismatch: expected %s, got %s",
-                    self.transformer_loader.worker_id,
-                    task_req.worker_id,
-                )
-                return TaskResp(
-                    worker_id=self.transformer_loader.worker_id, data={"error": "Worker ID mismatch"}, success=False
-                )
+        # 发送响应
+        for client_id, response in zip(client_ids, self._process_tasks(task_reqs)):
+            try:
+                payload = _dump_message(response)
+            except Exception as e:
+                logger.exception("Error processing task: {e}")
+                payload = _dump_message(self._error_response(e))
+            self.socket.send_multipart([client_id, b"", payload])
+
+    def _process_tasks(self, task_reqs: list[TaskReq]) -> list[TaskResp]:
+        """Process incoming tasks, handing every task that passes the checks to the loader in one batch"""
+        responses = [self._check_task(task_req) for task_req in task_reqs]
+        pending = [index for index, response in enumerate(responses) if response is None]
+        if pending:
+            # 处理实际任务
+            try:
+                results = self.transformer_loader.transform_batch([task_reqs[index] for index in pending])
+            except Exception as e:
+                logger.exception("Error processing task: {e}")
+                # 每个任务各自一份错误响应，下面回填 request_id 时不会互相覆盖
+                results = [self._error_response(e) for _ in pending]
+            for index, result in zip(pending, results):
+                responses[index] = result
+        # 回传请求ID，客户端据此匹配响应
+        for task_req, response in zip(task_reqs, responses):
+            response.request_id = task_req.request_id
+        return responses
+
+    def _check_task(self, task_req: TaskReq) -> Optional[TaskResp]:
+        """Answer health checks and reject tasks this worker cannot run; None means the task should run"""
+        # 检查是否为健康检查请求
+        if task_req.data and task_req.data.get("type") == "HEALTH_CHECK":
+            return TaskResp(
+                worker_id=self.transformer_loader.worker_id,
+                data={"status": "ready" if self._ready else "not ready"},
+                success=self._ready,
+            )
 
-            # 检查worker是否就绪
-            if not self._ready:
-                return TaskResp(
-                    worker_id=self.transformer_loader.worker_id,
-                    data={"error": "Worker is not ready yet"},
-                    success=False,
-                )
+        # 检查worker ID匹配
+        if task_req.worker_id != self.transformer_loader.worker_id:
+            logger.warning(
+                "Worker ID mismatch: expected %s, got %s",
+                self.transformer_loader.worker_id,
+                task_req.worker_id,
+            )
+            return TaskResp(
+                worker_id=self.transformer_loader.worker_id, data={"error": "Worker ID mismatch"}, success=False
+            )
 
-            # 处理实际任务
-            return self.transformer_loader.transform(task_req)
+        # 检查worker是否就绪
+        if not self._ready:
+            return TaskResp(
+                worker_id=self.transformer_loader.worker_id,
+                data={"error": "Worker is not ready yet"},
+                success=False,
+            )
+        return None
 
-        except Exception as e:
-            logger.exception("Error processing task: {e}")
-            return TaskResp(worker_id=self.transformer_loader.worker_id, data={"error": str(e)}, success=False)
+    def _error_response(self, error: Exception) -> TaskResp:
+        return TaskResp(worker_id=self.transformer_loader.worker_id, data={"error": str(error)}, success=False)
 
     def _get_backend_address(self):
         """Get backend address based on platform"""
@@ -818,6 +933,7 @@ class ZMQWorker:
 
     def cleanup(self):
         """Clean up resources"""
+        self.poller = None
         if self.socket:
             self.socket.close()
         if self.ctx:
@@ -827,38 +943,55 @@ class ZMQWorker:
 class ZMQClient:
     """ZMQ Client for sending requests"""
 
-    def __init__(self):
-        self.ctx = None
+    def __init__(self, ctx: Optional[zmq.Context] = None):
+        # 传入共享的context时由调用方负责其生命周期
+        self._owns_ctx = ctx is None
+        self.ctx = ctx
         self.socket = None
 
+    def open(self) -> "ZMQClient":
+        """Create the DEALER socket and connect it to the broker frontend"""
+        if self.ctx is None:
+            self.ctx = zmq.Context()
+        self.socket = self.ctx.socket(zmq.DEALER)
+        # 不设置固定身份，由ZMQ为每个客户端分配唯一标识，并发客户端不会在ROUTER上冲突
+        self.socket.setsockopt(zmq.LINGER, 0)
+        # 连接未建立时不排队，发送直接按SNDTIMEO超时
+        self.socket.setsockopt(zmq.IMMEDIATE, 1)
+        self.socket.setsockopt(zmq.RCVTIMEO, TransformersConfig.CONNECTION_TIMEOUT)
+        self.socket.setsockopt(zmq.SNDTIMEO, TransformersConfig.CONNECTION_TIMEOUT)
+        self.socket.connect(
+            TransformersConfig.FRONTEND_IPC_PATH
+            if TransformersConfig.USE_IPC_FRONTEND
+            else TransformersConfig.FRONTEND_TCP_ADDRESS
+        )
+        return self
+
     @contextmanager
     def connect(self):
         """Context manager for client connection"""
         try:
-            self.ctx = zmq.Context()
-            self.socket = self.ctx.socket(zmq.DEALER)
-            self.socket.setsockopt(zmq.IDENTITY, b"client")
-            self.socket.setsockopt(zmq.RCVTIMEO, TransformersConfig.CONNECTION_TIMEOUT)
-            self.socket.setsockopt(zmq.SNDTIMEO, TransformersConfig.CONNECTION_TIMEOUT)
-            self.socket.connect(TransformersConfig.FRONTEND_TCP_ADDRESS)
-            yield self
+            yield self.open()
         finally:
             self.cleanup()
 
     def send_and_receive(self, message: TaskReq) -> TaskResp:
-        """Send request and receive response"""
+        """Send request and receive the response carrying its request_id"""
         try:
-            self.socket.send_multipart([b"", json.dumps(message.model_dump()).encode("utf-8")])
-            _, data = self.socket.recv_multipart()
-            resp = TaskResp.model_validate(json.loads(data.decode("utf-8")))
-            if resp.worker_id == message.worker_id:
-                logger.debug("%Received valid response from worker {resp.worker_id}")
-                return resp
-            else:
+            if message.request_id is None:
+                message = message.model_copy(update={"request_id": uuid.uuid4().hex})
+            self.socket.send_multipart([(message.worker_id or "").encode("utf-8"), b"", _dump_message(message)])
+            while True:
+                _, data = self.socket.recv_multipart()
+                resp = TaskResp.model_validate_json(data)
+                # broker层的错误响应没有request_id，同样是对本请求的应答
+                if resp.request_id in (message.request_id, None):
+                    logger.debug("Received response from worker %s", resp.worker_id)
+                    return resp
                 logger.debug(
-                    "filtered invalid response due to worker_id mismatch, req_worker_id=%s, resp_worker_id=%s",
-                    message.worker_id,
-                    resp.worker_id,
+                    "filtered stale response, req_request_id=%s, resp_request_id=%s",
+                    message.request_id,
+                    resp.request_id,
                 )
         except zmq.Again:
             raise TimeoutError("Request timeout")
@@ -870,8 +1003,30 @@ class ZMQClient:
         """Clean up resources"""
         if self.socket:
             self.socket.close()
-        if self.ctx:
+            self.socket = None
+        if self.ctx and self._owns_ctx:
             self.ctx.term()
+            self.ctx = None
+
+
+def _run_standby_worker(loader_reader: Connection, ready_writer: Connection):
+    """Entry point of a pre-started worker process: wait for a loader, then serve it"""
+    try:
+        loader = loader_reader.recv()
+    except EOFError:
+        # 管理器关闭了备用进程
+        return
+    finally:
+        loader_reader.close()
+    ZMQWorker(loader, ready_writer).start()
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerSlot:
+    """A worker process and its readiness, as published in the manager's registry"""
+
+    process: multiprocessing.process.BaseProcess
+    ready: bool = False
 
 
 class TransformersManager:
@@ -879,9 +1034,13 @@ class TransformersManager:
 
     def __init__(self):
         self._broker_process = None
-        self._worker_processes = {}
-        self._worker_ready_status = {}  # 跟踪worker就绪状态
+        # 写时复制：写者在_lock内发布新的dict，读者直接读取当前引用，无需加锁
+        self._workers: dict[str, WorkerSlot] = {}
+        self._standby_workers = []  # (process, loader_writer, ready_reader)
         self._lock = threading.Lock()
+        # 进程内共享一个ZMQ context；socket非线程安全，按调用线程缓存客户端，并发请求仍可被worker合批
+        self._zmq_ctx = zmq.Context()
+        self._clients = threading.local()
 
     def start_broker(self):
         """Start broker process"""
@@ -891,7 +1050,7 @@ class TransformersManager:
                 return
 
             try:
-                context = multiprocessing.get_context("spawn")
+                context = _PROCESS_CONTEXT
                 broker = ZMQBroker()
                 self._broker_process = context.Process(target=broker.start, daemon=False, name="transformers-broker")
                 self._broker_process.start()
@@ -901,36 +1060,34 @@ class TransformersManager:
                 time.sleep(1)
                 logger.info("Broker process started")
 
+                self._fill_standby_workers()
+
             except Exception as e:
                 logger.exception("Failed to start broker process: {e}")
 
     def start_worker(self, loader: TransformersLoader, timeout: int = 300):
         """Start worker process and wait for it to be ready"""
         with self._lock:
-            if loader.model in self._worker_processes:
-                process = self._worker_processes[loader.model]
-                if process.is_alive():
+            slot = self._workers.get(loader.model)
+            if slot:
+                if slot.process.is_alive():
                     logger.warning("%Worker process for model {loader.model} already running")
                     return
                 else:
                     # Clean up dead process
-                    del self._worker_processes[loader.model]
+                    self._set_slot(loader.model, None)
 
             try:
-                context = multiprocessing.get_context("spawn")
-                worker = ZMQWorker(loader)
-                process = context.Process(target=worker.start, daemon=False, name=f"worker-{loader.model}")
-                process.start()
-                self._worker_processes[loader.model] = process
-                self._worker_ready_status[loader.model] = False
+                process, ready_reader = self._launch_worker(loader)
+                self._set_slot(loader.model, WorkerSlot(process))
 
                 logger.warning("%Worker process started for model {loader.model}, waiting for ready...")
 
                 # 等待worker就绪
-                if self._wait_for_worker_ready(loader.model, timeout):
-                    self._worker_ready_status[loader.model] = True
-                    time.sleep(1)  # 确保worker稳定
+                if self._wait_for_worker_ready(process, ready_reader, timeout):
+                    self._set_slot(loader.model, WorkerSlot(process, ready=True))
                     logger.info("%Worker for model {loader.model} is ready")
+                    self._fill_standby_workers()
                 else:
                     # 如果worker没有在超时时间内就绪，清理进程
                     logger.exception("Worker for model {loader.model} failed to become ready within {timeout} seconds")
@@ -939,67 +1096,134 @@ class TransformersManager:
 
             except Exception as e:
                 logger.exception("Failed to start worker process for {loader.model}: {e}")
-                if loader.model in self._worker_processes:
-                    self._cleanup_worker(loader.model)
+                self._cleanup_worker(loader.model)
                 raise
 
-    def _wait_for_worker_ready(self, model: str, timeout: int) -> bool:
-        """Wait for worker to become ready"""
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
+    def _launch_worker(self, loader: TransformersLoader) -> tuple[multiprocessing.process.BaseProcess, Connection]:
+        """Hand the loader to a standby process, or start a new worker process when none is available"""
+        while self._standby_workers:
+            process, loader_writer, ready_reader = self._standby_workers.pop()
             try:
-                # 发送健康检查请求
-                with ZMQClient().connect() as client:
-                    # health_req = TaskReq(worker_id=model, data={"type": "HEALTH_CHECK"})
-                    _, data = client.socket.recv_multipart()
-                    response = TaskResp.model_validate(json.loads(data.decode("utf-8")))
-
-                    if response.success and response.data.get("status") == "ready":
-                        self._worker_ready_status[model] = True
-                        logger.warning("%Health check passed for worker {model}")
-                        return True
-
-            except Exception as e:
-                logger.debug("%Health check failed for {model}: {e}")
-
-            time.sleep(1)  # 每秒检查一次
+                if process.is_alive():
+                    loader_writer.send(loader)
+                    return process, ready_reader
+            except OSError as e:
+                logger.warning("Standby worker unusable, discarding: %s", e)
+            finally:
+                loader_writer.close()
+            ready_reader.close()
+            self._terminate_processes([process])
+
+        context = _PROCESS_CONTEXT
+        ready_reader, ready_writer = context.Pipe(duplex=False)
+        worker = ZMQWorker(loader, ready_writer)
+        process = context.Process(target=worker.start, daemon=False, name=f"worker-{loader.model}")
+        process.start()
+        # 父进程不持有写端，worker退出时读端能立即感知到EOF
+        ready_writer.close()
+        return process, ready_reader
+
+    def _fill_standby_workers(self):
+        """Top the standby pool up to TransformersConfig.STANDBY_WORKERS pre-started processes"""
+        try:
+            while len(self._standby_workers) < TransformersConfig.STANDBY_WORKERS:
+                context = _PROCESS_CONTEXT
+                loader_reader, loader_writer = context.Pipe(duplex=False)
+                ready_reader, ready_writer = context.Pipe(duplex=False)
+                process = context.Process(
+                    target=_run_standby_worker,
+                    args=(loader_reader, ready_writer),
+                    daemon=False,
+                    name="transformers-standby-worker",
+                )
+                process.start()
+                loader_reader.close()
+                ready_writer.close()
+                self._standby_workers.append((process, loader_writer, ready_reader))
+        except Exception as e:
+            logger.warning("Failed to start standby worker: %s", e)
+
+    @staticmethod
+    def _terminate_processes(processes: list[multiprocessing.process.BaseProcess]):
+        """SIGTERM all processes at once, then SIGKILL those still alive when the shared grace period ends"""
+        alive = [process for process in processes if process.is_alive()]
+        for process in alive:
+            process.terminate()
+
+        # 所有进程共用一个截止时间，N个进程的最长停止耗时与单个进程相同
+        pending = {process.sentinel: process for process in alive}
+        deadline = time.monotonic() + TransformersConfig.TERMINATE_TIMEOUT
+        while pending and (remaining := deadline - time.monotonic()) > 0:
+            for sentinel in wait(list(pending), remaining):
+                pending.pop(sentinel)
+
+        for process in pending.values():
+            logger.warning("Process %s did not exit after SIGTERM, killing it", process.name)
+            process.kill()
+        for process in alive:
+            process.join(timeout=2)  # 回收退出状态，避免僵尸进程
+
+    def _set_slot(self, model: str, slot: Optional[WorkerSlot]):
+        """Publish a new registry with ``model`` set to ``slot``, or removed when None; callers hold _lock"""
+        workers = dict(self._workers)
+        if slot is None:
+            workers.pop(model, None)
+        else:
+            workers[model] = slot
+        self._workers = workers
 
-        return False
+    def _wait_for_worker_ready(
+        self, process: multiprocessing.process.BaseProcess, ready_reader: Connection, timeout: int
+    ) -> bool:
+        """Block until the worker reports ready, its process exits, or the timeout expires"""
+        try:
+            if ready_reader not in wait([ready_reader, process.sentinel], timeout):
+                return False
+            # worker在就绪前退出时，读端收到EOF
+            return bool(ready_reader.recv())
+        except EOFError:
+            return False
+        finally:
+            ready_reader.close()
 
     def _cleanup_worker(self, model: str):
         """Clean up worker process"""
-        if model in self._worker_processes:
-            process = self._worker_processes[model]
-            if process.is_alive():
-                process.terminate()
-                process.join(timeout=5)
-
-            if process.is_alive():
-                process.kill()
-                process.join(timeout=5)  # 确保清理，避免僵尸进程
-            del self._worker_processes[model]
-
-        if model in self._worker_ready_status:
-            del self._worker_ready_status[model]
+        slot = self._workers.get(model)
+        if slot:
+            self._terminate_processes([slot.process])
+            self._set_slot(model, None)
 
     def send_task(self, model: str, task_data: dict[str, Any]) -> TaskResp:
         """Send task to specific model worker"""
-        if model not in self._worker_processes:
+        slot = self._workers.get(model)
+        if slot is None:
             raise ValueError(f"Worker for model {model} not started")
 
-        process = self._worker_processes[model]
-        if not process.is_alive():
+        if not slot.process.is_alive():
             raise RuntimeError(f"Worker process for model {model} is not running")
 
         # 检查worker是否就绪
-        if not self._worker_ready_status.get(model, False):
+        if not slot.ready:
             raise RuntimeError(f"Worker for model {model} is not ready yet")
 
         task_req = TaskReq(worker_id=model, data=task_data)
 
-        with ZMQClient().connect() as client:
+        client = self._get_client()
+        try:
             return client.send_and_receive(task_req)
+        except zmq.ZMQError:
+            # socket状态未知，关闭后由下一次请求重建
+            client.cleanup()
+            self._clients.client = None
+            raise
+
+    def _get_client(self) -> ZMQClient:
+        """Return the calling thread's cached client, connecting it on first use"""
+        client = getattr(self._clients, "client", None)
+        if client is None:
+            client = ZMQClient(self._zmq_ctx).open()
+            self._clients.client = client
+        return client
 
     def _setup_signal_handlers(self):
         """Setup signal handlers for graceful shutdown"""
@@ -1027,32 +1251,30 @@ class TransformersManager:
     def stop_all(self):
         """Stop all processes"""
         with self._lock:
-            # Stop broker
-            if self._broker_process and self._broker_process.is_alive():
-                self._broker_process.terminate()
-                self._broker_process.join(timeout=5)
-                if self._broker_process.is_alive():
-                    self._broker_process.kill()
-
-            # Stop workers
-            for model, process in self._worker_processes.items():
-                if process.is_alive():
-                    process.terminate()
-                    process.join(timeout=5)
-                    if process.is_alive():
-                        process.kill()
-
-            self._worker_processes.clear()
+            # broker、worker与备用worker一起停止，共用同一个超时
+            processes = [slot.process for slot in self._workers.values()]
+            for process, loader_writer, ready_reader in self._standby_workers:
+                loader_writer.close()
+                ready_reader.close()
+                processes.append(process)
+            if self._broker_process:
+                processes.append(self._broker_process)
+            self._terminate_processes(processes)
+
+            self._workers = {}
+            self._standby_workers.clear()
+
+            # 关闭所有线程缓存的客户端socket，换用新的context
+            self._zmq_ctx.destroy(linger=0)
+            self._zmq_ctx = zmq.Context()
+            self._clients = threading.local()
             logger.info("All processes stopped")
 
     def is_worker_ready(self, model: str) -> bool:
         """Check if worker is ready"""
-        return self._worker_ready_status.get(model, False)
+        slot = self._workers.get(model)
+        return bool(slot and slot.ready and slot.process.is_alive())
 
     def get_worker_status(self) -> dict[str, dict[str, bool]]:
         """Get status of all workers"""
-        with self._lock:
-            return {
-                model: {"alive": process.is_alive(), "ready": self._worker_ready_status.get(model, False)}
-                for model, process in self._worker_processes.items()
-            }
+        return {model: {"alive": slot.process.is_alive(), "ready": slot.ready} for model, slot in self._workers.items()}
@@ -25,6 +25,11 @@ try:
 except Exception as e:
     pass
 
+# The transformation class hangs off the enum member: Enum.__hash__ is Python-level, so a dict lookup by member
+# pays for it on every call while an attribute read does not
+for _provider_type, _transformation_cls in LLMTransformations.items():
+    _provider_type._transformation_cls = _transformation_cls
+
 
 def get_llm_transformation(provider_type: ProviderSDKType) -> type[LLMTransformation]:
     """Get the LLM transformation class based on the provider type.
@@ -33,4 +38,5 @@ def get_llm_transformation(provider_type: ProviderSDKType) -> type[LLMTransforma
     Returns:
         type[LLMTransformation]: The LLM transformation class.
     """
-    return LLMTransformations.get(provider_type, OpenAILikeTransformation)
+    # Unregistered members and sdk_type strings fall back to OpenAILikeTransformation
+    return getattr(provider_type, "_transformation_cls", OpenAILikeTransformation)
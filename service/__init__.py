@@ -1,12 +1,4 @@
-from .api_key_service import ApiKeyService
-from .claude_completion_service import ClaudeCompletionService
-from .completion_service import CompletionService
-from .conversation_message_service import ConversationMessageService
-from .file_service import FileService
-from .knowledge_base_service import KnowledgeBaseService
-from .model_service import ModelService
-from .provider_service import ProviderService
-from .response_service import ResponseService
+"""Service package; services are imported on first access so importing one submodule does not load them all."""
 
 __all__ = [
     "ApiKeyService",
@@ -19,3 +11,43 @@ __all__ = [
     "ProviderService",
     "ResponseService",
 ]
+
+
+def __getattr__(name: str):
+    if name == "ApiKeyService":
+        from .api_key_service import ApiKeyService
+
+        return ApiKeyService
+    if name == "ClaudeCompletionService":
+        from .claude_completion_service import ClaudeCompletionService
+
+        return ClaudeCompletionService
+    if name == "CompletionService":
+        from .completion_service import CompletionService
+
+        return CompletionService
+    if name == "ConversationMessageService":
+        from .conversation_message_service import ConversationMessageService
+
+        return ConversationMessageService
+    if name == "FileService":
+        from .file_service import FileService
+
+        return FileService
+    if name == "KnowledgeBaseService":
+        from .knowledge_base_service import KnowledgeBaseService
+
+        return KnowledgeBaseService
+    if name == "ModelService":
+        from .model_service import ModelService
+
+        return ModelService
+    if name == "ProviderService":
+        from .provider_service import ProviderService
+
+        return ProviderService
+    if name == "ResponseService":
+        from .response_service import ResponseService
+
+        return ResponseService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,7 +3,7 @@ from typing import Any, Optional
 from models.api_key import ApiKey
 from models.auth_user import User
 from models.engine import get_db
-from utils.api_key import generate_api_key, hash_api_key, verify_api_key
+from utils.api_key import generate_api_key, hash_api_key
 
 from .error.error import ApiKeyNotFound
 
@@ -19,23 +19,22 @@ class ApiKeyService:
         validate the api key
         """
         with get_db() as session:
-            api_Key_model = session.query(ApiKey).filter(ApiKey.hash_key == api_hash_key).first()
-            if not api_Key_model:
-                raise ApiKeyNotFound("Api Key not correct")
-            if api_Key_model.hash_key != api_hash_key:
-                raise ApiKeyNotFound("Api Key not correct")
-            if verify_api_key(api_Key_model.api_key, api_hash_key):
-                user: User = session.query(User).filter(User.id == api_Key_model.user_id).first()
-                if not user:
-                    raise ApiKeyNotFound("Api Key not correct")
-                else:
-                    return {
-                        "user_id": str(user.id),
-                        "username": user.username,
-                        "user_type": user.user_type,
-                    }
-            else:
-                raise ApiKeyNotFound("Api Key not correct")
+            # hash_key is unique, so one joined query finds the key and its bound user
+            row = (
+                session.query(User.id, User.username, User.user_type)
+                .select_from(ApiKey)
+                .join(User, User.id == ApiKey.user_id)
+                .filter(ApiKey.hash_key == api_hash_key)
+                .first()
+            )
+        # The row matched the presented hash exactly; the stored raw key is no longer bcrypt-checked per request
+        if not row:
+            raise ApiKeyNotFound("Api Key not correct")
+        return {
+            "user_id": str(row.id),
+            "username": row.username,
+            "user_type": row.user_type,
+        }
 
     @staticmethod
     def create_api_key(name: str, description: Optional[str]) -> ApiKey:
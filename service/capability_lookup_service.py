@@ -101,7 +101,7 @@ class CapabilityLookupService:
 
     @classmethod
     def _lookup_skills(cls) -> list[dict[str, Any]]:
-        tool_manager = ToolManager()
+        tool_manager = ToolManager.get_instance()
         skill_controller = tool_manager.get_skill_controller()
         if not skill_controller:
             return []
@@ -6,11 +6,19 @@ from starlette.responses import StreamingResponse
 
 from configs import config
 from runtime.entities.llm_entities import CompletionResponse, LLMRequest
-from utils import RateLimit
+from utils import SSE_DONE, RateLimit, sse_data
 
 logger = logging.getLogger(__name__)
 
 
+def _sse_iter(response: Generator[CompletionResponse, None, None]) -> Generator[bytes, None, None]:
+    for chunk in response:
+        if chunk.done:
+            yield SSE_DONE
+        else:
+            yield sse_data(chunk)
+
+
 class CompletionService:
     @classmethod
     async def create_completion(cls, req: LLMRequest) -> Optional[Any]:
@@ -21,9 +29,9 @@ class CompletionService:
         :return: A response object containing the completion result, or a streaming response if requested.
         """
         rate_limit: RateLimit = RateLimit(config.APP_NAME, config.APP_MAX_REQUESTS)
-        request_id = rate_limit.gen_request_key()
+        # With rate limiting off, enter returns a fixed request_id without building a key or touching Redis
+        request_id = rate_limit.enter()
         try:
-            rate_limit.enter(request_id)
             response = await cls._completion(req)
             return rate_limit.generate(await cls.convert_to_stream(response, req), request_id)
         except Exception:
@@ -45,7 +53,7 @@ class CompletionService:
         from runtime.callbacks.message_record_callback import MessageRecordCallback
         from runtime.model_manager import ModelManager
 
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_model_instance(model_name=req.model)
         model_instance.model_instance.user_id = get_current_user_id()
         return await model_instance.invoke_llm(
@@ -62,15 +70,6 @@ class CompletionService:
         :param req: The request object containing parameters for completion.
         :return: A StreamingResponse if the request is a stream, otherwise the response object.
         """
-        if req.stream:
-
-            def handle() -> Generator[bytes, None, None]:
-                for chunk in response:
-                    if chunk.done:
-                        yield "data: [DONE]\n\n"
-                    else:
-                        yield f"data: {chunk.model_dump_json(exclude_none=True)}\n\n"
-
-            return StreamingResponse(handle(), media_type="text/event-stream")
-        else:
+        if not req.stream:
             return response
+        return StreamingResponse(_sse_iter(response), media_type="text/event-stream")
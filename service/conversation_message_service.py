@@ -16,32 +16,29 @@ class ConversationMessageService:
         """
         with get_db() as session:
             session.add(message)
-            session.commit()
-
             if message.usage:
-                with get_db() as session2:
-                    llm_usage = LLMUsage.model_validate(obj=json.loads(message.usage))
-                    usage = MessageTokenUsage(
-                        agent_id=message.agent_id,
-                        agent_session_id=message.agent_session_id,
-                        message_id=message.message_id,
-                        model_name=message.model_name,
-                        provider_name=message.provider_name,
-                        prompt_tokens=llm_usage.prompt_tokens,
-                        completion_tokens=llm_usage.completion_tokens,
-                        total_tokens=llm_usage.total_tokens,
-                        prompt_unit_price=llm_usage.prompt_unit_price,
-                        prompt_price=llm_usage.prompt_price,
-                        completion_unit_price=llm_usage.completion_unit_price,
-                        completion_price=llm_usage.completion_price,
-                        total_price=llm_usage.total_price,
-                        cached_prompt_tokens=llm_usage.cached_tokens,
-                        cache_price=llm_usage.cache_price,
-                        thinking_tokens=llm_usage.thinking_tokens,
-                        thinking_price=llm_usage.thinking_price,
-                    )
-                    session2.add(usage)
-                    session2.commit()
+                llm_usage = LLMUsage.model_validate(obj=json.loads(message.usage))
+                usage = MessageTokenUsage(
+                    agent_id=message.agent_id,
+                    agent_session_id=message.agent_session_id,
+                    message_id=message.message_id,
+                    model_name=message.model_name,
+                    provider_name=message.provider_name,
+                    prompt_tokens=llm_usage.prompt_tokens,
+                    completion_tokens=llm_usage.completion_tokens,
+                    total_tokens=llm_usage.total_tokens,
+                    prompt_unit_price=llm_usage.prompt_unit_price,
+                    prompt_price=llm_usage.prompt_price,
+                    completion_unit_price=llm_usage.completion_unit_price,
+                    completion_price=llm_usage.completion_price,
+                    total_price=llm_usage.total_price,
+                    cached_prompt_tokens=llm_usage.cached_tokens,
+                    cache_price=llm_usage.cache_price,
+                    thinking_tokens=llm_usage.thinking_tokens,
+                    thinking_price=llm_usage.thinking_price,
+                )
+                session.add(usage)
+            session.commit()
         return message
 
     @classmethod
@@ -58,12 +55,14 @@ class ConversationMessageService:
         :return: None
         """
         with get_db() as session:
-            message = session.query(ConversationMessage).filter(ConversationMessage.message_id == message_id).first()
-            if not message:
+            updated = (
+                session.query(ConversationMessage)
+                .filter(ConversationMessage.message_id == message_id)
+                .update({ConversationMessage.state: state}, synchronize_session=False)
+            )
+            if not updated:
                 raise ValueError(f"Message with id {message_id} not found.")
-            message.state = state
             session.commit()
-            session.refresh(message)
 
     @classmethod
     def get_context_length(cls, agent_id, session_id):
@@ -29,7 +29,7 @@ class DocumentService:
 
         from runtime.model_manager import ModelManager
 
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_model_instance(model_name=req.model)
         return model_instance.invoke_text_embedding(texts=req)
 
@@ -75,6 +75,6 @@ class DocumentService:
         else:
             from runtime.model_manager import ModelManager
 
-            model_manager = ModelManager()
+            model_manager = ModelManager.get_instance()
             model_instance = model_manager.get_model_instance(model_name=query.model)
             return model_instance.invoke_rerank(query=query)
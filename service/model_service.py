@@ -1,10 +1,16 @@
-import json
 import logging
+from decimal import Decimal
+from functools import lru_cache
 from typing import Optional
 
+import orjson
+from sqlalchemy import bindparam, cast, exists, insert, literal, select
+from sqlalchemy.orm import Session, joinedload
+
 from controllers.params import CreateModelRequest, ModelCard, ModelList
+from libs.cache import in_memory_model_cache
 from models import Provider
-from models.engine import get_db
+from models.engine import get_db, reuse_db
 from models.model import Model
 from runtime.entities.model_entities import AIModelEntity, ModelFeature, ModelType, PriceConfig
 
@@ -12,29 +18,87 @@ from .error.error import ModelNotFound, ModelProviderNotFound
 
 logger = logging.getLogger(__name__)
 
+# Look enum members up by value directly, skipping Enum.__call__ dispatch
+_MODEL_FEATURES: dict[str, ModelFeature] = {feature.value: feature for feature in ModelFeature}
+
+
+# Every column an AIModelEntity is built from; unchanged column values reuse the entity already built
+_AI_MODEL_COLUMNS = (
+    Model.name,
+    Model.type,
+    Model.feature,
+    Model.model_params,
+    Model.input_price,
+    Model.output_price,
+    Model.currency,
+)
+# Fixed-shape statements are built once at import; calls only bind parameters
+_SELECT_AI_MODEL_BY_NAME = select(*_AI_MODEL_COLUMNS).where(Model.name == bindparam("model_name")).limit(1)
+_SELECT_AI_MODELS_BY_PROVIDER = select(*_AI_MODEL_COLUMNS).where(Model.provider_name == bindparam("provider_name"))
+
+
+def _dumps(obj) -> str:
+    # Like json.dumps, non-str keys (e.g. int) become strings instead of raising; the column is Text, so decode once
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
-def get_model_features(model: Model) -> list[ModelFeature]:
+# Server default of the price columns. Inserts bind every value, so unset prices are filled in here
+# instead of being written as NULL.
+_DEFAULT_PRICE = Decimal(0)
+
+
+def _model_values(req: CreateModelRequest) -> dict:
     """
-    Get model features
-    :param model: Model
-    :return: list[ModelFeature]
+    Column values of a new model row, except provider_id
     """
-    if not model.feature:
-        return []
-    return [ModelFeature(feature) for feature in json.loads(model.feature)]
+    return {
+        "name": req.model_name,
+        "provider_name": req.provider_name,
+        "type": req.model_type,
+        "max_tokens": req.max_tokens,
+        "model_params": _dumps(req.model_configs),
+        "feature": _dumps(req.model_feature),
+        "input_price": _DEFAULT_PRICE if req.input_price is None else req.input_price,
+        "output_price": _DEFAULT_PRICE if req.output_price is None else req.output_price,
+    }
+
+
+@lru_cache(maxsize=512)
+def _build_ai_model_entity(
+    name: str,
+    model_type: str,
+    feature: Optional[str],
+    model_params: Optional[str],
+    input_price: Optional[Decimal],
+    output_price: Optional[Decimal],
+    currency: Optional[str],
+) -> AIModelEntity:
+    """
+    Build an AIModelEntity from model columns, cached by the column values.
+    The values come from our own table, so pydantic validation is skipped; callers must not mutate the result.
+    """
+    return AIModelEntity.model_construct(
+        model=name,
+        model_type=ModelType.value_of(model_type),
+        features=[_MODEL_FEATURES[item] for item in orjson.loads(feature)] if feature else [],
+        model_properties=orjson.loads(model_params),
+        parameter_rules=[],
+        pricing=PriceConfig.model_construct(input=input_price, output=output_price, currency=currency or "USD"),
+        deprecated=False,
+    )
 
 
 class ModelService:
     @staticmethod
-    def get_model(model_name: str) -> Optional[Model]:
+    def get_model(model_name: str, session: Optional[Session] = None) -> Optional[Model]:
         """
         Get model by name.
         :param model_name: model name
-        :param session: database session
+        :param session: database session to reuse, a new one is opened when omitted
         :return: model
         """
-        with get_db() as session:
-            model = session.query(Model).filter_by(name=model_name).first()
+        with reuse_db(session) as session:
+            model = session.query(Model).options(joinedload(Model.provider)).filter_by(name=model_name).first()
             if not model:
                 logger.error(f"Model {model_name} not found")
                 raise ModelNotFound("Model " + model_name + " not found")
@@ -48,21 +112,29 @@ class ModelService:
         :return: model
         """
         with get_db() as session:
-            model = session.query(Model).filter_by(id=model_id).first()
+            model = session.get(Model, model_id)
             if not model:
                 raise ModelNotFound("Model not found")
         return model
 
     @staticmethod
-    def get_model_by_provider(model_name: str, provider_name: str) -> Optional[Model]:
+    def get_model_by_provider(
+        model_name: str, provider_name: str, session: Optional[Session] = None
+    ) -> Optional[Model]:
         """
         Get model by name and provider.
         :param model_name: model name
         :param provider_name: provider name
+        :param session: database session to reuse, a new one is opened when omitted
         :return: model
         """
-        with get_db() as session:
-            model = session.query(Model).filter_by(name=model_name, provider_name=provider_name).first()
+        with reuse_db(session) as session:
+            model = (
+                session.query(Model)
+                .options(joinedload(Model.provider))
+                .filter_by(name=model_name, provider_name=provider_name)
+                .first()
+            )
             if not model:
                 raise ModelNotFound("Model not found")
         return model
@@ -74,28 +146,68 @@ class ModelService:
         :param req: CreateModelRequest
         :return: model
         """
+        values = _model_values(req)
+        columns = Model.__table__.c
+        # The provider id is resolved in the database and an existing model is not inserted again: one round trip
+        stmt = (
+            insert(Model)
+            .from_select(
+                [*values, "provider_id"],
+                select(
+                    *(cast(literal(value), columns[key].type) for key, value in values.items()),
+                    Provider.id,
+                ).where(
+                    Provider.name == req.provider_name,
+                    ~exists().where(Model.name == req.model_name, Model.provider_name == req.provider_name),
+                ),
+            )
+            .returning(Model)
+        )
+        with get_db() as session:
+            model = session.scalars(stmt).first()
+            if model is None:
+                if not session.query(exists().where(Provider.name == req.provider_name)).scalar():
+                    raise ModelProviderNotFound("Provider not found")
+                return None
+            session.commit()
+            in_memory_model_cache.flush_cache()
+        return model
+
+    @staticmethod
+    def create_models(reqs: list[CreateModelRequest]) -> list[Model]:
+        """
+        Create models in one transaction, skipping ones that already exist.
+        :param reqs: list of CreateModelRequest
+        :return: created models
+        """
         with get_db() as session:
-            provider: Optional[Provider] = session.query(Provider).filter_by(name=req.provider_name).first()
-            if not provider:
-                raise ModelProviderNotFound("Provider not found")
-            existing_model = (
-                session.query(Model).filter_by(name=req.model_name, provider_name=req.provider_name).first()
+            provider_names = {req.provider_name for req in reqs}
+            provider_ids = dict(
+                session.execute(select(Provider.name, Provider.id).where(Provider.name.in_(provider_names))).all()
             )
-            if not existing_model:
-                model = Model(
-                    name=req.model_name,
-                    provider_name=req.provider_name,
-                    type=req.model_type,
-                    max_tokens=req.max_tokens,
-                    model_params=json.dumps(req.model_configs),
-                    feature=json.dumps(req.model_feature),
-                    input_price=req.input_price,
-                    output_price=req.output_price,
-                    provider_id=provider.id,
-                )
-                session.add(model)
-                session.commit()
-                return model
+            missing = provider_names - provider_ids.keys()
+            if missing:
+                raise ModelProviderNotFound("Provider not found: " + ", ".join(sorted(missing)))
+
+            seen = set(
+                session.execute(
+                    select(Model.name, Model.provider_name).where(Model.name.in_({req.model_name for req in reqs}))
+                ).all()
+            )
+            rows = []
+            for req in reqs:
+                key = (req.model_name, req.provider_name)
+                if key in seen:
+                    continue
+                seen.add(key)
+                rows.append({**_model_values(req), "provider_id": provider_ids[req.provider_name]})
+            if not rows:
+                return []
+            # SQLAlchemy batches the multi-row INSERT ... RETURNING into a few statements (insertmanyvalues)
+            models = list(session.scalars(insert(Model).returning(Model), rows))
+            session.commit()
+            in_memory_model_cache.flush_cache()
+        return models
 
     @staticmethod
     def delete_model(model_name: str) -> Optional[Model]:
@@ -111,6 +223,7 @@ class ModelService:
                 return None
             session.delete(model)
             session.commit()
+            in_memory_model_cache.flush_cache()
         return model
 
     @staticmethod
@@ -120,45 +233,35 @@ class ModelService:
         :return: list of models
         """
         with get_db() as session:
-            models = session.query(Model).all()
-            if not models:
-                return None
-            models = [
-                ModelCard(
-                    id=model.provider_name + "/" + model.name,
-                    root=model.provider_name + "/" + model.name,
-                    object="model",
-                    created=int(model.created_at.timestamp()),
-                    owned_by=model.provider_name,
-                    max_model_len=model.max_tokens,
-                )
-                for model in models
-            ]
-            return ModelList(object="list", data=models)
+            # Select only the listed columns instead of building ORM entities
+            rows = session.execute(select(Model.name, Model.provider_name, Model.created_at, Model.max_tokens)).all()
+        if not rows:
+            return None
+        # The values come from our own table, so pydantic validation is skipped
+        models = [
+            ModelCard.model_construct(
+                id=provider_name + "/" + name,
+                root=provider_name + "/" + name,
+                object="model",
+                created=int(created_at.timestamp()),
+                owned_by=provider_name,
+                max_model_len=max_tokens,
+            )
+            for name, provider_name, created_at, max_tokens in rows
+        ]
+        return ModelList.model_construct(object="list", data=models)
 
     @staticmethod
-    def get_ai_models(provider_name: str) -> Optional[list[AIModelEntity]]:
+    def get_ai_models(provider_name: str, session: Optional[Session] = None) -> Optional[list[AIModelEntity]]:
         """
         Get all AI models.
+        :param provider_name: provider name
+        :param session: database session to reuse, a new one is opened when omitted
         :return: list of AI models
         """
-        with get_db() as session:
-            models = session.query(Model).filter_by(provider_name=provider_name).all()
-            if not models:
-                return []
-            return [
-                AIModelEntity(
-                    model=model.name,
-                    model_type=ModelType.value_of(model.type),
-                    features=get_model_features(model),
-                    model_properties=json.loads(model.model_params),
-                    max_context_length=model.max_context_length,
-                    parameter_rules=[],
-                    pricing=PriceConfig(input=model.input_price, output=model.output_price),
-                    deprecated=False,
-                )
-                for model in models
-            ]
+        with reuse_db(session) as session:
+            rows = session.execute(_SELECT_AI_MODELS_BY_PROVIDER, {"provider_name": provider_name}).all()
+        return [_build_ai_model_entity(*row) for row in rows]
 
     @staticmethod
     def get_ai_model(model_name: str) -> Optional[AIModelEntity]:
@@ -168,29 +271,35 @@ class ModelService:
         :param provider_name: provider name
         :return: AIModelEntity
         """
+        # Every inference looks the model up by name; the model cache is flushed when models change
+        cache_key = f"ai_model:{model_name}"
+        ai_model = in_memory_model_cache.get_cache(cache_key)
+        if ai_model:
+            return ai_model
+
         with get_db() as session:
-            model = session.query(Model).filter_by(name=model_name).first()
-            if not model:
-                return None
-            return AIModelEntity(
-                model=model.name,
-                model_type=ModelType.value_of(model.type),
-                features=get_model_features(model),
-                model_properties=json.loads(model.model_params),
-                parameter_rules=[],
-                pricing=PriceConfig(input=model.input_price, output=model.output_price, currency=model.currency),
-                deprecated=False,
-            )
+            row = session.execute(_SELECT_AI_MODEL_BY_NAME, {"model_name": model_name}).first()
+        if not row:
+            return None
+        ai_model = _build_ai_model_entity(*row)
+        in_memory_model_cache.set_cache(cache_key, ai_model)
+        return ai_model
 
     @classmethod
-    def get_default_model(cls, model_type: str) -> Model:
+    def get_default_model(cls, model_type: str, session: Optional[Session] = None) -> Model:
         """
         Get default model by type.
         :param model_type: model type
+        :param session: database session to reuse, a new one is opened when omitted
         :return: model
         """
-        with get_db() as session:
-            model = session.query(Model).filter_by(type=model_type, default=1).one_or_none()
+        with reuse_db(session) as session:
+            model = (
+                session.query(Model)
+                .options(joinedload(Model.provider))
+                .filter_by(type=model_type, default=1)
+                .one_or_none()
+            )
             if not model:
                 raise ModelNotFound("Model not found")
         return model
@@ -1,21 +1,24 @@
 import json
 from typing import Optional
 
-from models.engine import get_db
+from sqlalchemy.orm import Session
+
+from libs.cache import in_memory_model_cache
+from models.engine import get_db, reuse_db
 from models.provider import Provider
 from service.error.error import ModelProviderNotFound
 
 
 class ProviderService:
     @staticmethod
-    def get_provider(provider_name: str) -> Optional[Provider]:
+    def get_provider(provider_name: str, session: Optional[Session] = None) -> Optional[Provider]:
         """
         Get provider by name.
         :param provider_name: provider name
-        :param session: database session
+        :param session: database session to reuse, a new one is opened when omitted
         :return: provider
         """
-        with get_db() as session:
+        with reuse_db(session) as session:
             provider = session.query(Provider).filter(Provider.name == provider_name).first()
             if not provider:
                 raise ModelProviderNotFound("Provider not found")
@@ -47,6 +50,7 @@ class ProviderService:
             )
             session.add(provider)
             session.commit()
+            in_memory_model_cache.flush_cache()
         return provider
 
     @staticmethod
@@ -63,4 +67,5 @@ class ProviderService:
                 return None
             session.delete(provider)
             session.commit()
+            in_memory_model_cache.flush_cache()
         return provider
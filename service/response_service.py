@@ -1,6 +1,6 @@
 import logging
 from collections.abc import Generator
-from typing import Any, Union
+from typing import Any, Optional, Union
 from uuid import uuid4
 
 from starlette.responses import StreamingResponse
@@ -17,7 +17,7 @@ from runtime.entities.response_entities import (
     ResponseTextDeltaEvent,
     TextContentBlock,
 )
-from utils import RateLimit
+from utils import RateLimit, sse_data
 
 logger = logging.getLogger(__name__)
 
@@ -31,10 +31,9 @@ class ResponseService:
         previous_response_id for multi-turn context reconstruction.
         """
         rate_limit = RateLimit(config.APP_NAME, config.APP_MAX_REQUESTS)
-        request_id = rate_limit.gen_request_key()
+        # With rate limiting off, enter returns a fixed request_id without building a key or touching Redis
+        request_id = rate_limit.enter()
         try:
-            rate_limit.enter(request_id)
-
             # 1. Pre-generate stable response ID
             response_id = f"resp_{uuid4().hex[:20]}"
 
@@ -164,7 +163,7 @@ class ResponseService:
         from runtime.callbacks.message_record_callback import MessageRecordCallback
         from runtime.model_manager import ModelManager
 
-        model_manager = ModelManager()
+        model_manager = ModelManager.get_instance()
         model_instance = model_manager.get_model_instance(model_name=req.model)
         model_instance.model_instance.user_id = get_current_user_id()
         result = await model_instance.invoke_llm(
@@ -184,29 +183,34 @@ class ResponseService:
         Convert the response to a streaming response if the request requires it.
         Accumulates output text and persists to DB after stream completes.
         """
-        if req.stream:
-
-            def handle() -> Generator[bytes, None, None]:
-                accumulated_text = ""
-                last_model = req.model
-                for chunk in response:
-                    if isinstance(chunk, ResponseDoneEvent):
-                        if response_id and full_input is not None:
-                            cls._store_response(req, response_id, full_input, chunk.response)
-                        last_model = chunk.response.model or last_model
-                        yield f"data: {chunk.model_dump_json(exclude_none=True)}\n\n"
-                        continue
-
-                    if hasattr(chunk, "response") and getattr(chunk.response, "model", None):
-                        last_model = chunk.response.model
-                    elif hasattr(chunk, "model") and chunk.model:
-                        last_model = chunk.model
-
-                    if isinstance(chunk, ResponseTextDeltaEvent):
-                        accumulated_text += chunk.delta or ""
-
-                    yield f"data: {chunk.model_dump_json(exclude_none=True)}\n\n"
-
-            return StreamingResponse(handle(), media_type="text/event-stream")
-        else:
+        if not req.stream:
             return response
+        return StreamingResponse(cls._sse_iter(response, req, response_id, full_input), media_type="text/event-stream")
+
+    @classmethod
+    def _sse_iter(
+        cls,
+        response: Generator,
+        req: ResponseRequest,
+        response_id: Optional[str],
+        full_input: Optional[list[ResponseInputItem]],
+    ) -> Generator[bytes, None, None]:
+        accumulated_text = ""
+        last_model = req.model
+        for chunk in response:
+            if isinstance(chunk, ResponseDoneEvent):
+                if response_id and full_input is not None:
+                    cls._store_response(req, response_id, full_input, chunk.response)
+                last_model = chunk.response.model or last_model
+                yield sse_data(chunk)
+                continue
+
+            if hasattr(chunk, "response") and getattr(chunk.response, "model", None):
+                last_model = chunk.response.model
+            elif hasattr(chunk, "model") and chunk.model:
+                last_model = chunk.model
+
+            if isinstance(chunk, ResponseTextDeltaEvent):
+                accumulated_text += chunk.delta or ""
+
+            yield sse_data(chunk)
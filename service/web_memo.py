@@ -1,8 +1,12 @@
 import datetime
 import json
 import logging
-from typing import Any, Optional
+from typing import Any
 
+import anyio
+from sqlalchemy import event
+
+from libs.cache import in_memory_api_key_cache
 from models import ApiKey, get_db
 from models.browser import BrowserHistory
 from service import FileService
@@ -11,8 +15,41 @@ from utils import random_uuid
 
 logger = logging.getLogger(__name__)
 
+MCP_API_KEY_SOURCE = "aduib_mcp_server"
+_MCP_API_KEY_CACHE_KEY = f"api_key_hash:{MCP_API_KEY_SOURCE}"
+
+
+@event.listens_for(ApiKey, "after_insert")
+@event.listens_for(ApiKey, "after_update")
+@event.listens_for(ApiKey, "after_delete")
+def _invalidate_api_key_cache(mapper, connection, target) -> None:
+    # Any api key write in this process flushes the cache; other processes rely on the TTL
+    in_memory_api_key_cache.flush_cache()
+
 
 class WebMemoService:
+    @staticmethod
+    def get_mcp_api_key_hash() -> str:
+        """
+        Get the hash key of the crawl service api key, cached so web memo requests skip the api_key lookup
+        """
+        api_key_hash = in_memory_api_key_cache.get_cache(_MCP_API_KEY_CACHE_KEY)
+        if api_key_hash:
+            return api_key_hash
+
+        with get_db() as session:
+            api_key_hash = session.query(ApiKey.hash_key).filter(ApiKey.source == MCP_API_KEY_SOURCE).limit(1).scalar()
+        if not api_key_hash:
+            raise ApiKeyNotFound
+        in_memory_api_key_cache.set_cache(_MCP_API_KEY_CACHE_KEY, api_key_hash)
+        return api_key_hash
+
+    @classmethod
+    async def _get_mcp_api_key_hash_async(cls) -> str:
+        # A cache hit returns directly; a miss runs the query in a thread so the event loop is not blocked
+        api_key_hash = in_memory_api_key_cache.get_cache(_MCP_API_KEY_CACHE_KEY)
+        return api_key_hash or await anyio.to_thread.run_sync(cls.get_mcp_api_key_hash)
+
     @classmethod
     async def handle_web_memo(cls, data: dict[str, str]):
         """
@@ -23,14 +60,7 @@ class WebMemoService:
         url = data.get("url")
         ua = data.get("ua")
 
-        # Extract hash_key before session closes
-        api_key_hash: str
-        with get_db() as session:
-            api_key: Optional[ApiKey] = session.query(ApiKey).filter(ApiKey.source == "aduib_mcp_server").first()
-            if not api_key:
-                raise ApiKeyNotFound
-            # Store hash_key value before session closes to avoid detached instance error
-            api_key_hash = api_key.hash_key
+        api_key_hash = await cls._get_mcp_api_key_hash_async()
 
         try:
             from configs import config
@@ -55,50 +85,66 @@ class WebMemoService:
         :param ua: User agent string.
         :return: None
         """
-        with get_db() as session:
-            api_key: Optional[ApiKey] = session.query(ApiKey).filter(ApiKey.source == "aduib_mcp_server").first()
-            if not api_key or api_key.hash_key != api_hash_key:
-                raise ApiKeyNotFound
-
-            status = body.get("success", False)
-            if not status:
-                logger.warning("Web memo crawl failed or no results")
-                return
-            result = body.get("results", [])
-
-            for item in result:
-                url = item.get("url", "")
-                crawl_text = item.get("crawl_text", "")
-                hit_rule = item.get("hit_rule", "")
+        if await cls._get_mcp_api_key_hash_async() != api_hash_key:
+            raise ApiKeyNotFound
+
+        status = body.get("success", False)
+        if not status:
+            logger.warning("Web memo crawl failed or no results")
+            return
+        # The screenshot upload and the insert are blocking IO, so they run in a thread
+        await anyio.to_thread.run_sync(cls._save_crawl_results, body.get("results", []), ua)
+
+    @classmethod
+    def _save_crawl_results(cls, result: list[dict[str, Any]], ua: str) -> None:
+        """
+        Save crawl results as browser history and emit RAG events for markdown content.
+        :param result: crawl results from the crawl service
+        :param ua: User agent string.
+        """
+        histories: list[BrowserHistory] = []
+        markdown_texts: list[str] = []
+        for item in result:
+            url = item.get("url", "")
+            crawl_text = item.get("crawl_text", "")
+            hit_rule = item.get("hit_rule", "")
+            crawl_type = item.get("crawl_type", "")
+            logger.info(f"Web memo crawl result: url={url}, hit_rule={hit_rule}, length={len(crawl_text)}")
+            if crawl_text != "\n" and crawl_text != "[]":
+                crawl_text = crawl_text.strip()
                 crawl_type = item.get("crawl_type", "")
-                logger.info(f"Web memo crawl result: url={url}, hit_rule={hit_rule}, length={len(crawl_text)}")
-                if crawl_text != "\n" and crawl_text != "[]":
-                    crawl_text = crawl_text.strip()
-                    crawl_type = item.get("crawl_type", "")
-                    crawl_media = item.get("crawl_media", {})
-                    screenshot_png = ""
-                    if item.get("screenshot", "") != "":
-                        screenshot_png = "/his_screenshot/" + random_uuid() + ".png"
-                        FileService.upload_base64(screenshot_png, item.get("screenshot", ""))
-                    metadata = item.get("metadata", {})
-
-                    history = BrowserHistory(url=url, ua=ua)
-                    history.crawl_status = True
-                    history.crawl_time = datetime.datetime.now()
-                    history.crawl_screenshot = screenshot_png
-                    history.crawl_content = crawl_text
-                    history.crawl_type = crawl_type
-                    history.crawl_media = json.dumps(crawl_media).encode("utf-8").decode("unicode-escape")
-                    history.crawl_metadata = json.dumps(metadata).encode("utf-8").decode("unicode-escape")
-                    session.add(history)
-                    session.commit()
-                    if crawl_type == "markdown":
-                        # from service import KnowledgeBaseService
-                        # await KnowledgeBaseService.paragraph_rag_from_web_memo(crawl_text,crawl_type)
-
-                        from event.event_manager import event_manager_context
-
-                        event_manager = event_manager_context.get()
-                        event_manager.emit(
-                            event="paragraph_rag_from_web_memo", crawl_text=crawl_text, crawl_type=crawl_type
-                        )
+                crawl_media = item.get("crawl_media", {})
+                screenshot_png = ""
+                if item.get("screenshot", "") != "":
+                    screenshot_png = "/his_screenshot/" + random_uuid() + ".png"
+                    FileService.upload_base64(screenshot_png, item.get("screenshot", ""))
+                metadata = item.get("metadata", {})
+
+                history = BrowserHistory(url=url, ua=ua)
+                history.crawl_status = True
+                history.crawl_time = datetime.datetime.now()
+                history.crawl_screenshot = screenshot_png
+                history.crawl_content = crawl_text
+                history.crawl_type = crawl_type
+                history.crawl_media = json.dumps(crawl_media).encode("utf-8").decode("unicode-escape")
+                history.crawl_metadata = json.dumps(metadata).encode("utf-8").decode("unicode-escape")
+                histories.append(history)
+                if crawl_type == "markdown":
+                    markdown_texts.append(crawl_text)
+        if not histories:
+            return
+
+        # All records of one callback are written in a single transaction instead of one commit each
+        with get_db() as session:
+            session.add_all(histories)
+            session.commit()
+
+        if markdown_texts:
+            # from service import KnowledgeBaseService
+            # await KnowledgeBaseService.paragraph_rag_from_web_memo(crawl_text,crawl_type)
+
+            from event.event_manager import event_manager_context
+
+            event_manager = event_manager_context.get()
+            for crawl_text in markdown_texts:
+                event_manager.emit(event="paragraph_rag_from_web_memo", crawl_text=crawl_text, crawl_type="markdown")
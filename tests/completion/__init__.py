@@ -5,20 +5,32 @@ from app import app
 
 client = TestClient(app)
 
+_MODEL = "modelscope.cn/unsloth/Qwen3-30B-A3B-GGUF:latest"
+_HEADERS = {"X-API-Key": "$2b$12$ynT6V44Pz9kwSq6nwgbqxOdTPl/GGpc2YkRaJkHn0ps5kvQo6uyF6"}
+_CHAT_PAYLOAD = {
+    "model": _MODEL,
+    "messages": [{"role": "user", "content": "1+1=？"}],
+    "temperature": 1,
+    "top_p": 1,
+    "stream": "false",
+    "stream_options": {"include_usage": "false"},
+    "enable_thinking": "false",
+}
+_COMPLETION_PAYLOAD = {
+    "model": _MODEL,
+    "prompt": "1+1=？",
+    "temperature": 1,
+    "top_p": 1,
+    "stream": "false",
+    "stream_options": {"include_usage": "false"},
+}
+
 
 def test_chat_completion_no_stream():
     response = client.post(
         "/v1/chat/completions",
-        json={
-            "model": "modelscope.cn/unsloth/Qwen3-30B-A3B-GGUF:latest",
-            "messages": [{"role": "user", "content": "1+1=？"}],
-            "temperature": 1,
-            "top_p": 1,
-            "stream": "false",
-            "stream_options": {"include_usage": "false"},
-            "enable_thinking": "false",
-        },
-        headers={"X-API-Key": "$2b$12$ynT6V44Pz9kwSq6nwgbqxOdTPl/GGpc2YkRaJkHn0ps5kvQo6uyF6"},
+        json=_CHAT_PAYLOAD,
+        headers=_HEADERS,
     )
     assert response.status_code == 200
     data = response.json()
@@ -28,16 +40,8 @@ def test_chat_completion_no_stream():
 def test_chat_completion_stream():
     response = client.post(
         "/v1/chat/completions",
-        json={
-            "model": "modelscope.cn/unsloth/Qwen3-30B-A3B-GGUF:latest",
-            "messages": [{"role": "user", "content": "1+1=？"}],
-            "temperature": 1,
-            "top_p": 1,
-            "stream": "true",
-            "stream_options": {"include_usage": "false"},
-            "enable_thinking": "false",
-        },
-        headers={"X-API-Key": "$2b$12$ynT6V44Pz9kwSq6nwgbqxOdTPl/GGpc2YkRaJkHn0ps5kvQo6uyF6"},
+        json=_CHAT_PAYLOAD | {"stream": "true"},
+        headers=_HEADERS,
     )
     assert response.status_code == 200
     print(response.text)
@@ -46,15 +50,8 @@ def test_chat_completion_stream():
 def test_completion_no_stream():
     response = client.post(
         "/v1/completions",
-        json={
-            "model": "modelscope.cn/unsloth/Qwen3-30B-A3B-GGUF:latest",
-            "prompt": "1+1=？",
-            "temperature": 1,
-            "top_p": 1,
-            "stream": "false",
-            "stream_options": {"include_usage": "false"},
-        },
-        headers={"X-API-Key": "$2b$12$ynT6V44Pz9kwSq6nwgbqxOdTPl/GGpc2YkRaJkHn0ps5kvQo6uyF6"},
+        json=_COMPLETION_PAYLOAD,
+        headers=_HEADERS,
     )
     assert response.status_code == 200
     data = response.json()
@@ -64,15 +61,8 @@ def test_completion_no_stream():
 def test_completion_stream():
     response = client.post(
         "/v1/completions",
-        json={
-            "model": "modelscope.cn/unsloth/Qwen3-30B-A3B-GGUF:latest",
-            "prompt": "1+1=？",
-            "temperature": 1,
-            "top_p": 1,
-            "stream": "true",
-            "stream_options": {"include_usage": "true"},
-        },
-        headers={"X-API-Key": "$2b$12$ynT6V44Pz9kwSq6nwgbqxOdTPl/GGpc2YkRaJkHn0ps5kvQo6uyF6"},
+        json=_COMPLETION_PAYLOAD | {"stream": "true", "stream_options": {"include_usage": "true"}},
+        headers=_HEADERS,
     )
     assert response.status_code == 200
     data = response.text
@@ -83,7 +73,7 @@ def test_completion_json_object():
     response = client.post(
         "/v1/chat/completions",
         json={
-            "model": "modelscope.cn/unsloth/Qwen3-30B-A3B-GGUF:latest",
+            "model": _MODEL,
             "messages": [
                 {"role": "system", "content": "你是一个助手，请始终输出结构化 JSON 数据。"},
                 {"role": "user", "content": "生成一个用户信息对象，包含姓名、年龄和技能。"},
@@ -101,7 +91,7 @@ def test_completion_json_object():
                 # }
             },
         },
-        headers={"X-API-Key": "$2b$12$ynT6V44Pz9kwSq6nwgbqxOdTPl/GGpc2YkRaJkHn0ps5kvQo6uyF6"},
+        headers=_HEADERS,
     )
     assert response.status_code == 200
     data = response.json()
@@ -112,7 +102,7 @@ def test_completion_json_schema():
     response = client.post(
         "/v1/chat/completions",
         json={
-            "model": "modelscope.cn/unsloth/Qwen3-30B-A3B-GGUF:latest",
+            "model": _MODEL,
             "messages": [
                 {"role": "system", "content": "你是一个助手，请始终输出结构化 JSON 数据。"},
                 {"role": "user", "content": "生成一个用户信息对象，包含姓名、年龄和技能。"},
@@ -138,7 +128,7 @@ def test_completion_json_schema():
                 },
             },
         },
-        headers={"X-API-Key": "$2b$12$ynT6V44Pz9kwSq6nwgbqxOdTPl/GGpc2YkRaJkHn0ps5kvQo6uyF6"},
+        headers=_HEADERS,
     )
     assert response.status_code == 200
     data = response.json()
@@ -149,7 +139,7 @@ def test_completion_tool_call():
     response = client.post(
         "/v1/chat/completions",
         json={
-            "model": "modelscope.cn/unsloth/Qwen3-30B-A3B-GGUF:latest",
+            "model": _MODEL,
             "messages": [
                 {"role": "user", "content": "What is the weather like in Boston today? and what time is it there?"}
             ],
@@ -212,5 +202,5 @@ def test_rerank_ollama():
             "query": "苹果手机",
             "documents": ["苹果手机怎么样？", "三星手机怎么样？", "小米手机怎么样？"],
         },
-        headers={"X-API-Key": "$2b$12$ynT6V44Pz9kwSq6nwgbqxOdTPl/GGpc2YkRaJkHn0ps5kvQo6uyF6"},
+        headers=_HEADERS,
     )
@@ -0,0 +1,79 @@
+import importlib.util
+import sys
+import types
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from models.api_key import ApiKey
+from models.auth_user import User
+
+_SERVICE_DIR = Path(__file__).resolve().parents[1] / "service"
+
+
+@pytest.fixture
+def api_key_service():
+    # Load service/api_key_service.py without service/__init__.py, which connects to the storage backend.
+    loaded = set(sys.modules)
+    previous = sys.modules.get("service")
+    package = types.ModuleType("service")
+    package.__path__ = [str(_SERVICE_DIR)]
+    sys.modules["service"] = package
+    spec = importlib.util.spec_from_file_location("service.api_key_service", _SERVICE_DIR / "api_key_service.py")
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        for name in set(sys.modules) - loaded:
+            del sys.modules[name]
+        if previous is not None:
+            sys.modules["service"] = previous
+
+
+@pytest.fixture
+def engine(monkeypatch, api_key_service):
+    engine = create_engine("sqlite://")
+    User.__table__.create(engine)
+    ApiKey.__table__.create(engine)
+    with Session(engine) as session:
+        user = User(username="alice", password_hash="x", user_type="admin")
+        session.add(user)
+        session.flush()
+        session.add(ApiKey(name="k", api_key="raw", hash_key="hash-alice", salt="s", user_id=user.id))
+        session.add(ApiKey(name="unbound", api_key="raw-2", hash_key="hash-unbound", salt="s"))
+        session.commit()
+
+    @contextmanager
+    def _get_db():
+        with Session(engine) as session:
+            yield session
+
+    monkeypatch.setattr(api_key_service, "get_db", _get_db)
+    return engine
+
+
+def test_validate_api_key_returns_the_bound_user(engine, api_key_service):
+    assert api_key_service.ApiKeyService.validate_api_key("hash-alice") == {
+        "user_id": "1",
+        "username": "alice",
+        "user_type": "admin",
+    }
+
+
+@pytest.mark.parametrize("hash_key", ["hash-unknown", "hash-unbound"])
+def test_validate_api_key_rejects_unknown_and_unbound_keys(engine, api_key_service, hash_key):
+    with pytest.raises(api_key_service.ApiKeyNotFound):
+        api_key_service.ApiKeyService.validate_api_key(hash_key)
+
+
+def test_validate_api_key_rejects_key_of_deleted_user(engine, api_key_service):
+    with Session(engine) as session:
+        session.query(User).delete()
+        session.commit()
+
+    with pytest.raises(api_key_service.ApiKeyNotFound):
+        api_key_service.ApiKeyService.validate_api_key("hash-alice")
@@ -0,0 +1,81 @@
+import importlib.util
+import sys
+import types
+from contextlib import contextmanager
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from controllers.params import CreateModelRequest
+from models import Provider
+from models.model import Model
+
+_SERVICE_DIR = Path(__file__).resolve().parents[1] / "service"
+
+
+@pytest.fixture
+def model_service():
+    # Load service/model_service.py without service/__init__.py, which connects to the storage backend.
+    loaded = set(sys.modules)
+    previous = sys.modules.get("service")
+    package = types.ModuleType("service")
+    package.__path__ = [str(_SERVICE_DIR)]
+    sys.modules["service"] = package
+    spec = importlib.util.spec_from_file_location("service.model_service", _SERVICE_DIR / "model_service.py")
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        for name in set(sys.modules) - loaded:
+            del sys.modules[name]
+        if previous is not None:
+            sys.modules["service"] = previous
+
+
+@pytest.fixture
+def engine(monkeypatch, model_service):
+    engine = create_engine("sqlite://")
+    Provider.__table__.create(engine)
+    Model.__table__.create(engine)
+    with Session(engine) as session:
+        session.add(Provider(name="openai", support_model_type="[]", provider_type="openai", provider_config="{}"))
+        session.commit()
+
+    @contextmanager
+    def _get_db():
+        with Session(engine, expire_on_commit=False) as session:
+            yield session
+
+    monkeypatch.setattr(model_service, "get_db", _get_db)
+    return engine
+
+
+def _request(name: str) -> CreateModelRequest:
+    return CreateModelRequest(
+        model_name=name,
+        provider_name="openai",
+        model_type="llm",
+        max_tokens=1024,
+        input_price=None,
+        output_price=None,
+    )
+
+
+def test_create_model_without_prices_reads_back_zero(engine, model_service):
+    model_service.ModelService.create_model(_request("gpt-a"))
+
+    with Session(engine) as session:
+        model = session.query(Model).filter_by(name="gpt-a").one()
+    assert (model.input_price, model.output_price) == (Decimal(0), Decimal(0))
+
+
+def test_create_models_without_prices_reads_back_zero(engine, model_service):
+    model_service.ModelService.create_models([_request("gpt-b"), _request("gpt-c")])
+
+    with Session(engine) as session:
+        prices = session.query(Model.input_price, Model.output_price).order_by(Model.name).all()
+    assert prices == [(Decimal(0), Decimal(0))] * 2
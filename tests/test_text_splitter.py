@@ -0,0 +1,47 @@
+import pytest
+import tiktoken
+
+from runtime.entities.document_entities import Document
+from runtime.rag.splitter.text_splitter import FixedRecursiveTextSplitter, RecursiveTextSplitter
+
+
+@pytest.fixture(autouse=True)
+def _offline_encoding(monkeypatch) -> None:
+    """Byte-level BPE so the splitter can run without downloading cl100k_base."""
+    encoding = tiktoken.Encoding(
+        name="byte_level",
+        pat_str=r"\S+|\s+",
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={},
+    )
+    monkeypatch.setattr(tiktoken, "get_encoding", lambda _name: encoding)
+
+
+def test_recursive_splitter_accepts_processor_kwargs() -> None:
+    splitter = RecursiveTextSplitter(chunk_size=100, chunk_overlap=10, separator="\n")
+
+    chunks = splitter.split_documents([Document(content="a " * 5000, metadata={"doc_id": "doc-1"})])
+
+    assert chunks
+    assert all(chunk.metadata == {"doc_id": "doc-1"} for chunk in chunks)
+
+
+def test_fixed_splitter_splits_long_document() -> None:
+    splitter = FixedRecursiveTextSplitter(chunk_size=100, chunk_overlap=10, fixed_separator="\n\n, ")
+
+    chunks = splitter.split_documents([Document(content="a " * 5000)])
+
+    assert len(chunks) > 1
+    assert all(len(chunk.content) <= 100 for chunk in chunks)
+
+
+def test_recursive_splitter_measures_all_documents_in_one_batch() -> None:
+    splitter = RecursiveTextSplitter(chunk_size=100, chunk_overlap=10)
+    batches: list[list[str]] = []
+    measure = splitter._length_function
+    splitter._length_function = lambda texts: batches.append(texts) or measure(texts)
+
+    chunks = splitter.split_documents([Document(content=f"doc {i}. short text") for i in range(5)])
+
+    assert [chunk.content for chunk in chunks] == [f"doc {i}. short text" for i in range(5)]
+    assert len(batches) == 1
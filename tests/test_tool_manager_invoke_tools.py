@@ -0,0 +1,227 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from runtime.tool.entities import ToolInvokeResult, ToolProviderType
+from runtime.tool.tool_manager import ToolManager
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class _FakeController:
+    def __init__(self, tools):
+        self.tools = {tool.entity.name: tool for tool in tools}
+
+    def get_tool(self, tool_name):
+        return self.tools.get(tool_name)
+
+
+def _tool(name: str, parallel_safe: bool = True):
+    return SimpleNamespace(entity=SimpleNamespace(name=name), parallel_safe=parallel_safe)
+
+
+def _build_manager(monkeypatch, tools, max_concurrency: int = 8):
+    from configs import config
+
+    monkeypatch.setattr(config, "TOOL_MAX_CONCURRENCY", max_concurrency, raising=False)
+    manager = ToolManager.__new__(ToolManager)
+    manager.providers = {ToolProviderType.BUILTIN: _FakeController(tools)}
+    return manager
+
+
+@pytest.mark.anyio
+async def test_invoke_tools_keeps_call_order_and_bounds_concurrency(monkeypatch):
+    manager = _build_manager(monkeypatch, [_tool("slow"), _tool("fast")], max_concurrency=2)
+    running = 0
+    peak = 0
+
+    async def fake_run_tool(tool_name, tool_arguments, tool_provider, tool_call_id=None, message_id=None):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02 if tool_name == "slow" else 0)
+        running -= 1
+        return ToolInvokeResult(name=tool_name, data=tool_call_id, tool_call_id=tool_call_id), tool_call_id
+
+    saved: list[list[str]] = []
+    monkeypatch.setattr(manager, "_run_tool", fake_run_tool)
+    monkeypatch.setattr(manager, "_save_tool_call_results_in_background", saved.append)
+
+    calls = [
+        {"tool_name": name, "tool_arguments": {"n": index}, "tool_provider": "builtin", "tool_call_id": str(index)}
+        for index, name in enumerate(["slow", "fast", "slow", "fast"])
+    ]
+    results = await manager.invoke_tools(calls)
+
+    assert [result.tool_call_id for result in results] == ["0", "1", "2", "3"]
+    assert peak == 2
+    assert saved == [["0", "1", "2", "3"]]
+
+
+@pytest.mark.anyio
+async def test_invoke_tools_runs_unsafe_tools_one_at_a_time(monkeypatch):
+    manager = _build_manager(monkeypatch, [_tool("write", parallel_safe=False), _tool("read")])
+    running_writes = 0
+    order: list[str] = []
+
+    async def fake_run_tool(tool_name, tool_arguments, tool_provider, tool_call_id=None, message_id=None):
+        nonlocal running_writes
+        if tool_name == "write":
+            running_writes += 1
+            assert running_writes == 1
+            await asyncio.sleep(0.01)
+            running_writes -= 1
+            order.append(tool_call_id)
+        return ToolInvokeResult(name=tool_name, tool_call_id=tool_call_id), None
+
+    monkeypatch.setattr(manager, "_run_tool", fake_run_tool)
+
+    calls = [
+        {"tool_name": name, "tool_arguments": {}, "tool_provider": "builtin", "tool_call_id": str(index)}
+        for index, name in enumerate(["write", "read", "write", "write"])
+    ]
+    results = await manager.invoke_tools(calls)
+
+    assert [result.tool_call_id for result in results] == ["0", "1", "2", "3"]
+    assert order == ["0", "2", "3"]
+
+
+@pytest.mark.anyio
+async def test_invoke_tools_reads_after_a_write_see_its_effect(monkeypatch):
+    manager = _build_manager(monkeypatch, [_tool("write", parallel_safe=False), _tool("read")])
+    store = {"a": "old"}
+    invoked: list[str] = []
+
+    async def fake_run_tool(tool_name, tool_arguments, tool_provider, tool_call_id=None, message_id=None):
+        invoked.append(tool_call_id)
+        if tool_name == "write":
+            await asyncio.sleep(0.01)
+            store["a"] = "new"
+        return ToolInvokeResult(name=tool_name, data=store["a"], tool_call_id=tool_call_id), None
+
+    monkeypatch.setattr(manager, "_run_tool", fake_run_tool)
+
+    calls = [
+        {"tool_name": name, "tool_arguments": {"key": "a"}, "tool_provider": "builtin", "tool_call_id": str(index)}
+        for index, name in enumerate(["read", "write", "read"])
+    ]
+    results = await manager.invoke_tools(calls)
+
+    assert invoked == ["0", "1", "2"]
+    assert [result.data for result in results] == ["old", "new", "new"]
+
+
+@pytest.mark.anyio
+async def test_invoke_tools_runs_identical_calls_once(monkeypatch):
+    from models import ToolCallResult
+
+    manager = _build_manager(monkeypatch, [_tool("search")])
+    invoked: list[str] = []
+
+    async def fake_run_tool(tool_name, tool_arguments, tool_provider, tool_call_id=None, message_id=None):
+        invoked.append(tool_call_id)
+        record = ToolCallResult(tool_call_id=tool_call_id, tool_call_name=tool_name, state="success")
+        return ToolInvokeResult(name=tool_name, data={"q": tool_arguments["q"]}, tool_call_id=tool_call_id), record
+
+    saved: list[list[ToolCallResult]] = []
+    monkeypatch.setattr(manager, "_run_tool", fake_run_tool)
+    monkeypatch.setattr(manager, "_save_tool_call_results_in_background", saved.append)
+
+    calls = [
+        {"tool_name": "search", "tool_arguments": {"q": q}, "tool_provider": "builtin", "tool_call_id": str(index)}
+        for index, q in enumerate(["a", "b", "a"])
+    ]
+    results = await manager.invoke_tools(calls)
+
+    assert invoked == ["0", "1"]
+    assert [(result.tool_call_id, result.data) for result in results] == [
+        ("0", {"q": "a"}),
+        ("1", {"q": "b"}),
+        ("2", {"q": "a"}),
+    ]
+    assert [record.tool_call_id for record in saved[0]] == ["0", "1", "2"]
+
+
+@pytest.fixture
+def fresh_tool_manager(monkeypatch):
+    from configs import config
+    from runtime.tool import tool_manager
+
+    state = {"version": "1", "builds": 0}
+
+    def _fake_init(self):
+        state["builds"] += 1
+        self.providers = {}
+
+    monkeypatch.setattr(ToolManager, "__init__", _fake_init)
+    monkeypatch.setattr(tool_manager, "_get_tool_manager_version", lambda: state["version"])
+    monkeypatch.setattr(
+        tool_manager, "_bump_tool_manager_version", lambda: state.update(version=str(int(state["version"]) + 1))
+    )
+    monkeypatch.setattr(config, "TOOL_MANAGER_VERSION_CHECK_INTERVAL", 0, raising=False)
+    monkeypatch.setattr(config, "TOOL_MANAGER_TTL", 300, raising=False)
+    monkeypatch.setattr(ToolManager, "_instance", None)
+    return state
+
+
+def test_get_instance_rebuilds_when_another_process_bumps_the_version(fresh_tool_manager):
+    first = ToolManager.get_instance()
+    assert ToolManager.get_instance() is first
+
+    # Another process registered MCP tools.
+    fresh_tool_manager["version"] = "2"
+
+    assert ToolManager.get_instance() is not first
+    assert fresh_tool_manager["builds"] == 2
+
+
+def test_get_instance_rebuilds_after_ttl_and_invalidate(fresh_tool_manager, monkeypatch):
+    from configs import config
+
+    first = ToolManager.get_instance()
+    ToolManager.invalidate()
+    second = ToolManager.get_instance()
+    assert second is not first
+
+    monkeypatch.setattr(config, "TOOL_MANAGER_TTL", 0, raising=False)
+    assert ToolManager.get_instance() is not second
+    assert fresh_tool_manager["builds"] == 3
+
+
+def test_get_instance_serves_the_current_instance_while_rebuilding(fresh_tool_manager, monkeypatch):
+    import threading
+
+    from runtime.tool import tool_manager
+
+    first = ToolManager.get_instance()
+    release = threading.Event()
+    building = threading.Event()
+
+    def _slow_init(self):
+        building.set()
+        release.wait(timeout=5)
+        self.providers = {}
+
+    def _read_version():
+        assert not ToolManager._instance_lock.locked()
+        return fresh_tool_manager["version"]
+
+    monkeypatch.setattr(ToolManager, "__init__", _slow_init)
+    monkeypatch.setattr(tool_manager, "_get_tool_manager_version", _read_version)
+    fresh_tool_manager["version"] = "2"
+
+    rebuilt: list[ToolManager] = []
+    worker = threading.Thread(target=lambda: rebuilt.append(ToolManager.get_instance()))
+    worker.start()
+    assert building.wait(timeout=5)
+
+    assert ToolManager.get_instance() is first
+
+    release.set()
+    worker.join(timeout=5)
+    assert rebuilt[0] is not first
+    assert ToolManager.get_instance() is rebuilt[0]
@@ -0,0 +1,48 @@
+import pytest
+
+pytest.importorskip("torch")
+
+from runtime.transformation.transformers.transformers_manager import TaskReq, TaskResp, ZMQWorker
+
+
+class _FailingLoader:
+    worker_id = "model-a"
+
+    def transform_batch(self, requests: list[TaskReq]) -> list[TaskResp]:
+        raise RuntimeError("out of memory")
+
+
+class _EchoLoader:
+    worker_id = "model-a"
+
+    def transform_batch(self, requests: list[TaskReq]) -> list[TaskResp]:
+        return [TaskResp(worker_id=self.worker_id, data=request.data, success=True) for request in requests]
+
+
+def _worker(loader) -> ZMQWorker:
+    worker = ZMQWorker(loader)
+    worker._ready = True
+    return worker
+
+
+def test_failed_batch_answers_every_request_with_its_own_id():
+    worker = _worker(_FailingLoader())
+    task_reqs = [TaskReq(worker_id="model-a", request_id=str(index), data={"texts": ["x"]}) for index in range(3)]
+
+    responses = worker._process_tasks(task_reqs)
+
+    assert [response.request_id for response in responses] == ["0", "1", "2"]
+    assert len({id(response) for response in responses}) == 3
+    assert all(not response.success and response.data == {"error": "out of memory"} for response in responses)
+
+
+def test_batch_keeps_request_ids_next_to_rejected_tasks():
+    worker = _worker(_EchoLoader())
+    task_reqs = [
+        TaskReq(worker_id="model-a", request_id="ok", data={"texts": ["x"]}),
+        TaskReq(worker_id="model-b", request_id="mismatch", data={"texts": ["y"]}),
+    ]
+
+    responses = worker._process_tasks(task_reqs)
+
+    assert [(response.request_id, response.success) for response in responses] == [("ok", True), ("mismatch", False)]
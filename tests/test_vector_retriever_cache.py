@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+import pytest
+
+from libs.cache import in_memory_model_cache
+from runtime.rag.retrieve import vector_retriever
+from runtime.rag.retrieve.vector_retriever import KnowledgeVectorRetriever
+
+
+@pytest.fixture
+def built(monkeypatch):
+    built = []
+
+    def _fake_init(self, knowledge):
+        self._knowledge = knowledge
+        built.append(knowledge)
+
+    monkeypatch.setattr(KnowledgeVectorRetriever, "__init__", _fake_init)
+    in_memory_model_cache.flush_cache()
+    yield built
+    in_memory_model_cache.flush_cache()
+
+
+def _knowledge(kb_id: str = "kb-1"):
+    return SimpleNamespace(id=kb_id, rag_type="paragraph", embedding_model_provider="ollama", embedding_model="m")
+
+
+def test_retriever_is_shared_and_build_lock_released(built):
+    kb = _knowledge()
+
+    first = KnowledgeVectorRetriever.for_knowledge(kb)
+    second = KnowledgeVectorRetriever.for_knowledge(kb)
+
+    assert first is second
+    assert len(built) == 1
+    assert KnowledgeVectorRetriever._build_locks == {}
+
+
+def test_knowledge_base_write_drops_cached_retriever(built):
+    stale = KnowledgeVectorRetriever.for_knowledge(_knowledge())
+    other = KnowledgeVectorRetriever.for_knowledge(_knowledge("kb-2"))
+
+    # What the ORM after_update / after_delete listener does
+    vector_retriever._invalidate_vector_retriever(None, None, _knowledge())
+
+    assert KnowledgeVectorRetriever.for_knowledge(_knowledge()) is not stale
+    assert KnowledgeVectorRetriever.for_knowledge(_knowledge("kb-2")) is other
+    assert len(built) == 3
+
+
+def test_model_cache_flush_drops_cached_retriever(built):
+    stale = KnowledgeVectorRetriever.for_knowledge(_knowledge())
+
+    in_memory_model_cache.flush_cache()
+
+    assert KnowledgeVectorRetriever.for_knowledge(_knowledge()) is not stale
+
+
+def test_build_overlapping_invalidation_is_not_cached(built, monkeypatch):
+    def _init_then_invalidate(self, knowledge):
+        built.append(knowledge)
+        # The knowledge base is updated while this retriever is being built from the old row.
+        KnowledgeVectorRetriever.invalidate(str(knowledge.id))
+
+    monkeypatch.setattr(KnowledgeVectorRetriever, "__init__", _init_then_invalidate)
+    stale = KnowledgeVectorRetriever.for_knowledge(_knowledge())
+
+    assert in_memory_model_cache.get_cache(KnowledgeVectorRetriever._cache_key("kb-1")) is None
+    assert KnowledgeVectorRetriever._build_locks == {}
+    assert KnowledgeVectorRetriever.for_knowledge(_knowledge()) is not stale
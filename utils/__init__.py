@@ -10,10 +10,12 @@ from .module_import_helper import (
 )
 from .net import get_local_ip
 from .rate_limit import RateLimit
+from .sse import SSE_DONE, sse_data
 from .uuid import generate_string, message_uuid, random_uuid, trace_uuid
 from .yaml_utils import load_yaml_file, load_yaml_files
 
 __all__ = [
+    "SSE_DONE",
     "RateLimit",
     "generate_api_key",
     "generate_string",
@@ -30,6 +32,7 @@ __all__ = [
     "now_local",
     "random_uuid",
     "run_async",
+    "sse_data",
     "trace_uuid",
     "verify_api_key",
 ]
@@ -92,6 +92,8 @@ class RateLimit:
         return str(uuid.uuid4())
 
     def generate(self, generator: Union[Generator[str, None, None], Mapping[str, Any]], request_id: str):
+        if request_id == RateLimit._UNLIMITED_REQUEST_ID:
+            return generator
         if isinstance(generator, Generator):
             return RateLimitGenerator(rate_limit=self, generator=generator, request_id=request_id)
         else:
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+SSE_DONE = b"data: [DONE]\n\n"
+
+
+def sse_data(chunk: BaseModel, event: str | None = None) -> bytes:
+    """Encode a model as one SSE message, serialized straight to bytes to skip a str round trip"""
+    data = b"data: " + chunk.__pydantic_serializer__.to_json(chunk, exclude_none=True) + b"\n\n"
+    if event is None:
+        return data
+    return b"event: " + event.encode() + b"\n\n" + data